@@ -1,9 +1,19 @@
 # Death_kill.py
 
+from typing import Callable, Optional
 from kill_event_formatter import DeathEventFormatter
 
 
-def format_death_kill(log_line: str, data: dict, registered_user: str, timestamp: str, last_game_mode: str) -> str:
+def format_death_kill(
+    log_line: str,
+    data: dict,
+    registered_user: str,
+    timestamp: str,
+    last_game_mode: str,
+    on_enriched: Optional[Callable[[str, str], None]] = None,
+    cached_only: bool = False,
+    card_id: Optional[str] = None
+) -> str:
     """
     Format a death event using the new formatter system.
     
@@ -13,6 +23,10 @@ def format_death_kill(log_line: str, data: dict, registered_user: str, timestamp
         registered_user: Name of the registered user
         timestamp: Event timestamp
         last_game_mode: Last known game mode
+        on_enriched: If given, render immediately with cached/placeholder profile data
+            and call on_enriched(card_id, readout) once the profile has been fetched
+        cached_only: Render from cached profile data only, without fetching anything
+        card_id: DOM id to keep on a re-rendered card (used with cached_only)
         
     Returns:
         HTML readout string
@@ -23,5 +37,8 @@ def format_death_kill(log_line: str, data: dict, registered_user: str, timestamp
         data=data,
         registered_user=registered_user,
         timestamp=timestamp,
-        last_game_mode=last_game_mode
+        last_game_mode=last_game_mode,
+        on_enriched=on_enriched,
+        cached_only=cached_only,
+        card_id=card_id
     )
\ No newline at end of file
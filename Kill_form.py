@@ -18,9 +18,7 @@ import glob
 from kill_parser import VERSION
 from datetime import datetime
 from packaging import version
-from bs4 import BeautifulSoup
-from urllib.parse import quote
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from utlity import apply_styles as apply_styles_func
 from Registered_kill import format_registered_kill
@@ -31,14 +29,14 @@ from PyQt5.QtWidgets import (
     QSlider, QFormLayout, QLabel, QComboBox, QDialog, QSizePolicy, QProgressDialog,
     QSystemTrayIcon, QMenu, QAction, QFrame, QGraphicsOpacityEffect, QScrollArea
 )
-from PyQt5.QtGui import QIcon, QDesktopServices, QPixmap, QPainter, QBrush, QPen, QColor, QPainterPath, QImage
+from PyQt5.QtGui import QIcon, QDesktopServices, QPixmap, QPainter, QBrush, QPen, QColor, QPainterPath
 from PyQt5.QtCore import (
-    Qt, QUrl, QTimer, QStandardPaths, QDir, QSize, QRect, QPropertyAnimation, QEasingCurve, QEvent
+    Qt, QUrl, QTimer, QStandardPaths, QDir, QSize, QRect, QPropertyAnimation, QEasingCurve, QEvent, pyqtSignal
 )
 from PyQt5.QtMultimedia import QSoundEffect, QMediaPlayer, QMediaContent
 
-from Kill_thread import ApiSenderThread, TailThread, RescanThread, MissingKillsDialog
-from kill_parser import KILL_LOG_PATTERN, CHROME_USER_AGENT, DESKTOP_CLIENT_USER_AGENT
+from Kill_thread import TailThread, RescanThread, MissingKillsDialog
+from kill_parser import KILL_LOG_PATTERN, CHROME_USER_AGENT, DESKTOP_CLIENT_USER_AGENT, KillParser
 from twitch_integration import TwitchIntegration, process_twitch_callbacks
 from kill_clip import ButtonAutomation, process_button_automation_callbacks, ButtonAutomationWidget
 from responsive_ui import ScreenScaler, ResponsiveUIHelper, make_popup_responsive
@@ -47,6 +45,26 @@ from utlity import init_ui, load_config, load_local_kills, apply_styles, Collaps
 
 from language_manager import language_manager, t
 from language_selector_widget import LanguageSelector
+from player_cache import get_player_cache
+from rsi_scheduler import get_rsi_scheduler, PRIORITY_COSMETIC
+from profile_prefetcher import get_profile_prefetcher, DEFAULT_REQUESTS_PER_MINUTE
+from image_loader import get_image_loader, url_key
+from kill_outbox import get_kill_outbox
+from kill_store import KillStore
+from config_service import get_config_store, flush_config_stores
+from combat_history import get_combat_history, org_from_details, ORG_PENDING
+from kill_event_formatter import KillEventFormatter
+from profile_enricher import get_profile_enricher
+from kill_records import RenderedCardCache, new_kill_record, record_event_type, render_readout, add_clip_link
+from kill_backfill import KillBackfill
+from api_client import get_api_client
+from api_pool import get_api_pool
+from api_throttle import get_api_throttle
+from api_diagnostics import ApiDiagnostics, ApiDiagnosticsDialog, probe_tcp, timed_get, format_timings
+from connectivity import (
+    get_connectivity_cache, tcp_probe, API_PING_TTL_SECONDS, API_PING_FAILURE_TTL_SECONDS, UPDATE_CHECK_TTL_SECONDS
+)
+from fetch import DEFAULT_IMAGE_URL
 from translation_utils import translate_application, setup_auto_translation
 from utlity import TranslationMixin
 
@@ -120,14 +138,24 @@ logging.basicConfig(
 
 LOCAL_KILLS_FILE = os.path.join(TRACKER_DIR, "logged_kills.json")
 
+API_DIAGNOSTIC_SECTIONS = {
+    "network": "Network test",
+    "api_ping": "API ping test",
+    "api_key": "API key test",
+    "time_sync": "Time sync check",
+}
+
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": DESKTOP_CLIENT_USER_AGENT})
-PLAYER_DETAILS_CACHE: Dict[str, Dict[str, str]] = {}
 
 class KillLoggerGUI(QMainWindow, TranslationMixin):
     __client_id__ = "kill_logger_client"
     __version__ = VERSION
 
+    ssl_bypass_needed = pyqtSignal()
+    # (card_id, readout) for backfilled cards whose profile data arrived after they were shown
+    card_enriched = pyqtSignal(str, str)
+
     def __init__(self) -> None:
         super().__init__()
         self.twitch_chat_message_template = "🔫 {username} just killed {victim}! 🚀 {profile_url}"
@@ -139,12 +167,19 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         self.monitor_thread: Optional[TailThread] = None
         self.rescan_thread: Optional[RescanThread] = None
         self.missing_kills_queue: List[dict] = []
-        self.api_endpoint = "https://starcitizentool.com/api/v1/kills"
+        self.kill_backfill: Optional[KillBackfill] = None
+        self.api_capabilities: List[str] = []
+        self.api_endpoint = os.environ.get("SCTOOL_API_ENDPOINT", "https://starcitizentool.com/api/v1/kills")
         self.user_agent = DESKTOP_CLIENT_USER_AGENT
         self.local_user_name = ""
         self.local_user_geid = ""
         self.guild_name = ""
         self._guild_icon_pixmap: Optional[QPixmap] = None
+        self._guild_icon_key: Optional[str] = None
+        self._profile_image_key: Optional[str] = None
+        self.image_loader = get_image_loader()
+        self.image_loader.pixmap_ready.connect(self._on_image_loaded)
+        self.image_loader.load_failed.connect(self._on_image_load_failed)
         self.dark_mode_enabled = True
         
         _, _, self.scale_factor = ScreenScaler.get_screen_info()
@@ -166,10 +201,17 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         self.death_sound_folder = ""
         
         self.api_key = ""
+        # Mirrors send_to_api_checkbox for the outbox worker thread
+        self.send_to_api_enabled = True
         self.disable_ssl_verification = False
         self.registration_attempts = 0
         self.local_kills: Dict[str, Any] = {}
+        self.enriched_cards: Dict[str, str] = {}
+        self.rendered_cards = RenderedCardCache()
         self.kills_local_file = LOCAL_KILLS_FILE
+        self.kill_store = KillStore(legacy_json_file=self.kills_local_file)
+        self.config_store = get_config_store(CONFIG_FILE)
+        self.combat_history = get_combat_history()
         self.persistent_info = {
             "monitoring": "",
             "registered": "",
@@ -191,6 +233,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         self.show_vehicle_destroyed = True
         self.show_pilot_ejected = True
         self.show_pilot_abandoned = True
+        self.profile_prefetch_per_minute = DEFAULT_REQUESTS_PER_MINUTE
         self.twitch_enabled = False
         self.auto_connect_twitch = False
         self.twitch = TwitchIntegration()
@@ -261,6 +304,24 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         self.button_automation_callback_timer.timeout.connect(lambda: process_button_automation_callbacks(self))
         self.button_automation_callback_timer.start(250)
         
+        self.player_cache_sweep_timer = QTimer()
+        self.player_cache_sweep_timer.timeout.connect(self.sweep_player_cache)
+        self.player_cache_sweep_timer.start(10 * 60 * 1000)
+        
+        self.api_client = get_api_client()
+        self.api_client.configure(user_agent=self.user_agent)
+        self.api_pool = get_api_pool()
+        self.api_throttle = get_api_throttle()
+        self.connectivity = get_connectivity_cache()
+        self.ssl_bypass_needed.connect(self.show_ssl_bypass_option)
+        self.card_enriched.connect(self.on_card_enriched)
+        self.api_delivery_status_timer = QTimer()
+        self.api_delivery_status_timer.timeout.connect(self.update_api_delivery_status)
+        self.api_delivery_status_timer.start(1000)
+        self.kill_outbox = get_kill_outbox()
+        self.kill_outbox.delivered.connect(self._on_outbox_delivered)
+        self.kill_outbox.expired.connect(self._on_outbox_expired)
+        
         self.current_clip_group_id = ""
         self.clip_group_window_seconds = 10
         self.clip_groups: Dict[str, List[str]] = {}
@@ -276,6 +337,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         
         load_config(self)
         load_local_kills(self)
+        self.kill_outbox.start(self.outbox_headers, not getattr(self, 'disable_ssl_verification', False))
         apply_styles(self)
         self.initialize_system_tray()  
         self.rescan_button.setEnabled(False)
@@ -373,6 +435,68 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             else:
                 self.kill_display.setHtml(html_content)
 
+    def sweep_player_cache(self) -> None:
+        """Drop expired player cache entries and log the cache, RSI scheduler, API delivery and config save counters"""
+        cache = get_player_cache()
+        cache.clear_expired_entries()
+        stats = cache.get_cache_stats()
+        logging.info(
+            f"Player cache: {stats['entries']} entries, {stats['bytes']} bytes, "
+            f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions"
+        )
+        logging.info(f"RSI scheduler: {json.dumps(get_rsi_scheduler().get_stats())}")
+        logging.info(f"Kill outbox: {json.dumps(self.kill_outbox.get_stats())}")
+        logging.info(f"API delivery: {json.dumps(self.api_throttle.get_stats())}")
+        logging.info(f"Config store: {json.dumps(self.config_store.get_stats())}")
+        if hasattr(self, 'game_overlay') and self.game_overlay:
+            logging.info(f"Overlay config saves: {json.dumps(self.game_overlay.get_config_save_stats())}")
+
+    def api_headers(self) -> Optional[Dict[str, str]]:
+        """Headers for kill/death submissions, or None while no API key is set (holds the outbox)"""
+        if not self.api_key:
+            return None
+        return {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'X-API-Key': self.api_key,
+            'User-Agent': self.user_agent,
+            'X-Client-ID': self.__client_id__,
+            'X-Client-Version': self.__version__
+        }
+
+    def outbox_headers(self) -> Optional[Dict[str, str]]:
+        """api_headers() while sending to the API is enabled, else None so queued kills wait in the outbox"""
+        if not self.send_to_api_enabled:
+            return None
+        return self.api_headers()
+
+    def _on_outbox_delivered(self, local_key: str, kind: str, message: str, response_data) -> None:
+        timestamp = self.local_kills.get(local_key, {}).get("timestamp", "")
+        self.handle_api_response(message, local_key, timestamp, response_data)
+
+    def _on_outbox_expired(self, entries: list) -> None:
+        """Tell the user about submissions the outbox gave up on; the records stay unsent"""
+        for local_key, kind, last_error in entries:
+            logging.error(f"Gave up sending {kind} {local_key} to the API: {last_error or 'no response'}")
+            if local_key in self.local_kills:
+                self.local_kills[local_key]["api_response"] = f"Not delivered: {last_error or 'no response'}"
+        self.save_local_kills(*(entry[0] for entry in entries))
+        self.append_kill_readout_no_count(
+            f"<div style='color: #F44336; font-weight: bold; margin: 10px 0;'>"
+            f"{t('{count} kills/deaths could not be sent to the API within 7 days and were dropped from the send queue.').format(count=len(entries))}"
+            f"</div>"
+        )
+
+    def _replace_display_card(self, card_id: str, html_content: str) -> None:
+        """Swap a rendered card in the display for a newer version (QWebEngineView only)"""
+        if hasattr(self, 'kill_display'):
+            if hasattr(self.kill_display, 'page'):
+                escaped_content = html_content.replace('`', '\\`')
+                js_code = f"replaceCard('{card_id}', `{escaped_content}`);"
+                self.kill_display.page().runJavaScript(js_code)
+            else:
+                logging.debug(f"Cannot patch enriched card {card_id} into QTextBrowser display")
+
     def _get_display_html(self, callback=None) -> str:
         """Wrapper method to get HTML content from display widget (works with both QWebEngineView and QTextBrowser)"""
         if hasattr(self, 'kill_display'):
@@ -410,23 +534,32 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             return
 
         if icon_url:
-            try:
-                response = requests.get(icon_url, timeout=10)
-                response.raise_for_status()
-                image = QImage.fromData(response.content)
-                if not image.isNull():
-                    self._guild_icon_pixmap = QPixmap.fromImage(image)
-                    self.guild_background.setVisible(True)
-                    self._refresh_guild_background()
-                    return
-                else:
-                    logging.warning("Guild icon image data is invalid")
-            except Exception as e:
-                logging.warning(f"Failed to load guild icon from {icon_url}: {e}")
+            if self._guild_icon_key == url_key(icon_url):
+                return
+            self._guild_icon_key = self.image_loader.load_url(icon_url, PRIORITY_COSMETIC)
+            return
 
+        self._guild_icon_key = None
         self._guild_icon_pixmap = None
         self._refresh_guild_background()
 
+    def _on_image_loaded(self, key: str, pixmap: QPixmap) -> None:
+        if key == self._guild_icon_key:
+            self._guild_icon_pixmap = pixmap
+            self._refresh_guild_background()
+        if key == self._profile_image_key and hasattr(self, 'user_profile_image'):
+            self.user_profile_image.setPixmap(self.create_circular_pixmap(pixmap))
+            logging.info(f"Loaded profile image ({key})")
+
+    def _on_image_load_failed(self, key: str, reason: str) -> None:
+        if key == self._guild_icon_key:
+            logging.warning(f"Failed to load guild icon ({key}): {reason}")
+            self._guild_icon_key = None
+            self._guild_icon_pixmap = None
+            self._refresh_guild_background()
+        if key == self._profile_image_key:
+            logging.warning(f"Failed to load profile image ({key}): {reason}")
+
     def eventFilter(self, obj, event):
         if hasattr(self, 'logo_container') and obj is getattr(self, 'logo_container', None):
             if event.type() in (QEvent.Resize, QEvent.Show):
@@ -602,13 +735,10 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             'show_vehicle_destroyed': self.show_vehicle_destroyed,
             'show_pilot_ejected': self.show_pilot_ejected,
             'show_pilot_abandoned': self.show_pilot_abandoned,
+            'profile_prefetch_per_minute': self.profile_prefetch_per_minute,
             'auto_clear_logs': self.auto_clear_logs if hasattr(self, 'auto_clear_logs') else False
         }
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4)
-        except Exception as e:
-            logging.error(f"Failed to save config: {e}")
+        self.config_store.update(config)
 
     def on_rescan_button_clicked(self) -> None:
         log_path = self.log_path_input.text().strip()
@@ -652,7 +782,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         else:
             self.append_kill_readout(f"<div style='color: #2196F3; font-weight: bold; margin: 10px 0;'>{t('No missing kills found.')}</div>")
 
-    def display_missing_kill(self, kill: dict) -> None:
+    def display_missing_kill(self, kill: dict, save: bool = True) -> None:
         """Display a missing kill in the kill feed"""
         try:
             payload = kill.get("payload", {})
@@ -675,49 +805,31 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 if "killer_ship" not in data and "killer_ship" in payload:
                     data["killer_ship"] = payload["killer_ship"]
                 
+                # Profiles are fetched in the background; the card is patched through card_enriched
                 readout, _ = format_registered_kill(
-                    log_line, data, self.local_user_name, timestamp, game_mode, success=True
+                    log_line, data, self.local_user_name, timestamp, game_mode, success=True,
+                    on_enriched=self.card_enriched.emit
                 )
                 
                 self.append_kill_readout_no_count(readout)
             
                 if local_key not in self.local_kills:
-                    self.local_kills[local_key] = {
-                        "payload": payload,
-                        "timestamp": timestamp,
-                        "attacker": attacker,
-                        "readout": readout,
-                        "sent_to_api": False,
-                        "local_key": local_key                    
-                    }
-                    self.save_local_kills()
+                    self.local_kills[local_key] = new_kill_record(
+                        "kill", payload, timestamp, attacker, readout, local_key=local_key
+                    )
+                    self.rendered_cards.put(local_key, readout)
+                    if save:
+                        self.save_local_kills(local_key)
+                self.record_combat_event(
+                    local_key, "kill", timestamp, game_mode, payload.get("killer_ship", ""),
+                    KillParser.format_weapon(data.get('weapon', '')), KillParser.format_zone(data.get('zone', '')),
+                    data.get('victim', '')
+                )
                 
                 logging.info(f"Displayed missing kill in feed: {local_key}")
         except Exception as e:
             logging.error(f"Error displaying missing kill: {e}")
     
-    def send_next_missing_kill(self) -> None:
-        if not self.missing_kills_queue:
-            return
-
-        kill = self.missing_kills_queue.pop(0)
-        local_key = kill["local_key"]
-        payload = kill["payload"]
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Cache-Control': 'no-cache',
-            'X-API-Key': self.api_key,
-            'User-Agent': self.user_agent,
-            'X-Client-ID': self.__client_id__,
-            'X-Client-Version': self.__version__
-        }
-        verify_ssl = not getattr(self, 'disable_ssl_verification', False)
-        api_thread = ApiSenderThread(self.api_endpoint, headers, payload, local_key, verify_ssl, parent=self)
-        api_thread.apiResponse.connect(lambda msg, response_data, key=local_key: self.handle_missing_api_response(msg, key, response_data))
-        api_thread.start()
-        
     def send_missing_kills(self, missing_kills: List[dict]) -> None:
         self.missing_kills_queue = missing_kills.copy()
         self.missing_kills_results = {
@@ -728,33 +840,31 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         }
 
         self.append_kill_readout(f"<div style='color: #4CAF50; font-weight: bold; margin: 10px 0;'>📤 {t('Processing {count} missing kills...').format(count=len(missing_kills))}</div>")
-        
-        for index, kill in enumerate(missing_kills):
-            QTimer.singleShot(index * 500, lambda k=kill: self.send_single_missing_kill(k))
-
-    def send_single_missing_kill(self, kill: dict) -> None:
-        """Send a single missing kill to the API"""
-        local_key = kill["local_key"]
-        payload = kill["payload"]
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Cache-Control': 'no-cache',
-            'X-API-Key': self.api_key,
-            'User-Agent': self.user_agent,
-            'X-Client-ID': self.__client_id__,
-            'X-Client-Version': self.__version__
-        }
-        
-        self.display_missing_kill(kill)
 
+        if self.kill_backfill is not None:
+            self.kill_backfill.cancel()
         verify_ssl = not getattr(self, 'disable_ssl_verification', False)
-        api_thread = ApiSenderThread(self.api_endpoint, headers, payload, local_key, verify_ssl, parent=self)
-        api_thread.apiResponse.connect(lambda msg, response_data, key=local_key: self.handle_missing_api_response(msg, key, response_data))
-        api_thread.start()
+        bulk_endpoint = KillBackfill.bulk_endpoint_for(self.api_endpoint, self.api_capabilities)
+        self.kill_backfill = KillBackfill(self.api_endpoint, self.api_headers() or {}, verify_ssl, bulk_endpoint, parent=self)
+        self.kill_backfill.batch_finished.connect(self.handle_missing_batch)
+        self.kill_backfill.start(missing_kills)
+
+    def handle_missing_batch(self, results: List[tuple]) -> None:
+        """Display and tally one finished backfill batch, saving local kills once for the whole batch"""
+        kills_by_key = {kill["local_key"]: kill for kill in self.missing_kills_queue}
+        for local_key, msg, response_data in results:
+            kill = kills_by_key.get(local_key)
+            if kill is not None:
+                self.display_missing_kill(kill, save=False)
+            self.handle_missing_api_response(msg, local_key, response_data, save=False)
+        self.save_local_kills(*(result[0] for result in results))
+        results_so_far = self.missing_kills_results
+        logging.info(
+            f"Missing kills backfill: {len(results_so_far['new_kills'])} new, {len(results_so_far['duplicates'])} duplicates, "
+            f"{len(results_so_far['errors'])} errors of {results_so_far['total']}"
+        )
 
-    def handle_missing_api_response(self, msg: str, local_key: str, response_data=None) -> None:
+    def handle_missing_api_response(self, msg: str, local_key: str, response_data=None, save: bool = True) -> None:
         success = False
         is_duplicate = False
 
@@ -766,7 +876,8 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             if local_key in self.local_kills:
                 self.local_kills[local_key]["sent_to_api"] = True
                 self.local_kills[local_key]["api_response"] = msg
-                self.save_local_kills()
+                if save:
+                    self.save_local_kills(local_key)
         elif "kill logged successfully" in msg.lower() or msg.strip() == "":
             logging.info(f"Kill {local_key} sent successfully")
             success = True
@@ -775,14 +886,15 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             if local_key in self.local_kills:
                 self.local_kills[local_key]["sent_to_api"] = True
                 self.local_kills[local_key]["api_response"] = msg if msg.strip() else "Kill logged successfully"
-                self.save_local_kills()
+                if save:
+                    self.save_local_kills(local_key)
                 
-                readout = self.local_kills[local_key].get("readout", "")
-                if "YOU KILLED" in readout:
+                event_type = record_event_type(local_key, self.local_kills[local_key])
+                if event_type == "kill":
                     self.kill_count += 1
                     self.update_kill_death_stats()
                     logging.info(f"Incremented kill count to {self.kill_count} for new kill: {local_key}")
-                elif "YOU DIED" in readout:
+                elif event_type == "death":
                     self.death_count += 1
                     self.update_kill_death_stats()
                     logging.info(f"Incremented death count to {self.death_count} for new death: {local_key}")
@@ -876,8 +988,54 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
     def open_tracker_files(self) -> None:
         webbrowser.open(TRACKER_DIR)
 
-    def generate_api_diagnostic_report(self) -> str:
-        """Generate a diagnostic report for API connection issues"""
+    def api_diagnostic_probes(self) -> Dict[str, Any]:
+        """Diagnostic probes for the API connection, each called with its timeout off the GUI thread"""
+        import urllib.parse
+
+        probes = {
+            "time_sync": lambda timeout: self.check_system_time_sync(),
+            "api_key": lambda timeout: self.test_api_key_validity(),
+        }
+        if not getattr(self, 'api_endpoint', None):
+            return probes
+
+        parsed_url = urllib.parse.urlparse(self.api_endpoint)
+        hostname = parsed_url.hostname
+        port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
+        ping_url = self.api_endpoint.replace('/kills', '/ping')
+        headers = {
+            'Accept': 'application/json',
+            'X-API-Key': getattr(self, 'api_key', ''),
+            'User-Agent': getattr(self, 'user_agent', 'Unknown')
+        }
+        verify_ssl = not getattr(self, 'disable_ssl_verification', False)
+
+        def ping(timeout: float) -> dict:
+            response = timed_get(ping_url, headers=headers, verify=verify_ssl, timeout=timeout)
+            text = response["body"]
+            result = {
+                "ping_url": ping_url,
+                "status_code": response["status_code"],
+                "response_length": len(text),
+                "content_type": response["headers"].get('Content-Type', response["headers"].get('content-type', 'Unknown')),
+                "response_preview": text[:200] + "..." if len(text) > 200 else text,
+                "cloudflare_challenge": "just a moment" in text.lower() or "cloudflare" in text.lower(),
+                "proxy": response["proxy"] or "none",
+                "timings": response["timings"]
+            }
+            if response["status_code"] != 200:
+                result["error_details"] = f"HTTP {response['status_code']}: {response['reason']}"
+                if response["status_code"] == 403 and result["cloudflare_challenge"]:
+                    result["issue_type"] = "CLOUDFLARE_SECURITY_CHALLENGE"
+                    result["not_api_key_issue"] = True
+            return result
+
+        probes["network"] = lambda timeout: probe_tcp(hostname, port, timeout)
+        probes["api_ping"] = ping
+        return probes
+
+    def generate_api_diagnostic_report(self, probe_results: Dict[str, dict]) -> str:
+        """Generate a diagnostic report for API connection issues from the results of api_diagnostic_probes"""
         import platform
         import sys
         
@@ -898,66 +1056,9 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 "api_key_provided": bool(getattr(self, 'api_key', None)),
                 "api_key_length": len(getattr(self, 'api_key', '')) if getattr(self, 'api_key', None) else 0,
                 "send_to_api_enabled": getattr(self, 'send_to_api_checkbox', None) and self.send_to_api_checkbox.isChecked()
-            },
-            "time_sync_check": self.check_system_time_sync(),
-            "network_test": {}
+            }
         }
         
-        try:
-            import socket
-            import urllib.parse
-            
-            if hasattr(self, 'api_endpoint') and self.api_endpoint:
-                parsed_url = urllib.parse.urlparse(self.api_endpoint)
-                hostname = parsed_url.hostname
-                port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
-                
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                result = sock.connect_ex((hostname, port))
-                sock.close()
-                
-                diagnostic_info["network_test"] = {
-                    "hostname": hostname,
-                    "port": port,
-                    "socket_connection": "SUCCESS" if result == 0 else f"FAILED (error code: {result})"
-                }
-                
-                try:
-                    ping_url = self.api_endpoint.replace('/kills', '/ping')
-                    headers = {
-                        'Accept': 'application/json',
-                        'X-API-Key': getattr(self, 'api_key', ''),
-                        'User-Agent': getattr(self, 'user_agent', 'Unknown')
-                    }
-                    
-                    import requests
-                    ping_response = requests.get(ping_url, headers=headers, timeout=10)
-                    diagnostic_info["api_ping_test"] = {
-                        "ping_url": ping_url,
-                        "status_code": ping_response.status_code,
-                        "response_length": len(ping_response.text),
-                        "content_type": ping_response.headers.get('content-type', 'Unknown'),
-                        "response_preview": ping_response.text[:200] + "..." if len(ping_response.text) > 200 else ping_response.text,
-                        "cloudflare_challenge": "just a moment" in ping_response.text.lower() or "cloudflare" in ping_response.text.lower()
-                    }
-                    
-                    if ping_response.status_code != 200:
-                        diagnostic_info["api_ping_test"]["error_details"] = f"HTTP {ping_response.status_code}: {ping_response.reason}"
-                        
-                        if ping_response.status_code == 403 and diagnostic_info["api_ping_test"]["cloudflare_challenge"]:
-                            diagnostic_info["api_ping_test"]["issue_type"] = "CLOUDFLARE_SECURITY_CHALLENGE"
-                            diagnostic_info["api_ping_test"]["not_api_key_issue"] = True
-                        
-                except Exception as ping_error:
-                    diagnostic_info["api_ping_test"] = {
-                        "error": str(ping_error),
-                        "error_type": type(ping_error).__name__
-                    }
-                    
-        except Exception as e:
-            diagnostic_info["network_test"]["error"] = str(e)
-        
         report = "=== SCTool Tracker API Diagnostic Report ===\n\n"
         report += f"Generated: {diagnostic_info['timestamp']}\n\n"
         
@@ -973,19 +1074,31 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         for key, value in diagnostic_info["api_configuration"].items():
             report += f"  {key}: {value}\n"
         
-        report += "\nNETWORK TEST:\n"
-        for key, value in diagnostic_info["network_test"].items():
-            report += f"  {key}: {value}\n"
-        
-        if "api_ping_test" in diagnostic_info:
-            report += "\nAPI PING TEST:\n"
-            for key, value in diagnostic_info["api_ping_test"].items():
+        for name, title in API_DIAGNOSTIC_SECTIONS.items():
+            if name not in probe_results:
+                continue
+            report += f"\n{title.upper()}:\n"
+            for key, value in probe_results[name].items():
+                if key == "timings":
+                    value = format_timings(value)
                 report += f"  {key}: {value}\n"
         
         report += "\n=== End of Diagnostic Report ===\n"
         
         return report
 
+    def show_api_diagnostics(self, on_report: Optional[Any] = None, copy_to_clipboard: bool = False) -> None:
+        """Run the API diagnostic probes concurrently and stream their results into a dialog"""
+        diagnostics = ApiDiagnostics(self.api_diagnostic_probes())
+        dialog = ApiDiagnosticsDialog(
+            diagnostics, self.generate_api_diagnostic_report, API_DIAGNOSTIC_SECTIONS,
+            copy_to_clipboard=copy_to_clipboard, parent=self
+        )
+        if on_report is not None:
+            dialog.report_ready.connect(on_report)
+        self.api_diagnostics_dialog = dialog
+        dialog.start()
+
     def test_api_key_validity(self) -> dict:
         """Test API key validity and return detailed results"""
         test_results = {
@@ -1017,7 +1130,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 import urllib3
                 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
             
-            response = requests.get(ping_url, headers=headers, timeout=10, verify=verify_ssl)
+            response = self.api_client.get(ping_url, headers=headers, timeout=10, verify=verify_ssl)
             test_results["status_code"] = response.status_code
             
             if response.status_code == 200:
@@ -1110,10 +1223,11 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             'X-Client-Version': self.__version__
         }
 
-    def ping_api_with_retry(self) -> bool:
+    def ping_api_with_retry(self) -> Tuple[bool, Optional[dict]]:
         """Try pinging the API with different approaches to work around Cloudflare"""
-        if self.ping_api():
-            return True
+        connected, data = self.ping_api()
+        if connected:
+            return connected, data
             
         logging.info("Normal API ping failed, trying with enhanced headers for Cloudflare...")
         
@@ -1121,18 +1235,18 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             ping_url = self.api_endpoint.replace('/kills', '/ping')
             headers = self.try_cloudflare_bypass_headers()
             
-            response = requests.get(ping_url, headers=headers, timeout=15)
+            response = self.api_client.get(ping_url, headers=headers, timeout=15)
             
             if response.status_code == 200:
                 logging.info("API ping successful with enhanced headers")
-                return True
+                return True, None
             else:
                 logging.error(f"API ping with enhanced headers also failed: {response.status_code}")
-                return False
+                return False, None
                 
         except Exception as e:
             logging.error(f"Enhanced API ping failed: {e}")
-            return False
+            return False, None
 
     def show_ssl_bypass_option(self):
         """Show the SSL verification bypass option when SSL errors are detected"""
@@ -1143,6 +1257,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
     def on_ssl_verification_changed(self, state: int) -> None:
         """Handle SSL verification checkbox state change"""
         self.disable_ssl_verification = (state == Qt.Checked)
+        self.kill_outbox.verify_ssl = not self.disable_ssl_verification
         self.save_config()
         if self.disable_ssl_verification:
             logging.warning("🚨 USER ENABLED SSL BYPASS - This reduces security!")
@@ -1230,7 +1345,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             logging.warning("🚨 ATTEMPTING INSECURE API CONNECTION (SSL VERIFICATION DISABLED)")
             logging.warning("This is NOT recommended and should only be used as a temporary workaround")
             
-            response = requests.get(ping_url, headers=headers, timeout=10, verify=False)
+            response = self.api_client.get(ping_url, headers=headers, timeout=10, verify=False)
             
             if response.status_code == 200:
                 logging.warning("✅ Insecure API ping successful - SSL verification is the problem")
@@ -1247,8 +1362,13 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             logging.error(f"Insecure API ping failed: {e}")
             return False
 
-    def ping_api(self) -> bool:
-        """Test API connectivity by pinging the server"""
+    def ping_api(self) -> Tuple[bool, Optional[dict]]:
+        """
+        Test API connectivity by pinging the server; returns (connected, ping data).
+
+        Only does network work and logging, so it can run off the GUI thread;
+        apply_ping_data applies the returned data to the window.
+        """
         try:
             ping_url = self.api_endpoint.replace('/kills', '/ping')
             
@@ -1273,7 +1393,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
                 logging.warning("🚨 SSL verification is DISABLED - this is insecure!")
             
-            response = requests.get(ping_url, headers=headers, timeout=10, verify=verify_ssl)
+            response = self.api_client.get(ping_url, headers=headers, timeout=10, verify=verify_ssl)
             
             logging.info(f"API ping response status: {response.status_code}")
             logging.info(f"Response headers: {dict(response.headers)}")
@@ -1285,42 +1405,19 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 if 'application/json' not in content_type:
                     logging.warning(f"API ping returned non-JSON content type: {content_type}")
                     logging.warning(f"Response body: {response.text}")
-                    return False
+                    return False, None
                 
                 try:
                     data = response.json()
                     logging.debug(f"Parsed JSON response: {data}")
                     
-                    if 'registered_in_game_name' in data:
-                        registered_name = data['registered_in_game_name']
-                        if registered_name and not self.local_user_name:
-                            self.local_user_name = registered_name
-                            if hasattr(self, 'user_display'):
-                                self.user_display.setText(f"{self.local_user_name}")
-                            logging.info(f"Retrieved registered username from API: {registered_name}")
-                    
-                    guild_name = data.get('guild_name')
-                    if guild_name:
-                        self.guild_name = guild_name
-                        if hasattr(self, 'guild_display'):
-                            self.guild_display.setText(f"{self.guild_name}")
-                            self.guild_display.setVisible(True)
-                        logging.info(f"Retrieved guild name from API: {guild_name}")
-                    else:
-                        self.guild_name = ""
-                        if hasattr(self, 'guild_display'):
-                            self.guild_display.clear()
-                            self.guild_display.setVisible(False)
-
-                    self._update_guild_background(data.get('guild_icon'))
-                    
                     logging.info("API ping successful")
-                    return True
+                    return True, data
                     
                 except ValueError as json_error:
                     logging.error(f"Failed to parse JSON from ping response: {json_error}")
                     logging.error(f"Response content: {response.text}")
-                    return False
+                    return False, None
                     
             elif response.status_code == 400:
                 try:
@@ -1329,13 +1426,13 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                     logging.warning(f"API ping returned 400: {error_msg}")
                 except ValueError:
                     logging.warning(f"API ping failed with status 400, non-JSON response: {response.text}")
-                return False
+                return False, None
                 
             elif response.status_code == 401:
                 logging.error("API ping failed: Invalid API key (401 Unauthorized)")
                 logging.error("TROUBLESHOOTING: Your API key appears to be invalid or expired.")
                 logging.error("SOLUTION: Please check your API key at https://starcitizentool.com/profile")
-                return False
+                return False, None
                 
             elif response.status_code == 403:
                 logging.error("API ping failed: Access forbidden (403 Forbidden)")
@@ -1352,39 +1449,39 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 else:
                     logging.error("TROUBLESHOOTING: Your API key may not have sufficient permissions.")
                     logging.error("SOLUTION: Please verify your account status at https://starcitizentool.com/profile")
-                return False
+                return False, None
                 
             elif response.status_code == 404:
                 logging.error("API ping failed: Endpoint not found (404 Not Found)")
                 logging.error(f"TROUBLESHOOTING: The API endpoint {ping_url} was not found.")
                 logging.error("SOLUTION: This may indicate a server issue or outdated client version.")
-                return False
+                return False, None
                 
             elif response.status_code >= 500:
                 logging.error(f"API ping failed: Server error ({response.status_code})")
                 logging.error("TROUBLESHOOTING: The API server is experiencing issues.")
                 logging.error("SOLUTION: Please try again later or contact support if the issue persists.")
-                return False
+                return False, None
                 
             else:
                 logging.warning(f"API ping failed with status code: {response.status_code}")
                 logging.warning(f"Response content: {response.text}")
                 logging.error(f"TROUBLESHOOTING: Unexpected HTTP status code {response.status_code}")
                 logging.error("SOLUTION: Please share this diagnostic information with support.")
-                return False
+                return False, None
                 
         except requests.exceptions.ConnectionError as e:
             logging.error(f"API ping failed - Connection Error: {e}")
             logging.error("This usually indicates network connectivity issues or incorrect API endpoint URL")
             logging.error(f"Attempted URL: {ping_url}")
-            return False
+            return False, None
         except requests.exceptions.Timeout as e:
             logging.error(f"API ping failed - Timeout Error: {e}")
             logging.error("The API server took too long to respond (>10 seconds)")
-            return False
+            return False, None
         except requests.exceptions.HTTPError as e:
             logging.error(f"API ping failed - HTTP Error: {e}")
-            return False
+            return False, None
         except requests.exceptions.SSLError as ssl_error:
             logging.error(f"API ping failed with SSL/TLS error: {ssl_error}")
             logging.error("🔒 SSL CERTIFICATE VERIFICATION FAILED")
@@ -1417,27 +1514,54 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             logging.warning("Attempting emergency insecure connection as fallback...")
             if self.ping_api_insecure():
                 logging.warning("✅ Connection works without SSL verification - this confirms SSL configuration issue")
-                if hasattr(self, 'show_ssl_bypass_option'):
-                    QTimer.singleShot(100, self.show_ssl_bypass_option)
-                return True
+                self.ssl_bypass_needed.emit()
+                return True, None
             else:
                 logging.error("❌ Even insecure connection failed - this is not just an SSL issue")
-                return False
+                return False, None
         except requests.exceptions.RequestException as e:
             logging.error(f"API ping failed with network error: {e}")
             logging.error(f"Request error type: {type(e).__name__}")
-            return False
+            return False, None
         except ValueError as json_error:
             logging.error(f"API ping failed with JSON parsing error: {json_error}")
             logging.error("This usually means the server returned non-JSON content (HTML error page, etc.)")
-            return False
+            return False, None
         except Exception as e:
             logging.error(f"API ping failed with unexpected error: {e}")
             logging.error(f"Error type: {type(e).__name__}")
             logging.error(f"Error args: {e.args}")
             import traceback
             logging.error(f"Full traceback: {traceback.format_exc()}")
-            return False
+            return False, None
+
+    def apply_ping_data(self, data: dict) -> None:
+        """Show the registered name, guild and capabilities from a successful API ping"""
+        if 'registered_in_game_name' in data:
+            registered_name = data['registered_in_game_name']
+            if registered_name and not self.local_user_name:
+                self.local_user_name = registered_name
+                if hasattr(self, 'user_display'):
+                    self.user_display.setText(f"{self.local_user_name}")
+                logging.info(f"Retrieved registered username from API: {registered_name}")
+
+        guild_name = data.get('guild_name')
+        if guild_name:
+            self.guild_name = guild_name
+            if hasattr(self, 'guild_display'):
+                self.guild_display.setText(f"{self.guild_name}")
+                self.guild_display.setVisible(True)
+            logging.info(f"Retrieved guild name from API: {guild_name}")
+        else:
+            self.guild_name = ""
+            if hasattr(self, 'guild_display'):
+                self.guild_display.clear()
+                self.guild_display.setVisible(False)
+
+        self._update_guild_background(data.get('guild_icon'))
+        self.api_capabilities = data.get('capabilities') or []
+        if self.monitor_thread and not self.monitor_thread.registered_user and self.local_user_name:
+            self.monitor_thread.registered_user = self.local_user_name.lower()
 
     def detect_cloudflare_challenge(self, response_text: str, status_code: int) -> bool:
         """Detect if a response is a Cloudflare challenge page"""
@@ -1456,11 +1580,205 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         
         return False
 
+    def check_api_connection(self, report_failure: bool = False, force: bool = False) -> None:
+        """
+        Ping the API in the background and reflect the result in the API indicator.
+
+        Results are cached for a short TTL (shorter after a failure), so repeated
+        toggles do not re-ping. With report_failure a failed check is followed by
+        background diagnostics and the connection error dialog.
+        """
+        verify_ssl = not getattr(self, 'disable_ssl_verification', False)
+        key = f"api_ping:{self.api_endpoint}:{hash(self.api_key)}:{verify_ssl}"
+        self.update_bottom_info("api_connection", "Checking API connection...")
+        self.connectivity.run(
+            key, self.ping_api_with_retry,
+            lambda result: self._on_api_check_finished(result, report_failure),
+            ttl=lambda result: API_PING_TTL_SECONDS if result[0] else API_PING_FAILURE_TTL_SECONDS,
+            force=force
+        )
+
+    def _on_api_check_finished(self, result: Optional[Tuple[bool, Optional[dict]]], report_failure: bool) -> None:
+        if not self.send_to_api_checkbox.isChecked():
+            return
+        connected, data = result or (False, None)
+        if connected:
+            logging.info("API connection successful")
+            if data:
+                self.apply_ping_data(data)
+            self.update_bottom_info("api_connection", "API Connected")
+            self.update_api_indicator(True)
+            return
+        self.update_bottom_info("api_connection", "Error API not connected")
+        self.update_api_indicator(False)
+        if report_failure:
+            self.api_pool.submit(
+                self.collect_api_failure_diagnostics,
+                lambda results, error: self.show_api_connection_error(results or {"error_message": str(error or "")})
+            )
+
+    def collect_api_failure_diagnostics(self) -> dict:
+        """Log connection details, probe the API host and test the API key (runs off the GUI thread)"""
+        error_details = {
+            "api_endpoint": getattr(self, 'api_endpoint', 'Not set'),
+            "api_key_provided": bool(self.api_key),
+            "api_key_length": len(self.api_key) if self.api_key else 0,
+            "user_agent": getattr(self, 'user_agent', 'Not set'),
+            "client_id": getattr(self, '__client_id__', 'Not set'),
+            "client_version": getattr(self, '__version__', 'Not set'),
+            "timestamp": datetime.now().isoformat()
+        }
+
+        logging.error("API CONNECTION FAILURE - Please share this log with support:")
+        logging.error(f"Error details: {json.dumps(error_details, indent=2)}")
+
+        try:
+            import urllib.parse
+
+            if hasattr(self, 'api_endpoint') and self.api_endpoint:
+                parsed_url = urllib.parse.urlparse(self.api_endpoint)
+                hostname = parsed_url.hostname
+                port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
+
+                logging.info(f"Testing network connectivity to {hostname}:{port}")
+                result = tcp_probe(hostname, port)
+
+                if result == 0:
+                    logging.info("Network connectivity to API host: SUCCESS")
+                else:
+                    logging.error(f"Network connectivity to API host: FAILED (error code: {result})")
+
+        except Exception as network_error:
+            logging.error(f"Network diagnostic failed: {network_error}")
+
+        logging.info("Running detailed API key diagnostics...")
+        api_test_results = self.test_api_key_validity()
+
+        logging.error("API KEY TEST RESULTS:")
+        for key, value in api_test_results.items():
+            logging.error(f"  {key}: {value}")
+
+        return api_test_results
+
+    def show_api_connection_error(self, api_test_results: dict) -> None:
+        """Explain a failed API connection with the results of collect_api_failure_diagnostics"""
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("API Connection Error")
+        msg_box.setIcon(QMessageBox.Critical)
+
+        error_text = "Unable to connect to the API."
+
+        is_cloudflare_issue = (api_test_results.get("status_code") == 403 and 
+                             any("cloudflare" in rec.lower() for rec in api_test_results.get("recommendations", [])))
+
+        is_ssl_issue = any("ssl" in rec.lower() or "certificate" in rec.lower() for rec in api_test_results.get("recommendations", []))
+
+        if is_ssl_issue:
+            error_text = "🔒 SSL CERTIFICATE VERIFICATION FAILED\n\n"
+            error_text += "This is a Windows/system configuration issue!\n"
+            error_text += "Most commonly caused by incorrect system clock."
+        elif is_cloudflare_issue:
+            error_text = "🛡️ CLOUDFLARE SECURITY BLOCKING ACCESS\n\n"
+            error_text += "This is NOT an API key problem!\n"
+            error_text += "Cloudflare's security system is blocking your requests."
+        elif api_test_results.get("status_code"):
+            error_text += f"\n\nServer returned status code: {api_test_results['status_code']}"
+
+        if api_test_results.get("error_message") and not is_cloudflare_issue and not is_ssl_issue:
+            error_text += f"\nError: {api_test_results['error_message']}"
+
+        msg_box.setText(error_text)
+
+        if is_ssl_issue:
+            error_msg = api_test_results.get("error_message", "").lower()
+            if "not yet valid" in error_msg:
+                detail_text = "🔒 SSL CERTIFICATE ERROR: 'Not Yet Valid'\n\n"
+                detail_text += "🚨 THIS IS ALMOST ALWAYS A SYSTEM CLOCK ISSUE!\n\n"
+                detail_text += "COMMON ON:\n"
+                detail_text += "• Unactivated Windows (cannot update certificates)\n"
+                detail_text += "• Windows 11 systems\n"
+                detail_text += "• Systems with incorrect time zones\n\n"
+                detail_text += "IMMEDIATE FIXES (try in order):\n"
+                detail_text += "1. Right-click taskbar clock → 'Adjust date/time'\n"
+                detail_text += "2. Enable 'Set time automatically'\n"
+                detail_text += "3. Enable 'Set time zone automatically'\n"
+                detail_text += "4. Click 'Sync now' to force synchronization\n"
+                detail_text += "5. If Windows is unactivated: Activate Windows\n"
+                detail_text += "6. Restart computer after fixing time\n\n"
+            else:
+                detail_text = "🔒 SSL CERTIFICATE VERIFICATION ERROR\n\n"
+                detail_text += "MOST COMMON CAUSE:\n"
+                detail_text += "• System clock is incorrect (check Windows date/time)\n\n"
+                detail_text += "OTHER POSSIBLE CAUSES:\n"
+                detail_text += "• Outdated Windows certificate store\n"
+                detail_text += "• Corporate firewall interference\n"
+                detail_text += "• Antivirus SSL scanning\n\n"
+                detail_text += "SOLUTIONS (try in order):\n"
+                detail_text += "1. Right-click taskbar clock → 'Adjust date/time'\n"
+                detail_text += "2. Enable 'Set time automatically' in Windows Settings\n"
+                detail_text += "3. Run Windows Update to update certificates\n"
+                detail_text += "4. Temporarily disable antivirus SSL scanning\n"
+                detail_text += "5. Try from mobile hotspot to test network\n"
+                detail_text += "6. Contact IT if on corporate network\n\n"
+        elif is_cloudflare_issue:
+            detail_text = "🚨 CLOUDFLARE SECURITY CHALLENGE DETECTED\n\n"
+            detail_text += "WHAT THIS MEANS:\n"
+            detail_text += "• Your API key is probably fine\n"
+            detail_text += "• Cloudflare thinks your requests look suspicious\n"
+            detail_text += "• This affects some users but not others\n"
+            detail_text += "• It's based on location, IP reputation, etc.\n\n"
+            detail_text += "SOLUTIONS (try in order):\n"
+            detail_text += "1. Try using a VPN from a different country\n"
+            detail_text += "2. Wait 30 minutes and try again\n"
+            detail_text += "3. Restart your router to get a new IP address\n"
+            detail_text += "4. Contact support with this diagnostic report\n\n"
+            detail_text += "NOTE: The developer needs to whitelist your IP or adjust Cloudflare settings.\n"
+        else:
+            detail_text = "TROUBLESHOOTING STEPS:\n\n"
+            if api_test_results.get("recommendations"):
+                for i, rec in enumerate(api_test_results["recommendations"], 1):
+                    detail_text += f"{i}. {rec}\n"
+            else:
+                detail_text += "1. Check your network connection\n"
+                detail_text += "2. Verify your API key at https://starcitizentool.com/profile\n"
+                detail_text += "3. Try again in a few minutes\n"
+
+        detail_text += "\nDIAGNOSTIC INFORMATION:\n"
+        detail_text += f"• Network connectivity to server: ✓ SUCCESS\n"
+        detail_text += f"• API key format valid: {'✓' if api_test_results.get('api_key_format_valid') else '✗'}\n"
+        detail_text += f"• API key length: {len(getattr(self, 'api_key', ''))}\n"
+        if api_test_results.get("status_code"):
+            detail_text += f"• Server response code: {api_test_results['status_code']}\n"
+
+        detail_text += "\nUse the diagnostic buttons below to get more detailed information."
+
+        msg_box.setDetailedText(detail_text)
+
+        ok_btn = msg_box.addButton("OK", QMessageBox.AcceptRole)
+        diagnostic_btn = msg_box.addButton("Copy Quick Diagnostic", QMessageBox.ActionRole)
+        full_debug_btn = msg_box.addButton("Export Debug Info", QMessageBox.ActionRole)
+
+        msg_box.setDefaultButton(ok_btn)
+        msg_box.exec_()
+
+        clicked_btn = msg_box.clickedButton()
+        if clicked_btn == diagnostic_btn:
+            try:
+                self.show_api_diagnostics(copy_to_clipboard=True)
+            except Exception as e:
+                logging.error(f"Failed to generate diagnostic report: {e}")
+                self.showCustomMessageBox("Error", "Failed to generate diagnostic report.")
+
+        elif clicked_btn == full_debug_btn:
+            self.export_debug_logs()
+
     def update_api_status(self) -> None:
-        if self.send_to_api_checkbox.isChecked():
-            if self.ping_api():
-                self.update_bottom_info("api_connection", "API Connected")
-                self.update_api_indicator(True)
+        self.send_to_api_enabled = self.send_to_api_checkbox.isChecked()
+        if self.send_to_api_enabled:
+            # Deliver whatever was queued while sending was off
+            self.kill_outbox.start(self.outbox_headers, not self.disable_ssl_verification)
+            if self.api_key:
+                self.check_api_connection()
             else:
                 self.update_bottom_info("api_connection", "Error API not connected")
                 self.update_api_indicator(False)
@@ -1559,7 +1877,45 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         else:
             return single_file_path
 
+    def on_card_enriched(self, card_id: str, readout: str) -> None:
+        """Patch a kill/death card with profile data that arrived after it was shown"""
+        self.enriched_cards[card_id] = readout
+        while len(self.enriched_cards) > 100:
+            self.enriched_cards.pop(next(iter(self.enriched_cards)))
+
+        self._replace_display_card(card_id, readout)
+
+        for local_key, kill in self.local_kills.items():
+            if kill.get("card_id") == card_id:
+                card = add_clip_link(readout, kill["clip_url"]) if kill.get("clip_url") else readout
+                self.rendered_cards.put(local_key, card)
+
+    def kill_readout(self, local_key: str) -> str:
+        """Rendered card for a stored kill/death, from the card cache or rebuilt from the record"""
+        readout = self.rendered_cards.get(local_key)
+        if readout is not None:
+            return readout
+        record = self.local_kills.get(local_key)
+        if record is None:
+            return ""
+        try:
+            readout = render_readout(local_key, record, self.local_user_name)
+        except Exception as e:
+            logging.error(f"Error rendering stored kill {local_key}: {e}")
+            return ""
+        if readout:
+            self.rendered_cards.put(local_key, readout)
+        return readout
+
+    def latest_card_readout(self, readout: str) -> str:
+        """Return the enriched version of a card if enrichment finished before the card was handled"""
+        match = re.search(r'id="(card-[0-9a-f]+)"', readout or "")
+        if match:
+            return self.enriched_cards.get(match.group(1), readout)
+        return readout
+
     def on_kill_detected(self, readout: str, attacker: str) -> None:
+        readout = self.latest_card_readout(readout)
         self.append_kill_readout(readout)
         try:
             lowered = readout.lower() if readout else ''
@@ -1583,6 +1939,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 self._play_sound_with_fallback(sound_file, self.kill_sound_volume / 100.0, kind='kill')
 
     def on_death_detected(self, readout: str, attacker: str) -> None:
+        readout = self.latest_card_readout(readout)
         self.append_death_readout(readout)
         try:
             lowered = readout.lower() if readout else ''
@@ -1616,8 +1973,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                         for kill_key, kill_data in self.local_kills.items():
                             timestamp = kill_data.get("timestamp", "Unknown")
                             attacker = kill_data.get("attacker", "Unknown")
-                            victim = kill_data.get("readout", "").split(" - ")[0] if " - " in kill_data.get("readout", "") else "Unknown"
-                            readout = kill_data.get("readout", "No details")
+                            readout = self.kill_readout(kill_key) or "No details"
 
                             if attacker == self.local_user_name:
                                 event_type = "Kill"
@@ -1720,10 +2076,20 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 "Text Files (*.txt);;All Files (*)", options=options
             )
             
+            if file_path:
+                self.show_api_diagnostics(on_report=lambda report: self.write_debug_export(file_path, report))
+                
+        except Exception as e:
+            logging.error(f"Error exporting debug logs: {e}")
+            self.showCustomMessageBox("Export Error", f"Failed to export debug logs: {str(e)}", QMessageBox.Critical)
+
+    def write_debug_export(self, file_path: str, diagnostic_report: str) -> None:
+        """Write the debug export once the API diagnostics have finished"""
+        try:
             if file_path:
                 debug_content = []
                 
-                debug_content.append(self.generate_api_diagnostic_report())
+                debug_content.append(diagnostic_report)
                 debug_content.append("\n" + "="*60 + "\n")
                 
                 debug_content.append("CURRENT CONFIGURATION:\n")
@@ -1764,9 +2130,11 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                         if 'api_kill_id' in kill_data:
                             debug_content.append(f"    API Kill ID: {kill_data['api_kill_id']}\n")
                         
-                        if 'readout' in kill_data:
-                            readout_preview = kill_data['readout'][:200].replace('\n', ' ')
-                            debug_content.append(f"    Readout Preview: {readout_preview}...\n")
+                        debug_content.append(f"    Event Type: {record_event_type(local_key, kill_data)}\n")
+                        if 'card_id' in kill_data:
+                            debug_content.append(f"    Card ID: {kill_data['card_id']}\n")
+                        if 'clip_url' in kill_data:
+                            debug_content.append(f"    Clip URL: {kill_data['clip_url']}\n")
                         
                         if 'payload' in kill_data:
                             payload = kill_data['payload']
@@ -1849,7 +2217,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             }
             
             logging.info(f"Downloading update from: {auto_update_url}")
-            download_response = requests.get(auto_update_url, headers=headers, stream=True, timeout=30)
+            download_response = self.api_client.get(auto_update_url, headers=headers, stream=True, timeout=30)
             download_response.raise_for_status()
             file_size = int(download_response.headers.get('Content-Length', 0))
             logging.info(f"Update file size: {file_size} bytes")
@@ -1912,6 +2280,8 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             )
 
     def delete_local_kills(self):
+        self.kill_store.clear()
+        logging.info("Local kill store cleared on close.")
         if os.path.isfile(self.kills_local_file):
             try:
                 os.remove(self.kills_local_file)
@@ -1940,18 +2310,18 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             if kill_id and local_key in self.local_kills:
                 self.local_kills[local_key]["api_kill_id"] = kill_id
                 logging.info(f"Stored API kill ID {kill_id} for local key: {local_key}")
-                self.save_local_kills()
+                self.save_local_kills(local_key)
 
         if "npc kill not logged" in normalized_message or "npc not logged" in normalized_message:
             logging.info(f"API identified NPC kill: {local_key}")
 
-            if local_key in self.local_kills and "readout" in self.local_kills[local_key]:
-                readout_to_remove = self.local_kills[local_key]["readout"]
+            if local_key in self.local_kills:
+                readout_to_remove = self.kill_readout(local_key)
             
                 if hasattr(self.kill_display, 'toHtml'):
                     html_content = self.kill_display.toHtml()
                     
-                    if readout_to_remove in html_content:
+                    if readout_to_remove and readout_to_remove in html_content:
                         new_html = html_content.replace(readout_to_remove, "")
                         self._set_display_html(new_html)
                         self.kill_count -= 1
@@ -1967,7 +2337,9 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                     self.update_kill_death_stats()
 
                 del self.local_kills[local_key]
-                self.save_local_kills()
+                self.rendered_cards.discard(local_key)
+                self.combat_history.remove_event(local_key)
+                self.save_local_kills(local_key)
                 logging.info(f"Removed NPC kill from local storage: {local_key}")
             return
 
@@ -1980,7 +2352,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             self.local_kills[local_key]["api_response"] = message
             self.local_kills[local_key]["sent_to_api"] = True
             logging.info(f"[{timestamp}] Updated local kill {local_key} with API response: {message}")
-            self.save_local_kills()
+            self.save_local_kills(local_key)
 
     def append_kill_readout(self, text: str) -> None:
         is_kill = "YOU KILLED" in text
@@ -2081,100 +2453,99 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             )
 
     def fetch_user_image(self, username: str) -> None:
+        """Request the user's RSI avatar; it is applied when the image loader delivers it"""
+        self._profile_image_key = self.image_loader.load_player_avatar(username, PRIORITY_COSMETIC)
+
+    def save_local_kills(self, *local_keys: str) -> None:
+        """Persist the given records (removing any no longer in local_kills), or all of them without keys"""
+        if not local_keys:
+            if self.kill_store.replace_all(self.local_kills):
+                logging.info(f"Saved {len(self.local_kills)} kills to the local kill store.")
+            return
+        records = {key: self.local_kills[key] for key in local_keys if key in self.local_kills}
+        for key in local_keys:
+            if key not in self.local_kills:
+                self.kill_store.remove(key)
+        if self.kill_store.put_many(records):
+            logging.debug(f"Saved {len(records)} of {len(self.local_kills)} local kills.")
+
+    def record_combat_event(self, local_key: str, event_type: str, timestamp: str, game_mode: str, ship: str,
+                            weapon: str, zone: str, opponent: str) -> None:
+        """Add a kill or death to the permanent combat history, filling in the opponent's org once it is known"""
+        org = org_from_details(get_player_cache().get_player_details(opponent))
+        history = self.combat_history
+        if not history.record_event(local_key, event_type, timestamp, game_mode, ship, weapon, zone, opponent,
+                                    org if org is not None else ORG_PENDING):
+            return
+        if org is None and opponent:
+            get_profile_enricher().submit(
+                opponent,
+                lambda: KillEventFormatter.safe_get_player_profile(opponent),
+                lambda profile: history.set_opponent_org(opponent, org_from_details(profile[0]) or ORG_PENDING)
+            )
+
+    def fetch_update_info(self) -> Optional[dict]:
+        """Ask the update endpoint about newer versions; None if the check failed (runs off the GUI thread)"""
         try:
+            update_url = "https://starcitizentool.com/api/v1/check-update"
             headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
+                'User-Agent': self.user_agent,
+                'X-Client-ID': self.__client_id__,
+                'X-Client-Version': self.__version__
             }
             
-            url = f"https://robertsspaceindustries.com/citizens/{quote(username)}"
-            response = SESSION.get(url, timeout=10, headers=headers)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                profile_img = soup.select_one('.profile.left-col .inner.clearfix .thumb img')
-                
-                if profile_img and profile_img.get('src'):
-                    image_url = profile_img.get('src')
-                    if image_url.startswith('/'):
-                        image_url = f"https://robertsspaceindustries.com{image_url}"
-                    
-                    img_response = SESSION.get(image_url, timeout=10, headers=headers)
-                    if img_response.status_code == 200:
-                        pixmap = self.create_circular_pixmap_from_data(img_response.content)
-                        self.user_profile_image.setPixmap(pixmap)
-                        logging.info(f"Successfully loaded profile image for {username}")
-                        return
-                    else:
-                        logging.warning(f"Could not fetch image from {image_url}, status code: {img_response.status_code}")
-                else:
-                    logging.warning(f"Could not find profile image for user {username}")
-            else:
-                logging.warning(f"Failed to fetch profile page for {username}, status code: {response.status_code}")
-        
-        except Exception as e:
-            logging.error(f"Error fetching user image for {username}: {e}")
+            params = {
+                'version': self.__version__
+            }
 
-    def save_local_kills(self):
-        try:
-            with open(self.kills_local_file, 'w', encoding='utf-8') as f:
-                json.dump(self.local_kills, f, indent=4)
-            logging.info(f"Saved {len(self.local_kills)} kills to local JSON.")
+            logging.info(f"Checking for updates... Current version: {self.__version__}")
+            
+            response = self.api_client.get(update_url, headers=headers, params=params, timeout=10)
+            
+            if response.status_code != 200:
+                logging.warning(f"Update check failed with status code: {response.status_code}")
+                return None
+            data = response.json()
+            logging.info(f"Update check response: latest={data.get('latest_version')}, "
+                         f"minimum={data.get('minimum_required_version')}, available={data.get('update_available', False)}, "
+                         f"required={data.get('update_required', False)}, optional={data.get('update_optional', False)}")
+            return data
         except Exception as e:
-            logging.error(f"Failed to save local kills: {e}")
+            logging.error(f"Error checking for updates: {e}")
+            return None
 
     def check_for_updates(self, show_optional=False) -> None:
-         """Check for newer versions of the application with proper minimum version handling
-         
-         Args:
-             show_optional (bool): If True, shows optional update dialogs. If False, only shows required updates.
-         """
-         try:
-             update_url = "https://starcitizentool.com/api/v1/check-update"
-             headers = {
-                 'User-Agent': self.user_agent,
-                 'X-Client-ID': self.__client_id__,
-                 'X-Client-Version': self.__version__
-             }
-             
-             params = {
-                 'version': self.__version__
-             }
- 
-             logging.info(f"Checking for updates... Current version: {self.__version__}")
-             
-             response = requests.get(update_url, headers=headers, params=params, timeout=10)
-             
-             if response.status_code == 200:
-                 data = response.json()
-                 
-                 latest_version = data.get('latest_version')
-                 minimum_required_version = data.get('minimum_required_version')
-                 update_available = data.get('update_available', False)
-                 update_required = data.get('update_required', False)
-                 update_optional = data.get('update_optional', False)
-                 download_url = data.get('download_url', 'https://starcitizentool.com/download-sctool')
-                 
-                 logging.info(f"Update check response: latest={latest_version}, minimum={minimum_required_version}, "
-                             f"available={update_available}, required={update_required}, optional={update_optional}")
-                 
-                 if update_required:
-                     logging.info(f"Forced update required: {latest_version} (current: {self.__version__})")
-                     self.notify_forced_update(latest_version, minimum_required_version, download_url)
-                 elif update_optional and show_optional:
-                     logging.info(f"Optional update available: {latest_version} (current: {self.__version__})")
-                     self.notify_optional_update(latest_version, download_url)
-                 elif update_optional:
-                     logging.info(f"Optional update available but not displaying: {latest_version} (current: {self.__version__})")
-                 else:
-                     logging.info(f"No updates available. Current version: {self.__version__}, Latest: {latest_version}")
-             else:
-                 logging.warning(f"Update check failed with status code: {response.status_code}")
-         except Exception as e:
-             logging.error(f"Error checking for updates: {e}")
- 
+        """Check for newer versions of the application in the background with proper minimum version handling
+        
+        Args:
+            show_optional (bool): If True, shows optional update dialogs. If False, only shows required updates.
+        """
+        self.connectivity.run(
+            f"update_check:{self.__version__}", self.fetch_update_info,
+            lambda data: self._on_update_info(data, show_optional),
+            ttl=lambda data: UPDATE_CHECK_TTL_SECONDS if data else 0.0
+        )
+
+    def _on_update_info(self, data: Optional[dict], show_optional: bool) -> None:
+        if not data:
+            return
+        latest_version = data.get('latest_version')
+        minimum_required_version = data.get('minimum_required_version')
+        update_required = data.get('update_required', False)
+        update_optional = data.get('update_optional', False)
+        download_url = data.get('download_url', 'https://starcitizentool.com/download-sctool')
+        
+        if update_required:
+            logging.info(f"Forced update required: {latest_version} (current: {self.__version__})")
+            self.notify_forced_update(latest_version, minimum_required_version, download_url)
+        elif update_optional and show_optional:
+            logging.info(f"Optional update available: {latest_version} (current: {self.__version__})")
+            self.notify_optional_update(latest_version, download_url)
+        elif update_optional:
+            logging.info(f"Optional update available but not displaying: {latest_version} (current: {self.__version__})")
+        else:
+            logging.info(f"No updates available. Current version: {self.__version__}, Latest: {latest_version}")
+
     def notify_update(self, latest_version: str, download_url: str) -> None:
         update_message = (
             f"<p>A new version (<b>{latest_version}</b>) is available!</p>"
@@ -2278,51 +2649,25 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
 
     def check_for_updates_with_optional(self) -> None:
         """Enhanced version of check_for_updates that properly handles minimum version logic"""
-        try:
-            update_url = "https://starcitizentool.com/api/v1/check-update"
-            headers = {
-                'User-Agent': self.user_agent,
-                'X-Client-ID': self.__client_id__,
-                'X-Client-Version': self.__version__
-            }
-            
-            params = {
-                'version': self.__version__
-            }
+        self.connectivity.run(
+            f"update_check:{self.__version__}", self.fetch_update_info, self._on_manual_update_info,
+            ttl=lambda data: UPDATE_CHECK_TTL_SECONDS if data else 0.0, force=True
+        )
 
-            logging.info(f"Checking for updates... Current version: {self.__version__}")
-            
-            response = requests.get(update_url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                latest_version = data.get('latest_version')
-                minimum_required_version = data.get('minimum_required_version')
-                update_available = data.get('update_available', False)
-                update_required = data.get('update_required', False)
-                update_optional = data.get('update_optional', False)
-                download_url = data.get('download_url', 'https://starcitizentool.com/download-sctool')
-                
-                logging.info(f"Update check response: latest={latest_version}, minimum={minimum_required_version}, "
-                            f"available={update_available}, required={update_required}, optional={update_optional}")
-                
-                from utlity import show_forced_update_dialog, show_optional_update_dialog, show_up_to_date_dialog
-                
-                if update_required:
-                    show_forced_update_dialog(self, latest_version, minimum_required_version, download_url)
-                elif update_optional:
-                    show_optional_update_dialog(self, latest_version, download_url)
-                else:
-                    show_up_to_date_dialog(self, self.__version__)
-            else:
-                logging.warning(f"Update check failed with status code: {response.status_code}")
-                from utlity import show_update_check_failed_dialog
-                show_update_check_failed_dialog(self)
-        except Exception as e:
-            logging.error(f"Error checking for updates: {e}")
-            from utlity import show_update_check_failed_dialog
+    def _on_manual_update_info(self, data: Optional[dict]) -> None:
+        from utlity import (
+            show_forced_update_dialog, show_optional_update_dialog, show_up_to_date_dialog, show_update_check_failed_dialog
+        )
+        if not data:
             show_update_check_failed_dialog(self)
+            return
+        download_url = data.get('download_url', 'https://starcitizentool.com/download-sctool')
+        if data.get('update_required', False):
+            show_forced_update_dialog(self, data.get('latest_version'), data.get('minimum_required_version'), download_url)
+        elif data.get('update_optional', False):
+            show_optional_update_dialog(self, data.get('latest_version'), download_url)
+        else:
+            show_up_to_date_dialog(self, self.__version__)
 
     def on_ship_updated(self, ship: str) -> None:
         index = self.ship_combo.findText(ship)
@@ -2379,19 +2724,20 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         victim = payload.get('victim_name', '')
         current_game_mode = payload.get('game_mode', 'Unknown')
         local_key = f"death_{timestamp}::{victim}::{current_game_mode}"
+        readout = self.latest_card_readout(readout)
 
         if local_key in self.local_kills:
             self.show_temporary_popup("Death already in local JSON. Skipping API call.")
             return
 
-        self.local_kills[local_key] = {
-            "payload": payload,
-            "timestamp": timestamp,
-            "attacker": attacker,
-            "readout": readout,
-            "sent_to_api": False,
-            "event_type": "death"
-        }
+        self.local_kills[local_key] = new_kill_record("death", payload, timestamp, attacker, readout)
+        self.rendered_cards.put(local_key, readout)
+        # The ship combo still shows the ship the player died in; the thread's reset to No Ship is queued behind this
+        self.record_combat_event(
+            local_key, "death", timestamp, current_game_mode, self.ship_combo.currentText().strip(),
+            KillParser.format_weapon(payload.get('weapon', '')), KillParser.format_zone(payload.get('location', '')),
+            attacker
+        )
 
         self.latest_death_info = {
             "victim": victim,
@@ -2442,25 +2788,10 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 except Exception as e:
                     logging.error(f"Failed to enqueue Twitch death message: {e}")
         
-        self.save_local_kills()
+        self.save_local_kills(local_key)
         if self.send_to_api_checkbox.isChecked():
-            headers = {
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Cache-Control': 'no-cache',
-                'X-API-Key': self.api_key,
-                'User-Agent': self.user_agent,
-                'X-Client-ID': self.__client_id__,
-                'X-Client-Version': self.__version__
-            }
-
             deaths_endpoint = f"{self.api_endpoint.replace('/kills', '/deaths')}"
-            
-            verify_ssl = not getattr(self, 'disable_ssl_verification', False)
-            api_thread = ApiSenderThread(deaths_endpoint, headers, payload, local_key, verify_ssl, parent=self)
-            api_thread.apiResponse.connect(lambda msg: self.handle_api_response(msg, local_key, timestamp))
-            api_thread.start()
+            self.kill_outbox.enqueue(local_key, deaths_endpoint, payload, kind="death")
         else:
             logging.info("Send to API is disabled; death payload not sent.")
 
@@ -2522,11 +2853,22 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
 
         update_endpoint = f"{self.api_endpoint.replace('/kills', '')}/kills/update-clip"
 
-        try:
-            logging.debug(f"Sending clip update payload: {update_payload}")
+        logging.debug(f"Sending clip update payload: {update_payload}")
+        verify_ssl = not getattr(self, 'disable_ssl_verification', False)
+        self.api_pool.submit(
+            lambda: self.api_throttle.post(update_endpoint, json=update_payload, headers=headers, timeout=10, verify=verify_ssl),
+            lambda response, error: self._handle_clip_update_response(local_key, response, error)
+        )
 
-            verify_ssl = not getattr(self, 'disable_ssl_verification', False)
-            response = requests.post(update_endpoint, json=update_payload, headers=headers, timeout=10, verify=verify_ssl)
+    def _handle_clip_update_response(self, local_key: str, response: Optional[requests.Response], error: Optional[Exception]) -> None:
+        if error is not None:
+            if isinstance(error, requests.exceptions.RequestException):
+                logging.error(f"Network error updating API with clip URL: {error}")
+            else:
+                logging.error(f"Unexpected error updating API with clip URL: {error}")
+            return
+
+        try:
             logging.info(f"API response for clip update: {response.status_code} - {response.text}")
 
             resp_json = None
@@ -2545,12 +2887,12 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                     if 'duplicate' in str(message).lower() or resp_json.get('duplicate'):
                         logging.info(f"Clip update duplicate detected for kill {local_key}; marking as sent.")
                         self.local_kills[local_key]["clip_url_sent_to_api"] = True
-                        self.save_local_kills()
+                        self.save_local_kills(local_key)
                         return
 
                 logging.info(f"Successfully updated API with clip URL for kill {local_key}")
                 self.local_kills[local_key]["clip_url_sent_to_api"] = True
-                self.save_local_kills()
+                self.save_local_kills(local_key)
                 return
 
             if 400 <= response.status_code < 500:
@@ -2563,8 +2905,6 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 return
 
             logging.error(f"Server error updating API with clip URL. Status code: {response.status_code}, Response: {response.text}")
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Network error updating API with clip URL: {e}")
         except Exception as e:
             logging.error(f"Unexpected error updating API with clip URL: {e}")
 
@@ -2673,6 +3013,22 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 "QLabel { background-color: #F44336; border-radius: 4px; }"
             )
 
+    def update_api_delivery_status(self) -> None:
+        """Show the adaptive API concurrency and any rate-limit pause in the status bar"""
+        if not hasattr(self, 'api_delivery_label'):
+            return
+        stats = self.api_throttle.get_stats()
+        paused_for = stats['paused_for_seconds']
+        if paused_for > 0:
+            self.api_delivery_label.setText(f"API Throttled ({paused_for:.0f}s)")
+            color = "#FF9800"
+        else:
+            self.api_delivery_label.setText(f"API Parallel {stats['in_flight']}/{stats['limit']}")
+            color = "#4CAF50" if stats['limit'] >= self.api_throttle.max_limit else "#FFC107"
+        self.api_delivery_indicator.setStyleSheet(
+            f"QLabel {{ background-color: {color}; border-radius: 4px; }}"
+        )
+
     def update_twitch_indicator(self, is_connected: bool):
         if is_connected:
             self.twitch_indicator.setStyleSheet(
@@ -2758,32 +3114,13 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             painter.end()
             self.user_profile_image.setPixmap(pixmap)
             
-            default_image_url = "https://cdn.robertsspaceindustries.com/static/images/account/avatar_default_big.jpg"
-            QTimer.singleShot(500, lambda: self.fetch_default_image(default_image_url))
+            QTimer.singleShot(500, lambda: self.fetch_default_image(DEFAULT_IMAGE_URL))
         except Exception as e:
             logging.error(f"Error setting default user image: {e}")
             
     def fetch_default_image(self, url):
-        """Fetch the default profile image from URL"""
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                pixmap = QPixmap()
-                pixmap.loadFromData(response.content)
-                
-                circular_pixmap = QPixmap(64, 64)
-                circular_pixmap.fill(Qt.transparent)
-                painter = QPainter(circular_pixmap)
-                painter.setRenderHint(QPainter.Antialiasing)
-                path = QPainterPath()
-                path.addEllipse(2, 2, 60, 60)
-                painter.setClipPath(path)
-                painter.drawPixmap(0, 0, pixmap.scaled(64, 64, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
-                painter.end()
-                
-                self.user_profile_image.setPixmap(circular_pixmap)
-        except Exception as e:
-            logging.error(f"Error fetching default image: {e}")
+        """Request the default profile image; it is applied when the image loader delivers it"""
+        self._profile_image_key = self.image_loader.load_url(url, PRIORITY_COSMETIC)
     
     def closeEvent(self, event) -> None:
         if self.monitor_thread and self.monitor_thread.isRunning():
@@ -2835,6 +3172,17 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             except Exception:
                 pass
 
+        try:
+            get_profile_enricher().shutdown(wait=False)
+            get_profile_prefetcher().shutdown()
+            self.image_loader.shutdown()
+            self.kill_outbox.stop()
+            self.api_pool.shutdown()
+            if self.kill_backfill is not None:
+                self.kill_backfill.cancel()
+        except Exception as e:
+            logging.error(f"Error stopping profile enrichment workers: {e}")
+
         if hasattr(self, 'ship_combo'):
             self.ship_combo.setCurrentText("No Ship")
             logging.info("Reset ship selection to 'No Ship' on application close")
@@ -2842,6 +3190,10 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         self.clips = {}
         self.clip_groups = {}
         self.save_config()
+        if hasattr(self, 'game_overlay') and self.game_overlay:
+            self.game_overlay.flush_config()
+            logging.info(f"Overlay config saves: {json.dumps(self.game_overlay.get_config_save_stats())}")
+        flush_config_stores()
         
         if getattr(self, 'auto_clear_logs', False):
             try:
@@ -2926,14 +3278,9 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
         self.clips[local_key] = clip_url
         self.save_config()
 
-        readout = kill_data.get("readout", "")
+        readout = self.kill_readout(local_key)
         if readout:
-            readout_with_clip = readout.replace("</body>",
-                f'<div style="margin-top: 10px; text-align: center;">'
-                f'<a href="{clip_url}" style="color:#6441A4; text-decoration:none; font-weight:bold; '
-                f'padding:8px 16px; background-color:rgba(100, 65, 164, 0.2); border-radius:4px; '
-                f'border:1px solid #6441A4;" target="_blank">'
-                f'Watch Kill Clip</a></div></body>')
+            readout_with_clip = add_clip_link(readout, clip_url)
             
             if hasattr(self.kill_display, 'toHtml'):
                 text = self.kill_display.toHtml()
@@ -2945,17 +3292,21 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             logging.info(f"Added clip URL to kill display: {clip_url}")
 
             if local_key in self.local_kills:
-                self.local_kills[local_key]["readout"] = readout_with_clip
+                self.rendered_cards.put(local_key, readout_with_clip)
                 self.local_kills[local_key]["clip_url"] = clip_url
-                self.save_local_kills()
+                self.save_local_kills(local_key)
 
                 self.update_api_with_clip_url(local_key, clip_url)
 
     def create_circular_pixmap_from_data(self, image_data) -> QPixmap:
         """Create a circular pixmap from image data"""
+        pixmap = QPixmap()
+        pixmap.loadFromData(image_data)
+        return self.create_circular_pixmap(pixmap)
+
+    def create_circular_pixmap(self, pixmap: QPixmap) -> QPixmap:
+        """Create a circular 64px avatar from a loaded pixmap"""
         try:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
             pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             result = QPixmap(64, 64)
             result.fill(Qt.transparent)
@@ -3166,182 +3517,6 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 logging.info(f"Attempting API connection with endpoint: {getattr(self, 'api_endpoint', 'Not set')}")
                 logging.info(f"API key length: {len(new_api_key) if new_api_key else 0} characters")
                 logging.info(f"API key prefix: {new_api_key[:8] + '...' if new_api_key and len(new_api_key) > 8 else 'Too short'}")
-                
-                if not self.ping_api_with_retry():
-                    error_details = {
-                        "api_endpoint": getattr(self, 'api_endpoint', 'Not set'),
-                        "api_key_provided": bool(new_api_key),
-                        "api_key_length": len(new_api_key) if new_api_key else 0,
-                        "user_agent": getattr(self, 'user_agent', 'Not set'),
-                        "client_id": getattr(self, '__client_id__', 'Not set'),
-                        "client_version": getattr(self, '__version__', 'Not set'),
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    
-                    logging.error("API CONNECTION FAILURE - Please share this log with support:")
-                    logging.error(f"Error details: {json.dumps(error_details, indent=2)}")
-                    
-                    try:
-                        import socket
-                        import urllib.parse
-                        
-                        if hasattr(self, 'api_endpoint') and self.api_endpoint:
-                            parsed_url = urllib.parse.urlparse(self.api_endpoint)
-                            hostname = parsed_url.hostname
-                            port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
-                            
-                            logging.info(f"Testing network connectivity to {hostname}:{port}")
-                            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                            sock.settimeout(5)
-                            result = sock.connect_ex((hostname, port))
-                            sock.close()
-                            
-                            if result == 0:
-                                logging.info("Network connectivity to API host: SUCCESS")
-                            else:
-                                logging.error(f"Network connectivity to API host: FAILED (error code: {result})")
-                        
-                    except Exception as network_error:
-                        logging.error(f"Network diagnostic failed: {network_error}")
-                    
-                    if hasattr(self, 'ping_api'):
-                        logging.info("ping_api method is available")
-                    else:
-                        logging.error("ping_api method is not implemented")
-                    
-                    logging.info("Running detailed API key diagnostics...")
-                    api_test_results = self.test_api_key_validity()
-                    
-                    logging.error("API KEY TEST RESULTS:")
-                    for key, value in api_test_results.items():
-                        logging.error(f"  {key}: {value}")
-                    
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle("API Connection Error")
-                    msg_box.setIcon(QMessageBox.Critical)
-                    
-                    error_text = "Unable to connect to the API."
-                    
-                    is_cloudflare_issue = (api_test_results.get("status_code") == 403 and 
-                                         any("cloudflare" in rec.lower() for rec in api_test_results.get("recommendations", [])))
-                    
-                    is_ssl_issue = any("ssl" in rec.lower() or "certificate" in rec.lower() for rec in api_test_results.get("recommendations", []))
-                    
-                    if is_ssl_issue:
-                        error_text = "🔒 SSL CERTIFICATE VERIFICATION FAILED\n\n"
-                        error_text += "This is a Windows/system configuration issue!\n"
-                        error_text += "Most commonly caused by incorrect system clock."
-                    elif is_cloudflare_issue:
-                        error_text = "🛡️ CLOUDFLARE SECURITY BLOCKING ACCESS\n\n"
-                        error_text += "This is NOT an API key problem!\n"
-                        error_text += "Cloudflare's security system is blocking your requests."
-                    elif api_test_results.get("status_code"):
-                        error_text += f"\n\nServer returned status code: {api_test_results['status_code']}"
-                        
-                    if api_test_results.get("error_message") and not is_cloudflare_issue and not is_ssl_issue:
-                        error_text += f"\nError: {api_test_results['error_message']}"
-                    
-                    msg_box.setText(error_text)
-                    
-                    if is_ssl_issue:
-                        error_msg = api_test_results.get("error_message", "").lower()
-                        if "not yet valid" in error_msg:
-                            detail_text = "🔒 SSL CERTIFICATE ERROR: 'Not Yet Valid'\n\n"
-                            detail_text += "🚨 THIS IS ALMOST ALWAYS A SYSTEM CLOCK ISSUE!\n\n"
-                            detail_text += "COMMON ON:\n"
-                            detail_text += "• Unactivated Windows (cannot update certificates)\n"
-                            detail_text += "• Windows 11 systems\n"
-                            detail_text += "• Systems with incorrect time zones\n\n"
-                            detail_text += "IMMEDIATE FIXES (try in order):\n"
-                            detail_text += "1. Right-click taskbar clock → 'Adjust date/time'\n"
-                            detail_text += "2. Enable 'Set time automatically'\n"
-                            detail_text += "3. Enable 'Set time zone automatically'\n"
-                            detail_text += "4. Click 'Sync now' to force synchronization\n"
-                            detail_text += "5. If Windows is unactivated: Activate Windows\n"
-                            detail_text += "6. Restart computer after fixing time\n\n"
-                        else:
-                            detail_text = "🔒 SSL CERTIFICATE VERIFICATION ERROR\n\n"
-                            detail_text += "MOST COMMON CAUSE:\n"
-                            detail_text += "• System clock is incorrect (check Windows date/time)\n\n"
-                            detail_text += "OTHER POSSIBLE CAUSES:\n"
-                            detail_text += "• Outdated Windows certificate store\n"
-                            detail_text += "• Corporate firewall interference\n"
-                            detail_text += "• Antivirus SSL scanning\n\n"
-                            detail_text += "SOLUTIONS (try in order):\n"
-                            detail_text += "1. Right-click taskbar clock → 'Adjust date/time'\n"
-                            detail_text += "2. Enable 'Set time automatically' in Windows Settings\n"
-                            detail_text += "3. Run Windows Update to update certificates\n"
-                            detail_text += "4. Temporarily disable antivirus SSL scanning\n"
-                            detail_text += "5. Try from mobile hotspot to test network\n"
-                            detail_text += "6. Contact IT if on corporate network\n\n"
-                    elif is_cloudflare_issue:
-                        detail_text = "🚨 CLOUDFLARE SECURITY CHALLENGE DETECTED\n\n"
-                        detail_text += "WHAT THIS MEANS:\n"
-                        detail_text += "• Your API key is probably fine\n"
-                        detail_text += "• Cloudflare thinks your requests look suspicious\n"
-                        detail_text += "• This affects some users but not others\n"
-                        detail_text += "• It's based on location, IP reputation, etc.\n\n"
-                        detail_text += "SOLUTIONS (try in order):\n"
-                        detail_text += "1. Try using a VPN from a different country\n"
-                        detail_text += "2. Wait 30 minutes and try again\n"
-                        detail_text += "3. Restart your router to get a new IP address\n"
-                        detail_text += "4. Contact support with this diagnostic report\n\n"
-                        detail_text += "NOTE: The developer needs to whitelist your IP or adjust Cloudflare settings.\n"
-                    else:
-                        detail_text = "TROUBLESHOOTING STEPS:\n\n"
-                        if api_test_results.get("recommendations"):
-                            for i, rec in enumerate(api_test_results["recommendations"], 1):
-                                detail_text += f"{i}. {rec}\n"
-                        else:
-                            detail_text += "1. Check your network connection\n"
-                            detail_text += "2. Verify your API key at https://starcitizentool.com/profile\n"
-                            detail_text += "3. Try again in a few minutes\n"
-                    
-                    detail_text += "\nDIAGNOSTIC INFORMATION:\n"
-                    detail_text += f"• Network connectivity to server: ✓ SUCCESS\n"
-                    detail_text += f"• API key format valid: {'✓' if api_test_results.get('api_key_format_valid') else '✗'}\n"
-                    detail_text += f"• API key length: {len(getattr(self, 'api_key', ''))}\n"
-                    if api_test_results.get("status_code"):
-                        detail_text += f"• Server response code: {api_test_results['status_code']}\n"
-                    
-                    detail_text += "\nUse the diagnostic buttons below to get more detailed information."
-                    
-                    msg_box.setDetailedText(detail_text)
-                    
-                    ok_btn = msg_box.addButton("OK", QMessageBox.AcceptRole)
-                    diagnostic_btn = msg_box.addButton("Copy Quick Diagnostic", QMessageBox.ActionRole)
-                    full_debug_btn = msg_box.addButton("Export Debug Info", QMessageBox.ActionRole)
-                    
-                    msg_box.setDefaultButton(ok_btn)
-                    msg_box.exec_()
-                    
-                    clicked_btn = msg_box.clickedButton()
-                    if clicked_btn == diagnostic_btn:
-                        try:
-                            diagnostic_report = self.generate_api_diagnostic_report()
-                            clipboard = QApplication.clipboard()
-                            clipboard.setText(diagnostic_report)
-                            
-                            info_box = QMessageBox(self)
-                            info_box.setWindowTitle("Quick Diagnostic Copied")
-                            info_box.setIcon(QMessageBox.Information)
-                            info_box.setText(
-                                "Quick diagnostic information has been copied to your clipboard.\n\n"
-                                "Paste this when reporting the issue for faster troubleshooting."
-                            )
-                            info_box.exec_()
-                            
-                        except Exception as e:
-                            logging.error(f"Failed to generate diagnostic report: {e}")
-                            self.showCustomMessageBox("Error", "Failed to generate diagnostic report.")
-                    
-                    elif clicked_btn == full_debug_btn:
-                        self.export_debug_logs()
-                    
-                    return
-                
-                logging.info("API connection successful")
-                self.update_api_status()
 
             if self.twitch_enabled and self.clip_creation_enabled and not self.twitch_channel_input.text().strip():
                 QMessageBox.warning(self, "Twitch Integration", t("Please enter a Twitch channel name in the Twitch settings to enable clip creation and chat messages."))
@@ -3350,15 +3525,10 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 QMessageBox.warning(self, "Input Error", t("Please enter a valid path to your Game.log file."))
                 return
 
-            killer_ship = "No Ship"
-            if os.path.isfile(CONFIG_FILE):
-                try:
-                    with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                    killer_ship = config.get('killer_ship', 'No Ship')
-                except Exception as e:
-                    logging.error(f"Failed to load config for killer_ship: {e}")
-                    killer_ship = "No Ship"
+            if self.send_to_api_checkbox.isChecked():
+                self.check_api_connection(report_failure=True)
+
+            killer_ship = self.config_store.get('killer_ship', 'No Ship')
 
             self.monitor_thread = TailThread(new_log_path, CONFIG_FILE, parent=self)
             self.monitor_thread.current_attacker_ship = killer_ship
@@ -3371,6 +3541,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             self.monitor_thread.player_registered.connect(self.on_player_registered)
             self.monitor_thread.game_mode_changed.connect(self.on_game_mode_changed)
             self.monitor_thread.name_mismatch_detected.connect(self.on_name_mismatch_detected)
+            self.monitor_thread.card_enriched.connect(self.on_card_enriched)
             self.monitor_thread.start()
             self.on_ship_updated(killer_ship)
             self.start_button.setText(t("STOP MONITORING"))
@@ -3418,26 +3589,28 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
             else "Unknown"
         )
         local_key = f"{timestamp}::{victim}::{current_game_mode}"
+        readout = self.latest_card_readout(readout)
 
         if local_key in self.local_kills:
             self.show_temporary_popup("Kill already in local JSON. Skipping API call.")
             return
 
-        self.local_kills[local_key] = {
-            "payload": payload,
-            "timestamp": timestamp,
-            "attacker": attacker,
-            "readout": readout,
-            "sent_to_api": False,
-            "local_key": local_key
-        }
-        self.save_local_kills()
+        is_in_ship = bool(self.monitor_thread and self.monitor_thread.is_in_ship)
+        self.local_kills[local_key] = new_kill_record(
+            "kill", payload, timestamp, attacker, readout, local_key=local_key, is_in_ship=is_in_ship
+        )
+        self.rendered_cards.put(local_key, readout)
+        self.save_local_kills(local_key)
+        self.record_combat_event(
+            local_key, "kill", timestamp, current_game_mode, payload.get("killer_ship", ""),
+            KillParser.format_weapon(data.get('weapon', '')), KillParser.format_zone(data.get('zone', '')),
+            data.get('victim', '')
+        )
 
         kill_data = {
             "local_key": local_key,
             "victim": victim,
-            "timestamp": timestamp,
-            "readout": readout
+            "timestamp": timestamp
         }
 
         self.latest_kill_info = {
@@ -3506,17 +3679,7 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 logging.error(f"Error executing button automation: {e}")
 
         if self.send_to_api_checkbox.isChecked():
-            headers = {
-                'Content-Type': 'application/json',
-                'X-API-Key': self.api_key,
-                'User-Agent': self.user_agent,
-                'X-Client-ID': self.__client_id__,
-                'X-Client-Version': self.__version__
-            }
-            verify_ssl = not getattr(self, 'disable_ssl_verification', False)
-            api_thread = ApiSenderThread(self.api_endpoint, headers, payload, local_key, verify_ssl, parent=self)
-            api_thread.apiResponse.connect(lambda msg: self.handle_api_response(msg, local_key, timestamp))
-            api_thread.start()
+            self.kill_outbox.enqueue(local_key, self.api_endpoint, payload, kind="kill")
         else:
             logging.info("Send to API is disabled; kill payload not sent.")
 
@@ -3910,6 +4073,8 @@ class KillLoggerGUI(QMainWindow, TranslationMixin):
                 self.update_kill_death_stats()
                 
                 self.local_kills = {}
+                self.rendered_cards.clear()
+                self.kill_store.clear()
                 
                 logging.info("Current session logs cleared by user")
                 self.append_kill_readout(f"<div style='color: #4CAF50; font-weight: bold; margin: 10px 0;'>🗑️ {t('Logs cleared successfully')}</div>")
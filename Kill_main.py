@@ -7,8 +7,6 @@ SCTool Killfeed
 import sys
 import logging
 import atexit
-import os
-import json
 from PyQt5.QtWidgets import QApplication
 from responsive_ui import enable_high_dpi_support
 
@@ -31,12 +29,11 @@ def should_start_minimized():
     """Check if the app should start minimized (when starting with Windows and minimize to tray is enabled)"""
     try:
         from Kill_form import get_appdata_paths
+        from config_service import get_config_store
         config_file, _, _ = get_appdata_paths()
         
-        if os.path.exists(config_file):
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                return config.get('start_with_system', False) and config.get('minimize_to_tray', False)
+        config = get_config_store(config_file)
+        return config.get('start_with_system', False) and config.get('minimize_to_tray', False)
     except Exception as e:
         logging.error(f"Error checking if app should start minimized: {e}")
     
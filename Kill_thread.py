@@ -5,12 +5,10 @@ import re
 import base64
 import requests
 import logging
-import json
 import time
-from bs4 import BeautifulSoup
 from datetime import datetime
 from urllib.parse import quote
-from typing import Optional, Dict, Any, List
+from typing import Optional, Any, List, Tuple
 
 from PyQt5.QtCore import pyqtSignal, QThread, QDir, QTimer, Qt
 from PyQt5.QtWidgets import (
@@ -25,6 +23,8 @@ from language_manager import t
 
 from Registered_kill import format_registered_kill
 from vehicle_event_correlator import VehicleEventCorrelator
+from profile_prefetcher import get_profile_prefetcher
+from config_service import get_config_store
 
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": DESKTOP_CLIENT_USER_AGENT})
@@ -167,6 +167,7 @@ class TailThread(QThread):
     death_payload_ready = pyqtSignal(dict, str, str, str)
     ship_updated = pyqtSignal(str)
     name_mismatch_detected = pyqtSignal(str, str)
+    card_enriched = pyqtSignal(str, str)
 
     def __init__(self, file_path: str, config_file: Optional[str] = None, callback=None, parent=None) -> None:
         super().__init__(parent)
@@ -206,55 +207,12 @@ class TailThread(QThread):
             self.ship_updated.emit("No Ship")
 
     def update_config_killer_ship(self, ship: str) -> None:
-        if self.config_file and os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if not content:
-                        logging.debug(f"Config file {self.config_file} is empty; using default config")
-                        config = {}
-                    else:
-                        try:
-                            config = json.loads(content)
-                        except json.JSONDecodeError as e:
-                            logging.error(f"Error parsing JSON config at {self.config_file}: {e}")
-                            config = {}
-            except Exception as e:
-                logging.error(f"Error reading config file {self.config_file}: {e}")
-                config = {}
-            config["killer_ship"] = ship
-            try:
-                with open(self.config_file, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=4)
-                logging.info(f"Updated config with killer_ship: {ship}")
-            except Exception as e:
-                logging.error(f"Error saving config with killer_ship: {e}")
+        if self.config_file and get_config_store(self.config_file).set("killer_ship", ship):
+            logging.info(f"Updated config with killer_ship: {ship}")
 
     def clear_config_killer_ship(self) -> None:
-        if self.config_file and os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if not content:
-                        logging.debug(f"Config file {self.config_file} is empty when clearing killer_ship; using default config")
-                        config = {}
-                    else:
-                        try:
-                            config = json.loads(content)
-                        except json.JSONDecodeError as e:
-                            logging.error(f"Error parsing JSON config for clearing killer_ship at {self.config_file}: {e}")
-                            config = {}
-            except Exception as e:
-                logging.error(f"Error reading config for clearing killer_ship: {e}")
-                config = {}
-            if "killer_ship" in config:
-                del config["killer_ship"]
-            try:
-                with open(self.config_file, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=4)
-                logging.info("Cleared killer_ship from config.")
-            except Exception as e:
-                logging.error(f"Error saving config while clearing killer_ship: {e}")
+        if self.config_file and get_config_store(self.config_file).remove("killer_ship"):
+            logging.info("Cleared killer_ship from config.")
 
     def reconstruct_ship_history(self, f) -> None:
         """Reconstruct ship history from the beginning of the log file to get current ship state"""
@@ -586,11 +544,22 @@ class TailThread(QThread):
         if kill_match:
             self.handle_kill_event(line, kill_match)
 
+    def prefetch_players(self, *names: str) -> None:
+        """Offer human players other than the registered user to the profile prefetcher"""
+        prefetcher = get_profile_prefetcher()
+        registered = self.registered_user.strip().lower() if self.registered_user else ""
+        for name in names:
+            name = (name or "").strip()
+            if name and name.lower() not in (registered, "unknown") and not KillParser.is_npc(name):
+                prefetcher.offer(name)
+
     def handle_correlated_vehicle_kill(self, event: dict) -> None:
         """Handle events from vehicle correlation system"""
         if not self.registered_user:
             return
         
+        self.prefetch_players(event.get('destroyer', ''), event.get('attacker', ''), event.get('victim', ''), event.get('pilot', ''))
+        
         event_type = event.get('event_type', 'unknown')
         
         if event_type == 'vehicle_destruction':
@@ -694,7 +663,8 @@ class TailThread(QThread):
                 
                 captured_game_mode = self.last_game_mode if self.last_game_mode and self.last_game_mode != "Unknown" else "Unknown"
                 readout, payload = format_registered_kill(
-                    synthetic_log_line, fake_data, self.registered_user, timestamp, captured_game_mode, success=True
+                    synthetic_log_line, fake_data, self.registered_user, timestamp, captured_game_mode, success=True,
+                    on_enriched=self.card_enriched.emit
                 )
                 self.kill_detected.emit(readout, attacker)
                 self.payload_ready.emit(payload, timestamp, attacker, readout)
@@ -723,7 +693,10 @@ class TailThread(QThread):
                 }
                 
                 captured_game_mode = self.last_game_mode if self.last_game_mode and self.last_game_mode != "Unknown" else "Unknown"
-                readout = format_death_kill(synthetic_log_line, fake_data, self.registered_user, timestamp, captured_game_mode)
+                readout = format_death_kill(
+                    synthetic_log_line, fake_data, self.registered_user, timestamp, captured_game_mode,
+                    on_enriched=self.card_enriched.emit
+                )
                 self.death_detected.emit(readout, victim)
                 
                 death_payload = {
@@ -828,6 +801,8 @@ class TailThread(QThread):
         victim = data.get('victim', '').strip()
         attacker = data.get('attacker', '').strip()
 
+        self.prefetch_players(victim, attacker)
+
         if data.get("damage_type", "").lower() == "vehicledestruction":
             logging.debug(f"Skipping vehicledestruction event - will be handled by vehicle correlator: {victim} killed by {attacker}")
             return
@@ -845,7 +820,10 @@ class TailThread(QThread):
             try:
                 from Death_kill import format_death_kill
                 captured_game_mode = self.last_game_mode if self.last_game_mode and self.last_game_mode != "Unknown" else "Unknown"
-                readout = format_death_kill(line, data, self.registered_user, display_timestamp, captured_game_mode)
+                readout = format_death_kill(
+                    line, data, self.registered_user, display_timestamp, captured_game_mode,
+                    on_enriched=self.card_enriched.emit
+                )
                 self.death_detected.emit(readout, victim)
                 
                 VEHICLE_GAME_MODES = ['Tonk Royale', 'Tonk Royale Free For All', 'Free Flight', 'Squadron Battle', 'Vehicle Kill Confirmed', 'Duel']
@@ -867,7 +845,8 @@ class TailThread(QThread):
         if self.registered_user and attacker.lower() == self.registered_user.strip().lower():
             try:
                 readout, payload = format_registered_kill(
-                    line, data, self.registered_user, full_timestamp, captured_game_mode, success=True, is_in_ship=self.is_in_ship
+                    line, data, self.registered_user, full_timestamp, captured_game_mode, success=True, is_in_ship=self.is_in_ship,
+                    on_enriched=self.card_enriched.emit
                 )
                 self.kill_detected.emit(readout, attacker)
                 self.payload_ready.emit(payload, full_timestamp, attacker, readout)
@@ -880,7 +859,10 @@ class TailThread(QThread):
         if self.registered_user and victim.lower() == self.registered_user.strip().lower():
             try:
                 from Death_kill import format_death_kill
-                readout = format_death_kill(line, data, self.registered_user, full_timestamp, captured_game_mode)
+                readout = format_death_kill(
+                    line, data, self.registered_user, full_timestamp, captured_game_mode,
+                    on_enriched=self.card_enriched.emit
+                )
                 self.death_detected.emit(readout, victim)
 
                 death_payload = {
@@ -1083,62 +1065,31 @@ class RescanThread(QThread):
     def stop(self) -> None:
         self._stop_event = True
 
-class ApiSenderThread(QThread):
-    apiResponse = pyqtSignal(str, object)
+def interpret_api_result(status_code: int, data_resp: Any, text: str = "") -> Optional[Tuple[str, Any]]:
+    """
+    Map a kills/deaths API result to the (message, data) reported to the UI.
 
-    def __init__(self, api_endpoint: str, headers: Dict[str, str], payload: dict, local_key: str, verify_ssl: bool = True, parent: Optional[Any] = None) -> None:
-        super().__init__(parent)
-        self.api_endpoint = api_endpoint
-        self.headers = headers
-        self.payload = payload
-        self.local_key = local_key
-        self.verify_ssl = verify_ssl
-        self.retry_count = 0
-        self.max_retries = 5
-        self.backoff = 1
+    Every 2xx counts as delivered (data_resp is None when the body was not
+    JSON); 3xx and 4xx other than 429 are final rejections. Returns None for
+    server errors and throttling, which are worth retrying.
+    """
+    if 200 <= status_code < 300:
+        if isinstance(data_resp, dict):
+            if "duplicate" in str(data_resp.get("message", "")).lower():
+                return "Duplicate kill. Not logged (server).", data_resp
+            if data_resp.get("message") == "NPC not logged":
+                return "NPC kill not logged.", data_resp
+        return "Kill logged successfully.", data_resp
+    if 300 <= status_code < 500 and status_code != 429:
+        return f"Failed to log kill: {status_code} - {text}", {}
+    return None
 
-    def run(self) -> None:
-        while self.retry_count < self.max_retries:
-            try:
-                if not self.verify_ssl:
-                    import urllib3
-                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                
-                resp = requests.post(self.api_endpoint, headers=self.headers, json=self.payload, timeout=10, verify=self.verify_ssl)
-                if resp.status_code == 201:
-                    data_resp = resp.json()
-                    if isinstance(data_resp, dict):
-                        server_msg = data_resp.get("message", "")
-                        if "duplicate" in server_msg.lower():
-                            self.apiResponse.emit("Duplicate kill. Not logged (server).", data_resp)
-                        else:
-                            self.apiResponse.emit("Kill logged successfully.", data_resp)
-                    else:
-                        self.apiResponse.emit("Kill logged successfully.", data_resp)
-                    return
-                elif resp.status_code == 200:
-                    data_resp = resp.json()
-                    if isinstance(data_resp, dict):
-                        if data_resp.get("message") == "NPC not logged":
-                            self.apiResponse.emit("NPC kill not logged.", data_resp)
-                        else:
-                            self.apiResponse.emit("Kill logged successfully.", data_resp)
-                    else:
-                        self.apiResponse.emit("Kill logged successfully.", data_resp)
-                    return
-                elif 400 <= resp.status_code < 500:
-                    error_text = f"Failed to log kill: {resp.status_code} - {resp.text}"
-                    self.apiResponse.emit(error_text, {})
-                    return
-                else:
-                    raise requests.exceptions.HTTPError(f"Server error: {resp.status_code}")
-            except requests.exceptions.RequestException as e:
-                self.retry_count += 1
-                error_text = f"API request failed (Attempt {self.retry_count}/{self.max_retries}): {e}"
-                self.apiResponse.emit(error_text, {})
-                if self.retry_count >= self.max_retries:
-                    break
-                time.sleep(self.backoff)
-                self.backoff *= 2
-        
-        self.apiResponse.emit("API request failed after maximum retries.", {})
\ No newline at end of file
+def interpret_api_response(resp: requests.Response) -> Optional[Tuple[str, Any]]:
+    """interpret_api_result for a single kills/deaths response, reading the JSON body best-effort"""
+    data_resp = None
+    if 200 <= resp.status_code < 300:
+        try:
+            data_resp = resp.json()
+        except ValueError:
+            logging.warning(f"API answered {resp.status_code} without a JSON body")
+    return interpret_api_result(resp.status_code, data_resp, resp.text)
@@ -1,6 +1,6 @@
 # Registered_kill.py
 
-from typing import Dict, Tuple, Any
+from typing import Dict, Tuple, Any, Callable, Optional
 from kill_event_formatter import RegisteredKillFormatter
 
 
@@ -11,7 +11,10 @@ def format_registered_kill(
     full_timestamp: str,
     last_game_mode: str,
     success: bool = True,
-    is_in_ship: bool = False
+    is_in_ship: bool = False,
+    on_enriched: Optional[Callable[[str, str], None]] = None,
+    cached_only: bool = False,
+    card_id: Optional[str] = None
 ) -> Tuple[str, Dict[str, Any]]:
     """
     Format a registered kill event using the new formatter system.
@@ -24,6 +27,10 @@ def format_registered_kill(
         last_game_mode: Last known game mode
         success: Whether the kill was successful
         is_in_ship: Whether the player was in a ship at the time of the kill
+        on_enriched: If given, render immediately with cached/placeholder profile data
+            and call on_enriched(card_id, readout) once the profile has been fetched
+        cached_only: Render from cached profile data only, without fetching anything
+        card_id: DOM id to keep on a re-rendered card (used with cached_only)
         
     Returns:
         Tuple of (HTML readout, payload dictionary)
@@ -36,5 +43,8 @@ def format_registered_kill(
         full_timestamp=full_timestamp,
         last_game_mode=last_game_mode,
         success=success,
-        is_in_ship=is_in_ship
+        is_in_ship=is_in_ship,
+        on_enriched=on_enriched,
+        cached_only=cached_only,
+        card_id=card_id
     )
\ No newline at end of file
@@ -0,0 +1,64 @@
+# api_client.py
+
+import logging
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from kill_parser import VERSION, DESKTOP_CLIENT_USER_AGENT
+
+CLIENT_ID = "kill_logger_client"
+POOL_SIZE = 8
+CONNECT_RETRIES = 2
+DEFAULT_TIMEOUT = 10
+
+
+class ApiClient:
+    """
+    Pooled keep-alive HTTP client for the starcitizentool.com API.
+
+    One requests.Session is shared by every API call so kills, pings and clip
+    updates reuse open TCP/TLS connections instead of handshaking per request.
+    The adapter only retries failed connection attempts (nothing has reached
+    the server yet), so it never duplicates a POST. Only the client
+    identification headers are set on the session; the API key is passed with
+    each API call, so it never reaches the update server or a redirect target.
+    """
+
+    def __init__(self, pool_size: int = POOL_SIZE, connect_retries: int = CONNECT_RETRIES):
+        self.session = requests.Session()
+        retry = Retry(total=connect_retries, connect=connect_retries, read=0, status=0, other=0,
+                      backoff_factor=0.3, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            'User-Agent': DESKTOP_CLIENT_USER_AGENT,
+            'X-Client-ID': CLIENT_ID,
+            'X-Client-Version': VERSION,
+        })
+        self.logger = logging.getLogger(__name__)
+
+    def configure(self, user_agent: Optional[str] = None) -> None:
+        """Update the User-Agent sent with every request"""
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+
+    def request(self, method: str, url: str, timeout: float = DEFAULT_TIMEOUT, **kwargs) -> requests.Response:
+        return self.session.request(method, url, timeout=timeout, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+
+_api_client = ApiClient()
+
+
+def get_api_client() -> ApiClient:
+    """Get the global starcitizentool API client"""
+    return _api_client
@@ -0,0 +1,338 @@
+# api_diagnostics.py
+
+import os
+import ssl
+import time
+import base64
+import socket
+import logging
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from urllib.parse import unquote, urlparse
+
+import certifi
+from requests.utils import get_environ_proxies, select_proxy
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QApplication, QDialog, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton, QVBoxLayout
+
+from language_manager import t
+
+DIAGNOSTICS_DEADLINE_SECONDS = 15.0
+PROBE_TIMEOUT_SECONDS = 10.0
+BODY_PREVIEW_BYTES = 4096
+
+TIMING_LABELS = (
+    ('dns_ms', 'dns'),
+    ('connect_ms', 'connect'),
+    ('proxy_tunnel_ms', 'proxy tunnel'),
+    ('tls_ms', 'tls'),
+    ('first_byte_ms', 'first byte'),
+    ('total_ms', 'total'),
+)
+
+
+def _elapsed_ms(since: float) -> float:
+    return round((time.perf_counter() - since) * 1000, 1)
+
+
+def _open_connection(hostname: str, port: int, timeout: float, timings: Dict[str, float]) -> socket.socket:
+    """Resolve and connect to hostname:port, recording dns_ms and connect_ms"""
+    started = time.perf_counter()
+    addresses = socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+    timings['dns_ms'] = _elapsed_ms(started)
+    last_error: Optional[OSError] = None
+    for family, sock_type, proto, _, address in addresses:
+        sock = socket.socket(family, sock_type, proto)
+        sock.settimeout(timeout)
+        started = time.perf_counter()
+        try:
+            sock.connect(address)
+        except OSError as e:
+            last_error = e
+            sock.close()
+            continue
+        timings['connect_ms'] = _elapsed_ms(started)
+        return sock
+    raise last_error or OSError(f"No addresses found for {hostname}")
+
+
+def ca_bundle() -> str:
+    """CA bundle the requests-based API client verifies against (REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE, else certifi)"""
+    return os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE') or certifi.where()
+
+
+def proxy_for(url: str) -> Optional[str]:
+    """Proxy requests would use for url from the environment (HTTP(S)_PROXY, NO_PROXY), or None"""
+    return select_proxy(url, get_environ_proxies(url))
+
+
+def _open_tunnel(sock: socket.socket, hostname: str, port: int, headers: Dict[str, str],
+                 timings: Dict[str, float]) -> None:
+    """CONNECT through an HTTP proxy to hostname:port, recording proxy_tunnel_ms"""
+    started = time.perf_counter()
+    lines = [f"CONNECT {hostname}:{port} HTTP/1.1", f"Host: {hostname}:{port}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+    response = http.client.HTTPResponse(sock, method="CONNECT")
+    response.begin()
+    timings['proxy_tunnel_ms'] = _elapsed_ms(started)
+    if response.status != 200:
+        raise OSError(f"Proxy CONNECT to {hostname}:{port} failed: {response.status} {response.reason}")
+
+
+def probe_tcp(hostname: str, port: int, timeout: float = PROBE_TIMEOUT_SECONDS) -> dict:
+    """DNS lookup and TCP connect to hostname:port with their timings"""
+    timings: Dict[str, float] = {}
+    result = {"hostname": hostname, "port": port, "timings": timings}
+    try:
+        sock = _open_connection(hostname, port, timeout, timings)
+        result["address"] = sock.getpeername()[0]
+        sock.close()
+        result["socket_connection"] = "SUCCESS"
+    except OSError as e:
+        result["socket_connection"] = f"FAILED ({e})"
+    return result
+
+
+def timed_get(url: str, headers: Optional[Dict[str, str]] = None, verify: bool = True,
+              timeout: float = PROBE_TIMEOUT_SECONDS) -> dict:
+    """
+    GET url on a fresh connection and time each phase.
+
+    Takes the same network path as the requests-based API client: the proxy
+    from the environment (tunnelled with CONNECT for https) and its CA bundle.
+    Returns status_code, reason, headers, a text preview of the body, the
+    proxy used (scheme://host:port, or None) and timings (dns_ms and connect_ms to the host or
+    proxy, proxy_tunnel_ms, tls_ms for https, first_byte_ms from sending the
+    request to the response headers, total_ms). Network errors propagate.
+    """
+    parsed = urlparse(url)
+    secure = parsed.scheme == 'https'
+    hostname = parsed.hostname or ""
+    port = parsed.port or (443 if secure else 80)
+    path = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+    headers = dict(headers or {})
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+
+    proxy = proxy_for(url)
+    proxy_headers: Dict[str, str] = {}
+    if proxy:
+        proxy_url = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+        # Reported without any credentials
+        proxy = f"{proxy_url.scheme}://{proxy_url.hostname}:{proxy_url.port or 80}"
+        if proxy_url.scheme != 'http':
+            raise OSError(f"Unsupported proxy scheme for diagnostics: {proxy_url.scheme}")
+        if proxy_url.username:
+            credentials = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+            proxy_headers['Proxy-Authorization'] = "Basic " + base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+        sock = _open_connection(proxy_url.hostname or "", proxy_url.port or 80, timeout, timings)
+    else:
+        sock = _open_connection(hostname, port, timeout, timings)
+    try:
+        if secure:
+            if proxy:
+                _open_tunnel(sock, hostname, port, proxy_headers, timings)
+            context = ssl.create_default_context(cafile=ca_bundle())
+            if not verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            tls_started = time.perf_counter()
+            sock = context.wrap_socket(sock, server_hostname=hostname)
+            timings['tls_ms'] = _elapsed_ms(tls_started)
+            connection = http.client.HTTPSConnection(hostname, port, timeout=timeout)
+        else:
+            connection = http.client.HTTPConnection(hostname, port, timeout=timeout)
+            if proxy:
+                # Plain HTTP goes to the proxy with the absolute URL
+                path = url
+                headers.update(proxy_headers)
+        connection.sock = sock
+
+        request_started = time.perf_counter()
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        timings['first_byte_ms'] = _elapsed_ms(request_started)
+        body = response.read(BODY_PREVIEW_BYTES)
+        timings['total_ms'] = _elapsed_ms(started)
+        return {
+            "status_code": response.status,
+            "reason": response.reason,
+            "headers": dict(response.getheaders()),
+            "body": body.decode('utf-8', errors='replace'),
+            "proxy": proxy,
+            "timings": timings
+        }
+    finally:
+        sock.close()
+
+
+def format_timings(timings: Dict[str, float]) -> str:
+    """'dns 12.0 ms, connect 30.5 ms, ...' for the phases that were measured"""
+    parts = [f"{label} {timings[key]:.1f} ms" for key, label in TIMING_LABELS if key in timings]
+    return ", ".join(parts) if parts else "n/a"
+
+
+class ApiDiagnostics(QObject):
+    """
+    Runs a set of named diagnostic probes concurrently under one deadline.
+
+    Each probe is called with the timeout it may use and returns a dict; a
+    'timings' entry with total_ms is always added. Results are reported on
+    the GUI thread with probe_finished(name, result) as they arrive. When all
+    probes are done, or the deadline passes (unfinished probes are then
+    reported as timed out), finished(results) is emitted once.
+
+    Probes get their own short-lived threads rather than the API worker
+    pool, so diagnostics still run while deliveries are backed up.
+    """
+
+    probe_finished = pyqtSignal(str, dict)
+    finished = pyqtSignal(dict)
+    _probe_done = pyqtSignal(str, dict)
+
+    def __init__(self, probes: Dict[str, Callable[[float], dict]], deadline: float = DIAGNOSTICS_DEADLINE_SECONDS,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.probes = probes
+        self.deadline = deadline
+        self.results: Dict[str, dict] = {}
+        self._done = False
+        self._started = 0.0
+        self.logger = logging.getLogger(__name__)
+        self._probe_done.connect(self._record)
+
+    def start(self) -> None:
+        self._started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=max(1, len(self.probes)), thread_name_prefix="ApiDiagnostics")
+        for name, probe in self.probes.items():
+            executor.submit(self._run, name, probe)
+        executor.shutdown(wait=False)
+        QTimer.singleShot(int(self.deadline * 1000), self._on_deadline)
+        if not self.probes:
+            self._finish()
+
+    def _run(self, name: str, probe: Callable[[float], dict]) -> None:
+        started = time.perf_counter()
+        try:
+            result = probe(min(PROBE_TIMEOUT_SECONDS, self.deadline))
+        except Exception as e:
+            result = {"error": str(e), "error_type": type(e).__name__}
+        result.setdefault("timings", {}).setdefault("total_ms", _elapsed_ms(started))
+        try:
+            self._probe_done.emit(name, result)
+        except RuntimeError:
+            pass
+
+    def _record(self, name: str, result: dict) -> None:
+        if self._done:
+            self.logger.debug(f"Diagnostic probe {name} finished after the deadline")
+            return
+        self.results[name] = result
+        self.probe_finished.emit(name, result)
+        if len(self.results) == len(self.probes):
+            self._finish()
+
+    def _on_deadline(self) -> None:
+        if self._done:
+            return
+        for name in self.probes:
+            if name not in self.results:
+                self.results[name] = {
+                    "error": f"No result within {self.deadline:.0f}s",
+                    "timed_out": True,
+                    "timings": {"total_ms": round(self.deadline * 1000, 1)}
+                }
+                self.probe_finished.emit(name, self.results[name])
+        self._finish()
+
+    def _finish(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        self.logger.info(f"API diagnostics finished in {time.monotonic() - self._started:.2f}s")
+        self.finished.emit(self.results)
+
+
+class ApiDiagnosticsDialog(QDialog):
+    """Shows diagnostic probe results as they arrive, then the full report"""
+
+    report_ready = pyqtSignal(str)
+
+    def __init__(self, diagnostics: ApiDiagnostics, report_builder: Callable[[Dict[str, dict]], str],
+                 probe_labels: Dict[str, str], copy_to_clipboard: bool = False, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(t("API Diagnostics"))
+        self.resize(640, 480)
+        self.diagnostics = diagnostics
+        self.diagnostics.setParent(self)
+        self.report_builder = report_builder
+        self.probe_labels = probe_labels
+        self.copy_to_clipboard = copy_to_clipboard
+        self.report = ""
+        self._lines = {name: f"{probe_labels.get(name, name)}: running..." for name in diagnostics.probes}
+        self.initUI()
+        self.diagnostics.probe_finished.connect(self.on_probe_finished)
+        self.diagnostics.finished.connect(self.on_finished)
+
+    def initUI(self):
+        layout = QVBoxLayout(self)
+
+        self.status_label = QLabel(t("Running diagnostics..."))
+        layout.addWidget(self.status_label)
+
+        self.output = QPlainTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setFont(QFont("Consolas", 9))
+        self.output.setPlainText("\n".join(self._lines.values()))
+        layout.addWidget(self.output)
+
+        button_layout = QHBoxLayout()
+        self.copy_button = QPushButton(t("Copy Report"))
+        self.copy_button.setEnabled(False)
+        self.copy_button.clicked.connect(self.copy_report)
+        close_button = QPushButton(t("Close"))
+        close_button.clicked.connect(self.accept)
+        button_layout.addStretch()
+        button_layout.addWidget(self.copy_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+    def start(self) -> None:
+        self.show()
+        self.diagnostics.start()
+
+    def on_probe_finished(self, name: str, result: dict) -> None:
+        if result.get("timed_out"):
+            outcome = "TIMED OUT"
+        elif result.get("error"):
+            outcome = f"ERROR ({result['error']})"
+        elif "status_code" in result:
+            outcome = f"HTTP {result['status_code']}"
+        else:
+            outcome = result.get("socket_connection") or result.get("time_sync_status") or "done"
+        self._lines[name] = f"{self.probe_labels.get(name, name)}: {outcome} [{format_timings(result.get('timings', {}))}]"
+        self.output.setPlainText("\n".join(self._lines.values()))
+        done = len(self.diagnostics.results)
+        self.status_label.setText(t("Running diagnostics...") + f" {done}/{len(self.diagnostics.probes)}")
+
+    def on_finished(self, results: Dict[str, dict]) -> None:
+        summary = "\n".join(self._lines.values())
+        try:
+            self.report = self.report_builder(results)
+        except Exception as e:
+            logging.error(f"Failed to build diagnostic report: {e}")
+            self.report = summary
+        self.output.setPlainText(summary + "\n\n" + self.report)
+        self.copy_button.setEnabled(True)
+        self.status_label.setText(t("Diagnostics complete"))
+        if self.copy_to_clipboard:
+            self.copy_report()
+        self.report_ready.emit(self.report)
+
+    def copy_report(self) -> None:
+        QApplication.clipboard().setText(self.report)
+        self.status_label.setText(t("Diagnostics complete") + " - " + t("report copied to clipboard"))
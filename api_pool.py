@@ -0,0 +1,84 @@
+# api_pool.py
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+API_POOL_WORKERS = 4
+
+
+class ApiWorkerPool(QObject):
+    """
+    Fixed-size worker pool for outbound starcitizentool API work.
+
+    Jobs run on a bounded ThreadPoolExecutor instead of a QThread per request,
+    so thread count stays flat over long sessions. A job's callback is called
+    on the GUI thread with (result, error) through the single job_finished
+    signal. Must be created on the GUI thread.
+    """
+
+    job_finished = pyqtSignal(object, object, object)
+
+    def __init__(self, max_workers: int = API_POOL_WORKERS, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ApiWorker")
+        self._lock = Lock()
+        self._pending = 0
+        self.logger = logging.getLogger(__name__)
+        self.job_finished.connect(self._dispatch)
+
+    def submit(self, job: Callable[[], Any], callback: Optional[Callable[[Any, Optional[Exception]], None]] = None) -> Optional[Future]:
+        """Queue job; callback(result, error) runs on the GUI thread once it finishes"""
+        with self._lock:
+            self._pending += 1
+        try:
+            return self._executor.submit(self._run, job, callback)
+        except RuntimeError as e:
+            with self._lock:
+                self._pending -= 1
+            self.logger.warning(f"API pool is shut down; job dropped: {e}")
+            return None
+
+    def _run(self, job: Callable[[], Any], callback) -> None:
+        result, error = None, None
+        try:
+            result = job()
+        except Exception as e:
+            error = e
+        finally:
+            with self._lock:
+                self._pending -= 1
+        if callback is not None:
+            self.job_finished.emit(callback, result, error)
+        elif error is not None:
+            self.logger.error(f"API job failed: {error}")
+
+    def _dispatch(self, callback, result, error) -> None:
+        try:
+            callback(result, error)
+        except Exception as e:
+            self.logger.error(f"Error in API job callback: {e}")
+
+    def pending_count(self) -> int:
+        """Jobs queued or running"""
+        with self._lock:
+            return self._pending
+
+    def shutdown(self) -> None:
+        """Drop queued jobs; running ones finish in the background"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_api_pool: Optional[ApiWorkerPool] = None
+
+
+def get_api_pool() -> ApiWorkerPool:
+    """Get the global API worker pool, creating it on first use (call from the GUI thread)"""
+    global _api_pool
+    if _api_pool is None:
+        _api_pool = ApiWorkerPool()
+    return _api_pool
@@ -0,0 +1,196 @@
+# api_throttle.py
+
+import time
+import random
+import logging
+from threading import Condition, Event
+from typing import Any, Dict, Mapping, Optional
+
+import requests
+
+from api_client import get_api_client
+from rsi_scheduler import parse_retry_after
+
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 4
+INITIAL_CONCURRENCY = 2
+# Several requests in flight usually fail together; count that as one congestion signal
+DECREASE_COOLDOWN_SECONDS = 2.0
+DEFAULT_THROTTLE_PAUSE_SECONDS = 10.0
+MAX_PAUSE_SECONDS = 300.0
+PAUSE_JITTER = 0.2
+ABORT_POLL_SECONDS = 0.5
+
+RATE_LIMIT_REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+RATE_LIMIT_RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset")
+
+
+class DeliveryCancelled(requests.exceptions.RequestException):
+    """Raised when a caller gives up while waiting for a delivery slot"""
+
+
+def retry_delay(attempt: int, base: float, cap: float, retry_after: Optional[float] = None) -> float:
+    """
+    Backoff before retry number attempt (1-based): capped exponential with equal jitter.
+
+    A server Retry-After is honoured as a floor (still capped) so retries never
+    come back earlier than asked.
+    """
+    delay = min(base * 2 ** (attempt - 1), cap)
+    delay = delay / 2 + random.uniform(0, delay / 2)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+def parse_rate_limit_reset(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds until the rate-limit window resets, from RateLimit-Reset / X-RateLimit-Reset"""
+    for name in RATE_LIMIT_RESET_HEADERS:
+        value = headers.get(name)
+        if not value:
+            continue
+        try:
+            reset = float(value)
+        except ValueError:
+            continue
+        # Some servers send an epoch timestamp instead of delta-seconds
+        if reset > 1e9:
+            reset -= time.time()
+        return max(0.0, reset)
+    return None
+
+
+def rate_limit_exhausted(headers: Mapping[str, str]) -> bool:
+    for name in RATE_LIMIT_REMAINING_HEADERS:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return int(float(value)) <= 0
+        except ValueError:
+            return False
+    return False
+
+
+class ApiConcurrencyController:
+    """
+    Shared gate for kill, death and clip submissions to the starcitizentool API.
+
+    The number of requests allowed in flight adapts AIMD-style: every
+    successful response adds 1/limit (about one slot per round of
+    successes), while a 429, 5xx or network error halves the limit, at most
+    once per DECREASE_COOLDOWN_SECONDS. A 429, or a response reporting an
+    exhausted rate-limit window, pauses every sender until Retry-After or the
+    rate-limit reset has passed, plus jitter so they do not resume in lockstep.
+    """
+
+    def __init__(self, min_limit: int = MIN_CONCURRENCY, max_limit: int = MAX_CONCURRENCY,
+                 initial: int = INITIAL_CONCURRENCY):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._condition = Condition()
+        self.stats: Dict[str, int] = {'requests': 0, 'throttled': 0, 'failures': 0, 'decreases': 0}
+        self.logger = logging.getLogger(__name__)
+
+    def acquire(self, abort: Optional[Event] = None) -> bool:
+        """Block until a slot is free and no pause is active; False if abort was set meanwhile"""
+        with self._condition:
+            while True:
+                if abort is not None and abort.is_set():
+                    return False
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    self.stats['requests'] += 1
+                    return True
+                else:
+                    wait = None
+                if abort is not None:
+                    wait = ABORT_POLL_SECONDS if wait is None else min(wait, ABORT_POLL_SECONDS)
+                self._condition.wait(wait)
+
+    def release(self, status_code: Optional[int] = None, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Return a slot and feed the outcome (status_code None means a network error) into the limit"""
+        headers = headers or {}
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if status_code is None or status_code == 429 or status_code >= 500:
+                self.stats['failures'] += 1
+                self._decrease(now)
+            elif status_code < 400:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+            pause = None
+            if status_code == 429:
+                self.stats['throttled'] += 1
+                pause = parse_retry_after(headers.get("Retry-After"))
+                if pause is None:
+                    pause = parse_rate_limit_reset(headers)
+                if pause is None:
+                    pause = DEFAULT_THROTTLE_PAUSE_SECONDS
+            elif rate_limit_exhausted(headers):
+                pause = parse_rate_limit_reset(headers)
+            if pause is not None:
+                pause = min(pause, MAX_PAUSE_SECONDS) * (1 + random.uniform(0, PAUSE_JITTER))
+                if now + pause > self._paused_until:
+                    self._paused_until = now + pause
+                    self.logger.warning(
+                        f"API rate limited (status {status_code}); pausing all submissions for {pause:.1f}s"
+                    )
+            self._condition.notify_all()
+
+    def _decrease(self, now: float) -> None:
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        previous = self._limit
+        self._limit = max(float(self.min_limit), self._limit / 2)
+        if int(self._limit) != int(previous):
+            self.stats['decreases'] += 1
+            self.logger.info(f"API concurrency reduced to {int(self._limit)}")
+
+    def request(self, method: str, url: str, abort: Optional[Event] = None, **kwargs) -> requests.Response:
+        """Send through the pooled API client once a slot is free; the response adjusts the limit"""
+        if not self.acquire(abort):
+            raise DeliveryCancelled(f"Cancelled while waiting to send to {url}")
+        response = None
+        try:
+            response = get_api_client().request(method, url, **kwargs)
+            return response
+        finally:
+            if response is None:
+                self.release()
+            else:
+                self.release(response.status_code, response.headers)
+
+    def post(self, url: str, abort: Optional[Event] = None, **kwargs) -> requests.Response:
+        return self.request("POST", url, abort, **kwargs)
+
+    def paused_for(self) -> float:
+        with self._condition:
+            return max(0.0, self._paused_until - time.monotonic())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current limit, requests in flight, remaining pause and counters"""
+        with self._condition:
+            return dict(
+                self.stats,
+                limit=int(self._limit),
+                in_flight=self._in_flight,
+                paused_for_seconds=round(max(0.0, self._paused_until - time.monotonic()), 1)
+            )
+
+
+_api_throttle = ApiConcurrencyController()
+
+
+def get_api_throttle() -> ApiConcurrencyController:
+    """Get the global API concurrency controller"""
+    return _api_throttle
@@ -0,0 +1,117 @@
+# avatar_store.py
+
+import os
+import hashlib
+import logging
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+from urllib.parse import urlparse, unquote
+
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage
+
+AVATAR_DIR = os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "SCTool_Tracker", "avatars")
+
+THUMBNAIL_SIZE = 150
+
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+
+class AvatarStore:
+    """Content-addressed avatar files on disk, referenced from kill cards by file URL"""
+
+    def __init__(self, avatar_dir: str = AVATAR_DIR, thumbnail_size: int = THUMBNAIL_SIZE):
+        self.avatar_dir = avatar_dir
+        self.thumbnail_size = thumbnail_size
+        self._lock = Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _thumbnail_path(self, digest: str) -> str:
+        return os.path.join(self.avatar_dir, f"{digest}_thumb.png")
+
+    def _make_thumbnail(self, image_bytes: bytes) -> Optional[bytes]:
+        image = QImage()
+        if not image.loadFromData(image_bytes):
+            return None
+        if image.width() > self.thumbnail_size or image.height() > self.thumbnail_size:
+            image = image.scaled(self.thumbnail_size, self.thumbnail_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        image.save(buffer, "PNG")
+        buffer.close()
+        return bytes(data)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def store(self, image_bytes: bytes, content_type: str = "image/jpeg") -> Optional[str]:
+        """
+        Store avatar bytes once under their SHA-256 and return the thumbnail's file URL.
+
+        Identical avatars (e.g. the RSI default) map to the same files. Returns None
+        if the bytes are not a decodable image.
+        """
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        thumbnail_path = self._thumbnail_path(digest)
+        if os.path.exists(thumbnail_path):
+            return Path(thumbnail_path).as_uri()
+
+        thumbnail = self._make_thumbnail(image_bytes)
+        if thumbnail is None:
+            self.logger.warning(f"Avatar {digest[:12]} could not be decoded; not storing")
+            return None
+
+        extension = CONTENT_TYPE_EXTENSIONS.get(content_type.split(';')[0].strip().lower(), ".img")
+        with self._lock:
+            try:
+                os.makedirs(self.avatar_dir, exist_ok=True)
+                original_path = os.path.join(self.avatar_dir, f"{digest}{extension}")
+                if not os.path.exists(original_path):
+                    self._write_atomic(original_path, image_bytes)
+                if not os.path.exists(thumbnail_path):
+                    self._write_atomic(thumbnail_path, thumbnail)
+            except OSError as e:
+                self.logger.error(f"Error writing avatar {digest[:12]}: {e}")
+                return None
+
+        self.logger.debug(f"Stored avatar {digest[:12]} ({len(image_bytes)} bytes, thumbnail {len(thumbnail)} bytes)")
+        return Path(thumbnail_path).as_uri()
+
+    @staticmethod
+    def is_local_url(image_url: Optional[str]) -> bool:
+        return bool(image_url) and image_url.startswith("file:")
+
+    def exists(self, image_url: Optional[str]) -> bool:
+        """Whether image_url is a stored avatar whose file is still on disk"""
+        path = self.path_for_url(image_url)
+        return path is not None and os.path.exists(path)
+
+    @staticmethod
+    def path_for_url(image_url: Optional[str]) -> Optional[str]:
+        """Convert a file URL returned by store() back into a filesystem path"""
+        if not AvatarStore.is_local_url(image_url):
+            return None
+        path = unquote(urlparse(image_url).path)
+        if os.name == 'nt' and len(path) > 2 and path[0] == '/' and path[2] == ':':
+            path = path[1:]
+        return path
+
+
+_avatar_store = AvatarStore()
+
+
+def get_avatar_store() -> AvatarStore:
+    """Get the global avatar store instance"""
+    return _avatar_store
@@ -0,0 +1,91 @@
+# citizen_page.py
+
+"""
+Targeted extraction of the few fields we need from an RSI citizen page.
+
+The citizen page is large, but only the enlistment date and the avatar src are
+read from it, so instead of building a full parse tree these helpers search the
+raw response bytes for the two anchors and decode just the captured values.
+"""
+
+import os
+import re
+import html
+from typing import Optional, Tuple, Union
+
+# Overridable so the local stand-in server (standin_server.py) can take RSI's place
+RSI_BASE_URL = os.environ.get("SCTOOL_RSI_BASE_URL", "https://robertsspaceindustries.com").rstrip("/")
+
+_ENLISTED_LABEL = re.compile(rb'<span[^>]*\bclass="[^"]*\blabel\b[^"]*"[^>]*>\s*Enlisted\s*</span>')
+_VALUE_AFTER_LABEL = re.compile(rb'<strong[^>]*\bclass="[^"]*\bvalue\b[^"]*"[^>]*>(.*?)</strong>', re.S)
+# 'thumb' as a whole class token, so e.g. class="thumb-wrap" does not count
+_THUMB_OPEN = re.compile(rb'<([a-zA-Z][a-zA-Z0-9]*)\b[^>]*?\sclass="(?:[^"]*\s)?thumb(?:\s[^"]*)?"[^>]*>')
+_IMG_SRC = re.compile(rb'<img\b[^>]*?\bsrc\s*=\s*["\']([^"\']*)["\']', re.S)
+_TAG = re.compile(r'<[^>]+>')
+_VOID_TAGS = {b'area', b'base', b'br', b'col', b'embed', b'hr', b'img', b'input', b'link', b'meta', b'source', b'wbr'}
+
+
+def _as_bytes(page: Union[bytes, str]) -> bytes:
+    return page.encode('utf-8', errors='replace') if isinstance(page, str) else page
+
+
+def _decode(value: bytes) -> str:
+    return html.unescape(value.decode('utf-8', errors='replace'))
+
+
+def extract_enlistment_date(page: Union[bytes, str]) -> Optional[str]:
+    """Return the text of the value following the 'Enlisted' label, if present"""
+    data = _as_bytes(page)
+    label = _ENLISTED_LABEL.search(data)
+    if not label:
+        return None
+    value = _VALUE_AFTER_LABEL.search(data, label.end())
+    if not value:
+        return None
+    text = _TAG.sub('', _decode(value.group(1))).strip()
+    return text or None
+
+
+def _element_end(data: bytes, name: bytes, start: int) -> int:
+    """Offset of the tag closing the element whose content starts at start (end of data if unclosed)"""
+    tags = re.compile(rb'<(/?)' + re.escape(name) + rb'\b[^>]*>', re.I)
+    depth = 1
+    for tag in tags.finditer(data, start):
+        if tag.group(1):
+            depth -= 1
+            if depth == 0:
+                return tag.start()
+        elif not tag.group(0).endswith(b'/>'):
+            depth += 1
+    return len(data)
+
+
+def extract_avatar_src(page: Union[bytes, str]) -> Optional[str]:
+    """Return the src of the first image inside a '.thumb' element (the citizen avatar), like '.thumb img'"""
+    data = _as_bytes(page)
+    for thumb in _THUMB_OPEN.finditer(data):
+        name = thumb.group(1).lower()
+        if name in _VOID_TAGS or thumb.group(0).endswith(b'/>'):
+            continue
+        image = _IMG_SRC.search(data, thumb.end(), _element_end(data, name, thumb.end()))
+        if image:
+            src = _decode(image.group(1)).strip()
+            return src or None
+    return None
+
+
+def absolute_rsi_url(src: str) -> str:
+    """Resolve a (possibly relative) src on the RSI site to an absolute URL"""
+    if src.startswith("http://") or src.startswith("https://"):
+        return src
+    if src.startswith("//"):
+        return f"https:{src}"
+    if not src.startswith("/"):
+        src = "/" + src
+    return f"{RSI_BASE_URL}{src}"
+
+
+def parse_citizen_page(page: Union[bytes, str]) -> Tuple[Optional[str], Optional[str]]:
+    """Extract (enlistment date, absolute avatar URL) from a citizen page"""
+    src = extract_avatar_src(page)
+    return extract_enlistment_date(page), absolute_rsi_url(src) if src else None
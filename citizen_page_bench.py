@@ -0,0 +1,124 @@
+# citizen_page_bench.py
+
+"""
+Benchmark the targeted citizen page extractor against the previous BeautifulSoup parse.
+
+Runs both extractors over saved RSI citizen pages, checks they agree, and prints
+mean parse time and peak allocated memory (tracemalloc) for each.
+
+Usage:
+    python citizen_page_bench.py pages/*.html
+    python citizen_page_bench.py --synthetic --iterations 200
+"""
+
+import argparse
+import glob
+import json
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from citizen_page import parse_citizen_page, absolute_rsi_url
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+
+def parse_with_beautifulsoup(page: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """The full-document parse used before citizen_page existed"""
+    soup = BeautifulSoup(page.decode('utf-8', errors='replace'), 'html.parser')
+
+    enlistment_date = None
+    enlistment_label = soup.find("span", class_="label", string="Enlisted")
+    if enlistment_label:
+        enlistment_date_elem = enlistment_label.find_next("strong", class_="value")
+        if enlistment_date_elem:
+            enlistment_date = enlistment_date_elem.text.strip()
+
+    avatar_url = None
+    profile_pic = soup.select_one('.thumb img')
+    if profile_pic and profile_pic.has_attr("src"):
+        avatar_url = absolute_rsi_url(profile_pic['src'])
+
+    return enlistment_date, avatar_url
+
+
+def synthetic_citizen_page(filler_blocks: int = 1500) -> bytes:
+    """Build a page shaped like an RSI citizen profile, padded to a realistic size"""
+    filler = "".join(
+        f'<div class="entry"><span class="label">Field {i}</span><strong class="value">Value {i}</strong></div>'
+        for i in range(filler_blocks)
+    )
+    return (
+        '<!DOCTYPE html><html><head><title>Citizen</title></head><body>'
+        '<div id="public-profile" class="profile-content overview-content clearfix">'
+        '<div class="profile left-col"><div class="inner clearfix">'
+        '<div class="thumb"><img src="/media/abc123def/heap_infobox/Avatar.jpg" /></div>'
+        '<div class="info"><p class="entry"><strong class="value">Synthetic</strong></p></div>'
+        '</div></div>'
+        '<div class="left-col"><div class="inner">'
+        '<p class="entry"><span class="label">Enlisted</span><strong class="value">Jan 1, 2015</strong></p>'
+        f'</div></div>{filler}'
+        '<div class="main-org right-col visibility-V"><div class="thumb"><img src="/media/org/logo.png" /></div></div>'
+        '</div></body></html>'
+    ).encode('utf-8')
+
+
+def measure(parse: Callable[[bytes], Tuple], page: bytes, iterations: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse(page)
+    mean_ms = (time.perf_counter() - start) * 1000 / iterations
+
+    tracemalloc.start()
+    parse(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'mean_ms': round(mean_ms, 3), 'peak_kib': round(peak / 1024, 1)}
+
+
+def run(pages: List[Tuple[str, bytes]], iterations: int) -> List[Dict]:
+    results = []
+    for name, page in pages:
+        targeted = parse_citizen_page(page)
+        result = {
+            'page': name,
+            'size_kib': round(len(page) / 1024, 1),
+            'extracted': {'enlistment_date': targeted[0], 'avatar_url': targeted[1]},
+            'targeted': measure(parse_citizen_page, page, iterations)
+        }
+        if BeautifulSoup is not None:
+            baseline = parse_with_beautifulsoup(page)
+            result['beautifulsoup'] = measure(parse_with_beautifulsoup, page, max(1, iterations // 10))
+            result['matches_beautifulsoup'] = baseline == targeted
+            result['speedup'] = round(result['beautifulsoup']['mean_ms'] / max(result['targeted']['mean_ms'], 1e-6), 1)
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark citizen page extraction")
+    parser.add_argument('pages', nargs='*', help="Saved citizen page HTML files (globs allowed)")
+    parser.add_argument('--synthetic', action='store_true', help="Include a generated citizen-shaped page")
+    parser.add_argument('--iterations', type=int, default=100)
+    args = parser.parse_args()
+
+    pages = []
+    for pattern in args.pages:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, 'rb') as f:
+                pages.append((path, f.read()))
+    if args.synthetic or not pages:
+        pages.append(('<synthetic>', synthetic_citizen_page()))
+
+    if BeautifulSoup is None:
+        print("beautifulsoup4 is not installed; reporting the targeted extractor only")
+
+    print(json.dumps(run(pages, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
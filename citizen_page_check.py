@@ -0,0 +1,77 @@
+# citizen_page_check.py
+
+"""
+Fixture checks for the targeted citizen page extractor.
+
+Each fixture is a small page with the avatar src and enlistment date it should
+yield, covering the class-token and element-boundary cases the byte scan has to
+get right. When beautifulsoup4 is installed, the previous parse
+(citizen_page_bench.parse_with_beautifulsoup) is checked against the same
+expectations, so the two extractors are known to agree on them.
+
+Usage:
+    python citizen_page_check.py
+"""
+
+import sys
+from typing import List, Optional, Tuple
+
+from citizen_page import extract_avatar_src, extract_enlistment_date, parse_citizen_page
+from citizen_page_bench import BeautifulSoup, parse_with_beautifulsoup
+
+ENLISTED = '<p class="entry"><span class="label">Enlisted</span><strong class="value">Jan 1, 2015</strong></p>'
+
+# (name, page, expected avatar src, expected enlistment date)
+FIXTURES: List[Tuple[str, str, Optional[str], Optional[str]]] = [
+    ("avatar in thumb",
+     '<div class="thumb"><img src="/media/a.jpg" /></div>' + ENLISTED, "/media/a.jpg", "Jan 1, 2015"),
+    ("thumb among other classes",
+     '<div class="profile thumb big"><a href="#"><img class="x" src="/media/b.jpg"></a></div>', "/media/b.jpg", None),
+    ("empty thumb, image after it",
+     '<div class="thumb"></div><img src="/logo.png">' + ENLISTED, None, "Jan 1, 2015"),
+    ("thumb-wrap is not thumb",
+     '<div class="thumb-wrap"><img src="/logo.png"></div>', None, None),
+    ("thumb inside thumb-wrap",
+     '<div class="thumb-wrap"><img src="/logo.png"><div class="thumb"><img src="/media/c.jpg"></div></div>',
+     "/media/c.jpg", None),
+    ("nested element inside thumb",
+     '<div class="thumb"><div class="inner"></div><span><img src="/media/d.jpg"></span></div>', "/media/d.jpg", None),
+    ("image after nested close is outside",
+     '<div class="thumb"><div></div></div><img src="/logo.png">', None, None),
+    ("second thumb holds the image",
+     '<span class="thumb"></span><div class="thumb"><img src="/media/e.jpg"></div>', "/media/e.jpg", None),
+    ("img with class thumb has no descendant",
+     '<img class="thumb" src="/media/f.jpg"><p><img src="/logo.png"></p>', None, None),
+    ("no label",
+     '<div class="thumb"><img src="/media/g.jpg"></div><strong class="value">Jan 1, 2015</strong>', "/media/g.jpg", None),
+]
+
+
+def check() -> List[str]:
+    """Run every fixture through the extractors; returns a description of each mismatch, prefixed by fixture name"""
+    failures = []
+    for name, page, avatar, enlisted in FIXTURES:
+        data = page.encode('utf-8')
+        got = (extract_avatar_src(data), extract_enlistment_date(data))
+        if got != (avatar, enlisted):
+            failures.append(f"{name}: citizen_page gave {got}, expected {(avatar, enlisted)}")
+        if BeautifulSoup is not None:
+            expected = parse_citizen_page(data)
+            baseline = parse_with_beautifulsoup(data)
+            if baseline != expected:
+                failures.append(f"{name}: BeautifulSoup gave {baseline}, citizen_page gave {expected}")
+    return failures
+
+
+def main() -> None:
+    failures = check()
+    for failure in failures:
+        print(f"FAIL {failure}")
+    compared = " (also against BeautifulSoup)" if BeautifulSoup is not None else ""
+    failed = {failure.split(":", 1)[0] for failure in failures}
+    print(f"{len(FIXTURES) - len(failed)}/{len(FIXTURES)} fixtures passed{compared}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+# combat_history.py
+
+import os
+import time
+import sqlite3
+import logging
+from datetime import date, datetime, timedelta, timezone
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
+
+from language_manager import t
+
+COMBAT_HISTORY_DB_FILE = os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "SCTool_Tracker", "combat_history.db")
+
+EVENT_KILL = "kill"
+EVENT_DEATH = "death"
+# opponent_org of an event whose opponent's profile has not been looked up yet
+ORG_PENDING = ""
+
+ROLLUP_DIMENSIONS = ("day", "game_mode", "ship", "weapon", "opponent_org")
+# Dimensions that also get per-month totals, so unfiltered queries over long ranges read a few rows per month
+MONTHLY_DIMENSIONS = ("game_mode", "ship", "weapon", "opponent_org")
+EVENT_FILTERS = ROLLUP_DIMENSIONS + ("event_type", "zone", "opponent")
+
+DayBound = Union[str, date, datetime, None]
+
+
+def event_time(timestamp: str) -> float:
+    """
+    Epoch seconds for an event timestamp (now if unparseable).
+
+    Accepts the tracker's UTC display form, 2025-01-31 18:04:05, as well as the
+    raw Game.log form, 2025-01-31T18:04:05.123Z; a timestamp without an offset
+    is UTC, never local time.
+    """
+    try:
+        moment = datetime.fromisoformat(timestamp.strip().replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return time.time()
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def org_from_details(details: Optional[Dict[str, str]]) -> Optional[str]:
+    """Org tag to record for an opponent ('None' if they have no org), or None while it is not known"""
+    if not details:
+        return None
+    tag = details.get('org_tag')
+    if not tag or tag == t('Error'):
+        return None
+    return tag
+
+
+def _day(value: DayBound) -> Optional[str]:
+    """YYYY-MM-DD (UTC) for a date, datetime or date string"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%d")
+    return value.isoformat()
+
+
+def _month_split(since: Optional[str], until: Optional[str]):
+    """
+    Split an inclusive day range into the whole months it covers and the days left at either end.
+
+    Returns ((first_month, last_month), day_ranges): months are 'YYYY-MM' (None
+    for an open end) or None when no whole month is covered; day_ranges are
+    (first_day, last_day) pairs.
+    """
+    start = date.fromisoformat(since) if since else None
+    end = date.fromisoformat(until) if until else None
+    first_month = start
+    if start is not None and start.day != 1:
+        first_month = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    last_month_end = end
+    if end is not None and (end + timedelta(days=1)).day != 1:
+        last_month_end = end.replace(day=1) - timedelta(days=1)
+    if first_month is not None and last_month_end is not None and first_month > last_month_end:
+        return None, [(since, until)]
+
+    day_ranges = []
+    if start is not None and start < first_month:
+        day_ranges.append((since, (first_month - timedelta(days=1)).isoformat()))
+    if end is not None and end > last_month_end:
+        day_ranges.append(((last_month_end + timedelta(days=1)).isoformat(), until))
+    months = (
+        first_month.strftime("%Y-%m") if first_month else None,
+        last_month_end.strftime("%Y-%m") if last_month_end else None
+    )
+    return months, day_ranges
+
+
+def _check_columns(names, allowed) -> None:
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown combat history field(s): {unknown}")
+
+
+class CombatHistory:
+    """
+    Permanent local history of every kill and death, kept across sessions.
+
+    Each event is one row in an indexed events table. In the same
+    transaction, a daily rollups table keyed by (day, game_mode, ship,
+    weapon, opponent_org) and per-dimension monthly totals get their kill or
+    death count bumped. Aggregate queries (K/D by ship this month, top
+    weapons against an org) read only the rollups: filtered queries use the
+    daily rows for that value, unfiltered ones the monthly totals plus the
+    days at either end of the range, so both stay in the millisecond range
+    over years of play. Days are UTC, like Game.log timestamps. Safe to use
+    from any thread.
+    """
+
+    def __init__(self, db_file: str = COMBAT_HISTORY_DB_FILE):
+        self.db_file = db_file
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS events (
+                    local_key TEXT PRIMARY KEY,
+                    event_type TEXT NOT NULL,
+                    occurred_at REAL NOT NULL,
+                    day TEXT NOT NULL,
+                    game_mode TEXT NOT NULL,
+                    ship TEXT NOT NULL,
+                    weapon TEXT NOT NULL,
+                    zone TEXT NOT NULL,
+                    opponent TEXT NOT NULL,
+                    opponent_org TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS events_time ON events (occurred_at);
+                CREATE INDEX IF NOT EXISTS events_opponent ON events (opponent COLLATE NOCASE, occurred_at);
+                CREATE INDEX IF NOT EXISTS events_org ON events (opponent_org, occurred_at);
+
+                CREATE TABLE IF NOT EXISTS rollups (
+                    day TEXT NOT NULL,
+                    game_mode TEXT NOT NULL,
+                    ship TEXT NOT NULL,
+                    weapon TEXT NOT NULL,
+                    opponent_org TEXT NOT NULL,
+                    kills INTEGER NOT NULL DEFAULT 0,
+                    deaths INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, game_mode, ship, weapon, opponent_org)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS rollups_mode ON rollups (game_mode, day, kills, deaths);
+                CREATE INDEX IF NOT EXISTS rollups_ship ON rollups (ship, day, kills, deaths);
+                CREATE INDEX IF NOT EXISTS rollups_weapon ON rollups (weapon, day, kills, deaths);
+                CREATE INDEX IF NOT EXISTS rollups_org ON rollups (opponent_org, day, kills, deaths);
+
+                CREATE TABLE IF NOT EXISTS monthly_rollups (
+                    dimension TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    month TEXT NOT NULL,
+                    kills INTEGER NOT NULL DEFAULT 0,
+                    deaths INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (dimension, value, month)
+                ) WITHOUT ROWID;
+            """)
+            conn.commit()
+            self._conn = conn
+            self.logger.info(f"Opened combat history at {self.db_file}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Could not open combat history {self.db_file}: {e}")
+        return self._conn
+
+    @staticmethod
+    def _bump_rollup(conn: sqlite3.Connection, event: Dict[str, Any], sign: int,
+                     monthly_dimensions=MONTHLY_DIMENSIONS) -> None:
+        """Add (sign 1) or take back (sign -1) an event's count in the daily and monthly rollups"""
+        kills = sign if event["event_type"] == EVENT_KILL else 0
+        deaths = sign if event["event_type"] == EVENT_DEATH else 0
+        conn.execute(
+            "INSERT INTO rollups (day, game_mode, ship, weapon, opponent_org, kills, deaths) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (day, game_mode, ship, weapon, opponent_org) DO UPDATE SET "
+            "kills = kills + excluded.kills, deaths = deaths + excluded.deaths",
+            (event["day"], event["game_mode"], event["ship"], event["weapon"], event["opponent_org"], kills, deaths)
+        )
+        conn.executemany(
+            "INSERT INTO monthly_rollups (dimension, value, month, kills, deaths) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (dimension, value, month) DO UPDATE SET "
+            "kills = kills + excluded.kills, deaths = deaths + excluded.deaths",
+            [(dimension, event[dimension], event["day"][:7], kills, deaths) for dimension in monthly_dimensions]
+        )
+
+    def record_event(self, local_key: str, event_type: str, timestamp: str, game_mode: str, ship: str,
+                     weapon: str, zone: str, opponent: str, opponent_org: str = ORG_PENDING) -> bool:
+        """Add one kill or death; False if it was already recorded (or could not be saved)"""
+        occurred_at = event_time(timestamp)
+        event = {
+            "local_key": local_key,
+            "event_type": event_type,
+            "occurred_at": occurred_at,
+            "day": datetime.fromtimestamp(occurred_at, timezone.utc).strftime("%Y-%m-%d"),
+            "game_mode": game_mode or "Unknown",
+            "ship": ship or "No Ship",
+            "weapon": weapon or "Unknown",
+            "zone": zone or "Unknown",
+            "opponent": opponent or "Unknown",
+            "opponent_org": opponent_org or ORG_PENDING
+        }
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return False
+            try:
+                with conn:
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO events (local_key, event_type, occurred_at, day, game_mode, ship, "
+                        "weapon, zone, opponent, opponent_org) VALUES (:local_key, :event_type, :occurred_at, :day, "
+                        ":game_mode, :ship, :weapon, :zone, :opponent, :opponent_org)",
+                        event
+                    )
+                    if cursor.rowcount == 0:
+                        return False
+                    self._bump_rollup(conn, event, 1)
+                return True
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to record combat event {local_key}: {e}")
+                return False
+
+    def remove_event(self, local_key: str) -> bool:
+        """Take an event back out of the history (e.g. a kill the API later reported as an NPC)"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return False
+            try:
+                with conn:
+                    row = conn.execute("SELECT * FROM events WHERE local_key = ?", (local_key,)).fetchone()
+                    if row is None:
+                        return False
+                    self._bump_rollup(conn, dict(row), -1)
+                    conn.execute("DELETE FROM events WHERE local_key = ?", (local_key,))
+                    conn.execute("DELETE FROM rollups WHERE kills = 0 AND deaths = 0")
+                    conn.execute("DELETE FROM monthly_rollups WHERE kills = 0 AND deaths = 0")
+                return True
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to remove combat event {local_key}: {e}")
+                return False
+
+    def set_opponent_org(self, opponent: str, org: str) -> int:
+        """Fill in the org of an opponent's events that were recorded before it was known"""
+        if not org:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return 0
+            try:
+                with conn:
+                    pending = conn.execute(
+                        "SELECT * FROM events WHERE opponent = ? COLLATE NOCASE AND opponent_org = ?",
+                        (opponent, ORG_PENDING)
+                    ).fetchall()
+                    for row in pending:
+                        event = dict(row)
+                        self._bump_rollup(conn, event, -1, ("opponent_org",))
+                        event["opponent_org"] = org
+                        self._bump_rollup(conn, event, 1, ("opponent_org",))
+                    conn.execute(
+                        "UPDATE events SET opponent_org = ? WHERE opponent = ? COLLATE NOCASE AND opponent_org = ?",
+                        (org, opponent, ORG_PENDING)
+                    )
+                    conn.execute("DELETE FROM rollups WHERE kills = 0 AND deaths = 0")
+                    conn.execute("DELETE FROM monthly_rollups WHERE kills = 0 AND deaths = 0")
+                return len(pending)
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to set org for {opponent}: {e}")
+                return 0
+
+    @staticmethod
+    def _where(since: DayBound, until: DayBound, filters: Dict[str, Any]):
+        """WHERE clause over day bounds (inclusive) and equality filters"""
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("day >= ?")
+            params.append(_day(since))
+        if until is not None:
+            clauses.append("day <= ?")
+            params.append(_day(until))
+        for column, value in filters.items():
+            clauses.append(f"{column} = ?")
+            params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _query(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            try:
+                return [dict(row) for row in conn.execute(sql, params)]
+            except sqlite3.Error as e:
+                self.logger.error(f"Combat history query failed: {e}")
+                return []
+
+    def _add_daily(self, counts: Dict[Any, List[int]], group_by: str, since: Optional[str], until: Optional[str],
+                   filters: Dict[str, Any]) -> None:
+        where, params = self._where(since, until, filters)
+        sql = f"SELECT {group_by} AS value, SUM(kills) AS kills, SUM(deaths) AS deaths FROM rollups{where} GROUP BY {group_by}"
+        self._accumulate(counts, self._query(sql, params))
+
+    def _add_monthly(self, counts: Dict[Any, List[int]], group_by: str, first: Optional[str], last: Optional[str]) -> None:
+        clauses, params = ["dimension = ?"], [group_by]
+        if first is not None:
+            clauses.append("month >= ?")
+            params.append(first)
+        if last is not None:
+            clauses.append("month <= ?")
+            params.append(last)
+        sql = (
+            f"SELECT value, SUM(kills) AS kills, SUM(deaths) AS deaths FROM monthly_rollups "
+            f"WHERE {' AND '.join(clauses)} GROUP BY value"
+        )
+        self._accumulate(counts, self._query(sql, params))
+
+    @staticmethod
+    def _accumulate(counts: Dict[Any, List[int]], rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            total = counts.setdefault(row["value"], [0, 0])
+            total[0] += row["kills"]
+            total[1] += row["deaths"]
+
+    def rollup(self, group_by: str, since: DayBound = None, until: DayBound = None, order_by: str = "kills",
+               limit: Optional[int] = None, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Kills, deaths and K/D grouped by one of ROLLUP_DIMENSIONS.
+
+        since/until are inclusive days (dates, datetimes or 'YYYY-MM-DD');
+        filters are equality matches on the other dimensions. For example
+        rollup('ship', since=date.today().replace(day=1)) is K/D by ship this
+        month, and rollup('weapon', opponent_org='TEST', limit=5) the top
+        weapons against an org. order_by is 'kills', 'deaths' or 'kd' (highest
+        first) or the group_by column itself (ascending).
+        """
+        _check_columns([group_by], ROLLUP_DIMENSIONS)
+        _check_columns(filters, ROLLUP_DIMENSIONS)
+        if order_by not in ("kills", "deaths", "kd", group_by):
+            raise ValueError(f"Cannot order combat history by {order_by}")
+        since, until = _day(since), _day(until)
+
+        counts: Dict[Any, List[int]] = {}
+        if filters or group_by not in MONTHLY_DIMENSIONS:
+            self._add_daily(counts, group_by, since, until, filters)
+        else:
+            months, day_ranges = _month_split(since, until)
+            if months is not None:
+                self._add_monthly(counts, group_by, *months)
+            for first, last in day_ranges:
+                self._add_daily(counts, group_by, first, last, {})
+
+        rows = [
+            {group_by: value, "kills": kills, "deaths": deaths, "kd": round(kills / max(deaths, 1), 2)}
+            for value, (kills, deaths) in counts.items() if kills or deaths
+        ]
+        if order_by == group_by:
+            rows.sort(key=lambda row: row[group_by])
+        else:
+            rows.sort(key=lambda row: (-row[order_by], row[group_by]))
+        return rows[:limit] if limit is not None else rows
+
+    def totals(self, since: DayBound = None, until: DayBound = None, **filters: Any) -> Dict[str, Any]:
+        """Kills, deaths and K/D over a day range, optionally filtered by rollup dimensions"""
+        rows = self.rollup("game_mode", since, until, **filters)
+        kills = sum(row["kills"] for row in rows)
+        deaths = sum(row["deaths"] for row in rows)
+        return {"kills": kills, "deaths": deaths, "kd": round(kills / max(deaths, 1), 2)}
+
+    def events(self, since: DayBound = None, until: DayBound = None, limit: int = 100,
+               **filters: Any) -> List[Dict[str, Any]]:
+        """Individual events, newest first, filtered by day range and any stored field"""
+        _check_columns(filters, EVENT_FILTERS)
+        where, params = self._where(since, until, filters)
+        params.append(int(limit))
+        return self._query(f"SELECT * FROM events{where} ORDER BY occurred_at DESC LIMIT ?", params)
+
+    def count(self) -> int:
+        rows = self._query("SELECT COUNT(*) AS events FROM events", [])
+        return rows[0]["events"] if rows else 0
+
+
+_combat_history = CombatHistory()
+
+
+def get_combat_history() -> CombatHistory:
+    """Get the global combat history"""
+    return _combat_history
@@ -0,0 +1,157 @@
+# combat_history_check.py
+
+"""
+Consistency check for the combat history's monthly rollups.
+
+Unfiltered rollup() queries add whole months from monthly_rollups to the
+daily rows for the days left at either end of the range. This builds a
+temporary history spanning several months (leap February and a year boundary
+included), fills in opponent orgs and removes events the way the tracker does,
+then compares rollup() for every monthly dimension over a set of ranges
+(open-ended, mid-month, inside one month, whole months, empty) with the same
+totals read from the daily rollups only and counted straight from the events
+table. It also checks that _month_split covers each range exactly once.
+
+Usage:
+    python combat_history_check.py
+    python combat_history_check.py --events 5000 --seed 7
+"""
+
+import os
+import sys
+import random
+import shutil
+import argparse
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from combat_history import (
+    CombatHistory, EVENT_DEATH, EVENT_KILL, MONTHLY_DIMENSIONS, ORG_PENDING, _month_split
+)
+
+FIRST_DAY = date(2023, 11, 14)
+LAST_DAY = date(2024, 4, 17)
+
+RANGES: List[Tuple[str, Optional[str], Optional[str]]] = [
+    ("open", None, None),
+    ("open start, mid-month end", None, "2024-02-10"),
+    ("open start, month end", None, "2024-02-29"),
+    ("mid-month start, open end", "2023-12-20", None),
+    ("month start, open end", "2024-01-01", None),
+    ("inside one month", "2024-02-03", "2024-02-27"),
+    ("one day", "2024-03-05", "2024-03-05"),
+    ("one whole month", "2024-02-01", "2024-02-29"),
+    ("whole months across the year end", "2023-12-01", "2024-01-31"),
+    ("mid-month to mid-month", "2023-11-20", "2024-03-09"),
+    ("mid-month to next month's start", "2024-01-15", "2024-02-01"),
+    ("month end to mid-month", "2024-01-31", "2024-03-15"),
+    ("beyond the data", "2023-01-01", "2025-12-31"),
+    ("before the data", "2022-01-01", "2022-03-31"),
+    ("empty (since after until)", "2024-03-10", "2024-03-01"),
+]
+
+
+def populate(history: CombatHistory, count: int, rng: random.Random) -> None:
+    """Record count random events, then resolve most pending orgs and remove some events"""
+    span = int((datetime.combine(LAST_DAY, datetime.min.time()) - datetime.combine(FIRST_DAY, datetime.min.time())).total_seconds())
+    start = datetime.combine(FIRST_DAY, datetime.min.time(), tzinfo=timezone.utc)
+    opponents = [f"Rival{i}" for i in range(40)]
+    for index in range(count):
+        moment = start + timedelta(seconds=rng.randrange(span + 86400))
+        org = ORG_PENDING if rng.random() < 0.3 else rng.choice(["ALPHA", "BRAVO", "None"])
+        history.record_event(
+            f"event-{index}", rng.choice([EVENT_KILL, EVENT_DEATH]), moment.strftime('%Y-%m-%d %H:%M:%S'),
+            rng.choice(["Free Flight", "Squadron Battle", "Duel"]), rng.choice(["Gladius", "Arrow", "No Ship"]),
+            rng.choice(["Laser Repeater", "Ballistic Cannon", "Unknown"]), "Daymar", rng.choice(opponents), org
+        )
+    for opponent in rng.sample(opponents, 30):
+        history.set_opponent_org(opponent, rng.choice(["ALPHA", "CHARLIE"]))
+    for index in rng.sample(range(count), count // 10):
+        history.remove_event(f"event-{index}")
+
+
+def daily_only(history: CombatHistory, group_by: str, since: Optional[str], until: Optional[str]) -> Dict[Any, Tuple[int, int]]:
+    counts: Dict[Any, List[int]] = {}
+    history._add_daily(counts, group_by, since, until, {})
+    return {value: (kills, deaths) for value, (kills, deaths) in counts.items() if kills or deaths}
+
+
+def from_events(history: CombatHistory, group_by: str, since: Optional[str], until: Optional[str]) -> Dict[Any, Tuple[int, int]]:
+    where, params = history._where(since, until, {})
+    rows = history._query(
+        f"SELECT {group_by} AS value, SUM(event_type = ?) AS kills, SUM(event_type = ?) AS deaths "
+        f"FROM events{where} GROUP BY {group_by}",
+        [EVENT_KILL, EVENT_DEATH] + params
+    )
+    return {row["value"]: (row["kills"], row["deaths"]) for row in rows if row["kills"] or row["deaths"]}
+
+
+def split_days(since: Optional[str], until: Optional[str]) -> List[date]:
+    """Every day _month_split assigns to a whole month or a leftover range, within the data span"""
+    months, day_ranges = _month_split(since, until)
+    days: List[date] = []
+    if months is not None:
+        first = date.fromisoformat(f"{months[0]}-01") if months[0] else FIRST_DAY.replace(day=1)
+        last = date.fromisoformat(f"{months[1]}-01") if months[1] else LAST_DAY.replace(day=1)
+        day = first
+        while day.strftime("%Y-%m") <= last.strftime("%Y-%m"):
+            days.append(day)
+            day += timedelta(days=1)
+    for first_day, last_day in day_ranges:
+        day = date.fromisoformat(first_day)
+        while day <= date.fromisoformat(last_day):
+            days.append(day)
+            day += timedelta(days=1)
+    return days
+
+
+def check(events: int, seed: int) -> List[str]:
+    """Run every range through both rollup paths; returns a description of each mismatch"""
+    failures = []
+    scratch = tempfile.mkdtemp(prefix="sctool_history_check_")
+    history = CombatHistory(os.path.join(scratch, "combat_history.db"))
+    try:
+        populate(history, events, random.Random(seed))
+        for name, since, until in RANGES:
+            covered = split_days(since, until)
+            expected_days = []
+            day = date.fromisoformat(since) if since else FIRST_DAY.replace(day=1)
+            end = date.fromisoformat(until) if until else (LAST_DAY.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+            while day <= end:
+                expected_days.append(day)
+                day += timedelta(days=1)
+            if sorted(covered) != expected_days:
+                failures.append(f"{name} split: _month_split({since}, {until}) does not cover the range exactly once")
+            for group_by in MONTHLY_DIMENSIONS:
+                rolled = {row[group_by]: (row["kills"], row["deaths"]) for row in history.rollup(group_by, since, until)}
+                daily = daily_only(history, group_by, since, until)
+                counted = from_events(history, group_by, since, until)
+                if rolled != daily:
+                    failures.append(f"{name} by {group_by}: monthly path {rolled} != daily rollups {daily}")
+                if daily != counted:
+                    failures.append(f"{name} by {group_by}: daily rollups {daily} != events {counted}")
+    finally:
+        if history._conn is not None:
+            history._conn.close()
+        shutil.rmtree(scratch, ignore_errors=True)
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check monthly combat history rollups against the daily rollups")
+    parser.add_argument('--events', type=int, default=3000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    failures = check(args.events, args.seed)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    checked = len(RANGES) * (len(MONTHLY_DIMENSIONS) + 1)
+    failed = {failure.split(":", 1)[0] for failure in failures}
+    print(f"{checked - len(failed)}/{checked} range and dimension checks passed over {args.events} events")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# config_service.py
+
+import os
+import copy
+import json
+import atexit
+import logging
+import tempfile
+from threading import Lock, Timer
+from typing import Any, Dict, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+CONFIG_SAVE_DEBOUNCE_SECONDS = 0.5
+CONFIG_SAVE_RETRY_MAX_SECONDS = 60.0
+
+
+def write_json_atomic(path: str, data: Any, indent: int = 4) -> None:
+    """Write data as JSON to a temp file next to path, then rename it over path"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ConfigStore(QObject):
+    """
+    In-memory copy of one JSON config file.
+
+    Reads come from memory. set/update/remove change the copy, emit
+    changed({key: value}) for the keys whose value actually changed (None
+    for removed keys) and schedule a write; a burst of changes within the
+    debounce window becomes one atomic write of the latest state, done on a
+    timer thread. A failed write is retried on the timer with exponential
+    backoff (up to CONFIG_SAVE_RETRY_MAX_SECONDS). flush() writes anything
+    pending at once (used on exit). Safe to use from any thread.
+    """
+
+    changed = pyqtSignal(dict)
+
+    def __init__(self, path: str, indent: int = 4, debounce: float = CONFIG_SAVE_DEBOUNCE_SECONDS):
+        super().__init__()
+        self.path = path
+        self.indent = indent
+        self.debounce = debounce
+        self._data: Optional[Dict[str, Any]] = None
+        self._lock = Lock()
+        self._write_lock = Lock()
+        self._timer: Optional[Timer] = None
+        self._dirty = False
+        self._failed_writes = 0
+        self.stats: Dict[str, int] = {'changes': 0, 'writes': 0, 'write_errors': 0}
+        self.logger = logging.getLogger(__name__)
+
+    def _loaded(self) -> Dict[str, Any]:
+        """The in-memory config, read from disk on first use (call with _lock held)"""
+        if self._data is None:
+            self._data = {}
+            if os.path.isfile(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        content = f.read().strip()
+                    if content:
+                        data = json.loads(content)
+                        if isinstance(data, dict):
+                            self._data = data
+                        else:
+                            self.logger.error(f"Config file {self.path} does not hold an object; using defaults")
+                except (OSError, ValueError) as e:
+                    self.logger.error(f"Error reading config file {self.path}: {e}")
+        return self._data
+
+    def exists(self) -> bool:
+        """True if the file exists or a write is pending"""
+        with self._lock:
+            return self._dirty or os.path.isfile(self.path)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return copy.deepcopy(self._loaded().get(key, default))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """A copy of the whole config"""
+        with self._lock:
+            return copy.deepcopy(self._loaded())
+
+    def set(self, key: str, value: Any) -> bool:
+        return self.update({key: value})
+
+    def update(self, values: Dict[str, Any]) -> bool:
+        """Merge values into the config; True (and a scheduled write) if anything changed"""
+        with self._lock:
+            data = self._loaded()
+            changes = {key: copy.deepcopy(value) for key, value in values.items()
+                       if key not in data or data[key] != value}
+            data.update(changes)
+            self._mark_dirty(len(changes))
+        return self._notify(changes)
+
+    def remove(self, *keys: str) -> bool:
+        with self._lock:
+            data = self._loaded()
+            changes = {key: None for key in keys if key in data}
+            for key in changes:
+                del data[key]
+            self._mark_dirty(len(changes))
+        return self._notify(changes)
+
+    def _mark_dirty(self, changes: int) -> None:
+        if not changes:
+            return
+        self.stats['changes'] += changes
+        self._dirty = True
+        if self._timer is None:
+            self._schedule(self.debounce)
+
+    def _schedule(self, delay: float) -> None:
+        """Start the timer that flushes pending changes (call with _lock held)"""
+        self._timer = Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _notify(self, changes: Dict[str, Any]) -> bool:
+        if not changes:
+            return False
+        try:
+            self.changed.emit(changes)
+        except RuntimeError:
+            pass
+        return True
+
+    def flush(self) -> bool:
+        """Write pending changes now; False if the write failed"""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return True
+                data = copy.deepcopy(self._data)
+                self._dirty = False
+            try:
+                write_json_atomic(self.path, data, self.indent)
+                self.stats['writes'] += 1
+                self.logger.debug(f"Saved {self.path}")
+                with self._lock:
+                    self._failed_writes = 0
+                return True
+            except (OSError, TypeError, ValueError) as e:
+                with self._lock:
+                    self.stats['write_errors'] += 1
+                    self._failed_writes += 1
+                    self._dirty = True
+                    delay = min(self.debounce * 2 ** self._failed_writes, CONFIG_SAVE_RETRY_MAX_SECONDS)
+                    if self._timer is None:
+                        self._schedule(delay)
+                self.logger.error(f"Failed to save config {self.path}: {e}; retrying in {delay:.1f}s")
+                return False
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, pending=int(self._dirty))
+
+
+_config_stores: Dict[str, ConfigStore] = {}
+_config_stores_lock = Lock()
+
+
+def get_config_store(path: str, indent: int = 4) -> ConfigStore:
+    """Get the shared store for the config file at path, creating it on first use"""
+    key = os.path.normcase(os.path.abspath(path))
+    with _config_stores_lock:
+        store = _config_stores.get(key)
+        if store is None:
+            store = ConfigStore(path, indent)
+            _config_stores[key] = store
+        return store
+
+
+def flush_config_stores() -> None:
+    """Write every store's pending changes (called on shutdown)"""
+    with _config_stores_lock:
+        stores = list(_config_stores.values())
+    for store in stores:
+        store.flush()
+
+
+atexit.register(flush_config_stores)
@@ -0,0 +1,99 @@
+# connectivity.py
+
+import time
+import socket
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from api_pool import get_api_pool
+
+API_PING_TTL_SECONDS = 60.0
+API_PING_FAILURE_TTL_SECONDS = 10.0
+UPDATE_CHECK_TTL_SECONDS = 6 * 3600.0
+
+
+def tcp_probe(hostname: str, port: int, timeout: float = 5.0) -> int:
+    """connect_ex result for hostname:port (0 means the connection was accepted); never cached"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        return sock.connect_ex((hostname, port))
+    except OSError as e:
+        return e.errno or -1
+    finally:
+        sock.close()
+
+
+class ConnectivityCache:
+    """
+    Runs connectivity probes (API ping, update check) in the background and
+    caches their results for a TTL.
+
+    Probes run on the shared API worker pool; callbacks are called on the GUI
+    thread with the result. Concurrent requests for the same key share one
+    probe. Use from the GUI thread only.
+    """
+
+    def __init__(self):
+        self._results: Dict[str, Tuple[float, Any]] = {}
+        self._waiting: Dict[str, List[Callable[[Any], None]]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def cached(self, key: str) -> Optional[Any]:
+        """Unexpired result for key, or None"""
+        entry = self._results.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def run(self, key: str, probe: Callable[[], Any], callback: Callable[[Any], None],
+            ttl: Union[float, Callable[[Any], float]], force: bool = False) -> None:
+        """
+        Deliver key's result to callback, probing in the background when it is missing or expired.
+
+        ttl may be a function of the result (e.g. shorter for failures). A probe
+        that raises is reported as None and is not cached.
+        """
+        if not force:
+            result = self.cached(key)
+            if result is not None:
+                callback(result)
+                return
+        if key in self._waiting:
+            self._waiting[key].append(callback)
+            return
+        self._waiting[key] = [callback]
+        started = time.monotonic()
+
+        def finished(result: Any, error: Optional[Exception]) -> None:
+            if error is not None:
+                self.logger.error(f"Connectivity probe {key} failed: {error}")
+                result = None
+            else:
+                seconds = ttl(result) if callable(ttl) else ttl
+                self._results[key] = (time.monotonic() + seconds, result)
+            self.logger.debug(f"Connectivity probe {key} took {time.monotonic() - started:.2f}s")
+            for waiting in self._waiting.pop(key, []):
+                try:
+                    waiting(result)
+                except Exception as e:
+                    self.logger.error(f"Error in connectivity callback for {key}: {e}")
+
+        if get_api_pool().submit(probe, finished) is None:
+            self._waiting.pop(key, None)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Forget cached results whose key starts with prefix (all of them by default)"""
+        for key in [key for key in self._results if key.startswith(prefix)]:
+            del self._results[key]
+
+
+_connectivity_cache: Optional[ConnectivityCache] = None
+
+
+def get_connectivity_cache() -> ConnectivityCache:
+    """Get the global connectivity cache, creating it on first use (call from the GUI thread)"""
+    global _connectivity_cache
+    if _connectivity_cache is None:
+        _connectivity_cache = ConnectivityCache()
+    return _connectivity_cache
@@ -0,0 +1,184 @@
+# correlator_replay.py
+
+"""
+Stress-replay harness for VehicleEventCorrelator.
+
+Pushes recorded or synthetic bursts of <Vehicle Destruction> and <Actor Death>
+lines through the correlator on a simulated clock and prints the correlator
+counters, so destroyed_timeout and the score threshold can be tuned from data.
+
+Usage:
+    python correlator_replay.py --log Game.log --rate 200
+    python correlator_replay.py --synthetic 500 --rate 50 --death-delay 0.4
+    python correlator_replay.py --synthetic 500 --sweep-timeout 0.25,0.5,1,2
+"""
+
+import argparse
+import json
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from vehicle_event_correlator import VehicleEventCorrelator
+
+RELEVANT_MARKERS = ("<Vehicle Destruction>", "<Actor Death>", "CEntity::OnOwnerRemoved")
+
+SYNTHETIC_SHIPS = ["ANVL_Arrow", "AEGS_Gladius", "DRAK_Cutlass_Black", "RSI_Constellation_Andromeda", "ORIG_300i"]
+
+
+def load_log_lines(path: str) -> List[str]:
+    """Load the correlator-relevant lines from a recorded Game.log"""
+    lines = []
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if any(marker in line for marker in RELEVANT_MARKERS):
+                lines.append(line.strip())
+    return lines
+
+
+def _format_timestamp(moment: datetime) -> str:
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.') + f"{moment.microsecond // 1000:03d}Z"
+
+
+def vehicle_destruction_line(timestamp: str, vehicle: str, vehicle_id: int, zone: str,
+                             destroyer: str, destroyer_id: int, to_level: int = 2) -> str:
+    return (
+        f"<{timestamp}> [Notice] <Vehicle Destruction> CVehicle::OnAdvanceDestroyLevel: "
+        f"Vehicle '{vehicle}_{vehicle_id}' [{vehicle_id}] in zone '{zone}' "
+        f"[pos x: 100.0, y: 200.0, z: 300.0 vel x: 0.0, y: 0.0, z: 0.0] "
+        f"driven by 'unknown' [0] advanced from destroy level {to_level - 1} to {to_level} "
+        f"caused by '{destroyer}' [{destroyer_id}] with 'Combat' [Team_VehicleFeatures][Vehicle]"
+    )
+
+
+def actor_death_line(timestamp: str, victim: str, victim_id: int, zone: str,
+                     attacker: str, attacker_id: int) -> str:
+    return (
+        f"<{timestamp}> [Notice] <Actor Death> CActor::Kill: '{victim}' [{victim_id}] "
+        f"in zone '{zone}' killed by '{attacker}' [{attacker_id}] using 'unknown' [Class unknown] "
+        f"with damage type 'VehicleDestruction' from direction x: 0.0, y: 0.0, z: 0.0 [Team_ActorTech][Actor]"
+    )
+
+
+def generate_synthetic_burst(count: int, rate: float = 10.0, death_delay: float = 0.3, orphan_ratio: float = 0.2,
+                             npc_ratio: float = 0.1, seed: int = 0) -> List[Dict]:
+    """
+    Generate a burst of vehicle destructions with (optionally) matching occupant deaths.
+
+    Returns a list of {'offset': seconds, 'line': str} records sorted by offset.
+    rate is the number of vehicle destructions per second, death_delay the mean
+    gap before the occupant death line, orphan_ratio the share of destructions
+    with no occupant death (empty ships) and npc_ratio the share of occupant
+    deaths that belong to NPC crew.
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for index in range(count):
+        offset = index / rate if rate > 0 else 0.0
+        ship = rng.choice(SYNTHETIC_SHIPS)
+        vehicle_id = 200000000000 + index
+        zone = f"{ship}_{vehicle_id}"
+        attacker = f"Hunter{index % 7}"
+        moment = start + timedelta(seconds=offset)
+        records.append({
+            'offset': offset,
+            'line': vehicle_destruction_line(_format_timestamp(moment), ship, vehicle_id, zone, attacker, 1000 + index % 7)
+        })
+
+        if rng.random() < orphan_ratio:
+            continue
+
+        victim = f"PU_Pilot_{index}" if rng.random() < npc_ratio else f"Citizen{index}"
+        jitter = rng.uniform(0.5, 1.5) * death_delay
+        death_moment = moment + timedelta(seconds=jitter)
+        records.append({
+            'offset': offset + jitter,
+            'line': actor_death_line(_format_timestamp(death_moment), victim, 5000 + index, zone, attacker, 1000 + index % 7)
+        })
+
+    records.sort(key=lambda record: record['offset'])
+    return records
+
+
+def replay(lines: Iterable[str], rate: float, destroyed_timeout: Optional[float] = None,
+           score_threshold: Optional[float] = None, offsets: Optional[List[float]] = None) -> Dict:
+    """
+    Replay lines through a fresh correlator on a simulated clock.
+
+    Lines are spaced 1/rate seconds apart unless explicit offsets (seconds from
+    the start of the burst) are given.
+    """
+    correlator = VehicleEventCorrelator()
+    if destroyed_timeout is not None:
+        correlator.destroyed_timeout = destroyed_timeout
+    if score_threshold is not None:
+        correlator.score_threshold = score_threshold
+
+    lines = list(lines)
+    interval = 1.0 / rate if rate > 0 else 0.0
+    if offsets:
+        clock = list(offsets)
+    else:
+        clock = [index * interval for index in range(len(lines))]
+
+    emitted = {'correlated_vehicle_kill': 0, 'vehicle_destruction': 0, 'other': 0}
+    now = 0.0
+    for now, line in zip(clock, lines):
+        _, events = correlator.process_log_line(line, current_time=now)
+        for event in events:
+            event_type = event.get('event_type')
+            emitted[event_type if event_type in emitted else 'other'] += 1
+
+    drain_time = now + max(correlator.destroyed_timeout, correlator.disabled_timeout, correlator.correlation_timeout) + 0.001
+    for event in correlator._cleanup_expired_events(drain_time):
+        event_type = event.get('event_type')
+        emitted[event_type if event_type in emitted else 'other'] += 1
+
+    return {
+        'lines': len(lines),
+        'rate': rate,
+        'destroyed_timeout': correlator.destroyed_timeout,
+        'score_threshold': correlator.score_threshold,
+        'emitted': emitted,
+        'stats': correlator.get_stats()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay vehicle/actor death bursts through the correlator")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--log', help="Recorded Game.log to replay")
+    source.add_argument('--synthetic', type=int, metavar='N', help="Generate N synthetic vehicle destructions")
+    parser.add_argument('--rate', type=float, default=100.0,
+                        help="Recorded logs: lines per simulated second. Synthetic: destructions per second (default 100)")
+    parser.add_argument('--death-delay', type=float, default=0.3, help="Mean delay between destruction and occupant death")
+    parser.add_argument('--orphan-ratio', type=float, default=0.2, help="Share of synthetic ships destroyed empty")
+    parser.add_argument('--npc-ratio', type=float, default=0.1, help="Share of synthetic occupants that are NPCs")
+    parser.add_argument('--destroyed-timeout', type=float, help="Override destroyed_timeout")
+    parser.add_argument('--score-threshold', type=float, help="Override the correlation score threshold")
+    parser.add_argument('--sweep-timeout', help="Comma separated destroyed_timeout values to compare")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    offsets = None
+    if args.log:
+        lines = load_log_lines(args.log)
+    else:
+        records = generate_synthetic_burst(args.synthetic, args.rate, args.death_delay, args.orphan_ratio, args.npc_ratio, args.seed)
+        lines = [record['line'] for record in records]
+        offsets = [record['offset'] for record in records]
+
+    timeouts = [args.destroyed_timeout]
+    if args.sweep_timeout:
+        timeouts = [float(value) for value in args.sweep_timeout.split(',') if value.strip()]
+
+    results = [replay(lines, args.rate, timeout, args.score_threshold, offsets) for timeout in timeouts]
+    print(json.dumps(results if len(results) > 1 else results[0], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,86 +3,269 @@
 import requests
 import logging
 import base64
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from threading import Lock
 from urllib.parse import quote
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
-SESSION = requests.Session()
-PLAYER_DETAILS_CACHE: Dict[str, Dict[str, str]] = {}
+from profile_store import get_profile_store
+from avatar_store import get_avatar_store, AvatarStore
+from player_cache import get_player_cache
+from citizen_page import parse_citizen_page, RSI_BASE_URL
+from rsi_scheduler import get_rsi_scheduler, PRIORITY_ENRICHMENT
 
-def fetch_player_details(playername: str) -> Dict[str, str]:
-    if playername in PLAYER_DETAILS_CACHE:
-        return PLAYER_DETAILS_CACHE[playername]
+SESSION = get_rsi_scheduler().session
 
-    details = {"enlistment_date": "None", "occupation": "None", "org_name": "None", "org_tag": "None"}
+DEFAULT_IMAGE_URL = "https://cdn.robertsspaceindustries.com/static/images/account/avatar_default_big.jpg"
+AUTOCOMPLETE_URL = f"{RSI_BASE_URL}/api/spectrum/search/member/autocomplete"
+
+PROFILE_OK = "ok"
+PROFILE_NOT_FOUND = "not_found"
+PROFILE_TIMEOUT = "timeout"
+PROFILE_SERVER_ERROR = "server_error"
+PROFILE_ERROR = "error"
+
+# Negative-cache lifetimes: missing handles stay quiet for hours, transient failures are retried soon
+PROFILE_STATUS_TTLS = {
+    PROFILE_NOT_FOUND: 6 * 3600,
+    PROFILE_TIMEOUT: 60,
+    PROFILE_SERVER_ERROR: 120,
+    PROFILE_ERROR: 300,
+}
+
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="RSIFetch")
+# handle -> (shared result, one-element list holding the lookup's current priority)
+_INFLIGHT_PROFILES: Dict[str, Tuple[Future, List[int]]] = {}
+_INFLIGHT_LOCK = Lock()
+
+def _default_details() -> Dict[str, str]:
+    return {"enlistment_date": "None", "occupation": "None", "org_name": "None", "org_tag": "None"}
+
+def _citizen_url(playername: str) -> str:
+    return f"{RSI_BASE_URL}/citizens/{quote(playername)}"
+
+def _profile_from_stored(stored: Dict[str, Any]) -> Dict[str, str]:
+    profile = _default_details()
+    profile.update({key: value for key, value in stored['details'].items() if key in profile})
+    profile["avatar_url"] = stored['avatar_url'] or DEFAULT_IMAGE_URL
+    profile["image_url"] = stored['image_url'] or DEFAULT_IMAGE_URL
+    return profile
+
+def _stored_image_usable(stored: Dict[str, Any]) -> bool:
+    return stored['image_url'] == DEFAULT_IMAGE_URL or get_avatar_store().exists(stored['image_url'])
+
+def _status_for_response(status_code: int) -> str:
+    if status_code == 404:
+        return PROFILE_NOT_FOUND
+    # Throttling is as transient as a server error, so it gets the same short negative-cache TTL
+    if status_code == 429 or status_code >= 500:
+        return PROFILE_SERVER_ERROR
+    return PROFILE_ERROR
+
+def _status_for_exception(error: Exception) -> str:
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError, FutureTimeoutError)):
+        return PROFILE_TIMEOUT
+    return PROFILE_ERROR
+
+def profile_cache_ttl(status: str) -> Optional[int]:
+    """TTL for caching a lookup with the given status, or None to use the cache default"""
+    return PROFILE_STATUS_TTLS.get(status)
+
+def _fetch_org_details(playername: str, priority: List[int]) -> Tuple[Dict[str, str], str]:
+    """Read org and occupation badges from the Spectrum member autocomplete"""
+    details = {"occupation": "None", "org_name": "None", "org_tag": "None"}
+    autocomplete_name = playername[:-1] if len(playername) > 1 else playername
+    payload = {"community_id": "1", "text": autocomplete_name}
+    headers = {"Content-Type": "application/json"}
+    response = get_rsi_scheduler().post(AUTOCOMPLETE_URL, priority[0], headers=headers, json=payload, timeout=10)
+    if response.status_code == 200:
+        data = response.json()
+        correct_player = None
+        for member in data.get("data", {}).get("members", []):
+            if member.get("nickname", "").lower() == playername.lower():
+                correct_player = member
+                break
+        if correct_player:
+            badges = correct_player.get("meta", {}).get("badges", [])
+            for badge in badges:
+                if "url" in badge and "/orgs/" in badge["url"]:
+                    details["org_name"] = badge.get("name", "None")
+                    parts = badge["url"].split('/')
+                    details["org_tag"] = parts[-1] if parts[-1] else "None"
+                elif "name" in badge and details["occupation"] == "None":
+                    details["occupation"] = badge.get("name", "None")
+    else:
+        logging.error(f"Autocomplete API request failed for {playername} with status code {response.status_code}")
+        return details, _status_for_response(response.status_code)
+    return details, PROFILE_OK
+
+def _download_avatar(image_url: str, playername: str, priority: List[int]) -> Tuple[Optional[str], str]:
+    """Download an avatar into the avatar store and return (local file URL, status)"""
     try:
-        url = f"https://robertsspaceindustries.com/citizens/{playername}"
-        response = SESSION.get(url, timeout=10)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            enlistment_label = soup.find("span", class_="label", string="Enlisted")
-            if enlistment_label:
-                enlistment_date_elem = enlistment_label.find_next("strong", class_="value")
-                if enlistment_date_elem:
-                    details["enlistment_date"] = enlistment_date_elem.text.strip()
-
-        api_url = "https://robertsspaceindustries.com/api/spectrum/search/member/autocomplete"
-        autocomplete_name = playername[:-1] if len(playername) > 1 else playername
-        payload = {"community_id": "1", "text": autocomplete_name}
-        headers2 = {"Content-Type": "application/json"}
-        response2 = SESSION.post(api_url, headers=headers2, json=payload, timeout=10)
-        if response2.status_code == 200:
-            data = response2.json()
-            correct_player = None
-            for member in data.get("data", {}).get("members", []):
-                if member.get("nickname", "").lower() == playername.lower():
-                    correct_player = member
-                    break
-            if correct_player:
-                badges = correct_player.get("meta", {}).get("badges", [])
-                for badge in badges:
-                    if "url" in badge and "/orgs/" in badge["url"]:
-                        details["org_name"] = badge.get("name", "None")
-                        parts = badge["url"].split('/')
-                        details["org_tag"] = parts[-1] if parts[-1] else "None"
-                    elif "name" in badge and details["occupation"] == "None":
-                        details["occupation"] = badge.get("name", "None")
-        else:
-            logging.error(f"Autocomplete API request failed for {playername} with status code {response2.status_code}")
+        r = get_rsi_scheduler().get(image_url, priority[0], timeout=10)
+        if r.status_code != 200:
+            return None, _status_for_response(r.status_code)
+        return get_avatar_store().store(r.content, r.headers.get("Content-Type", "image/jpeg") or "image/jpeg"), PROFILE_OK
     except Exception as e:
-        logging.error(f"Error fetching player details for {playername}: {e}")
+        logging.error(f"Error fetching avatar for {playername}: {e}")
+        return None, _status_for_exception(e)
 
-    PLAYER_DETAILS_CACHE[playername] = details
+def fetch_player_details(playername: str, priority: int = PRIORITY_ENRICHMENT) -> Dict[str, str]:
+    cache = get_player_cache()
+    cached_details = cache.get_player_details(playername)
+    if cached_details is not None:
+        return cached_details
+
+    profile = fetch_player_profile(playername, priority)
+    details = {key: profile[key] for key in _default_details()}
+    cache.cache_player_details(playername, details, ttl_seconds=profile_cache_ttl(profile["status"]))
     return details
 
-def fetch_victim_image_base64(victim_name: str) -> str:
-    default_image_url = "https://cdn.robertsspaceindustries.com/static/images/account/avatar_default_big.jpg"
-    url = f"https://robertsspaceindustries.com/citizens/{quote(victim_name)}"
-    final_url = default_image_url
+def fetch_victim_image_base64(victim_name: str, priority: int = PRIORITY_ENRICHMENT) -> str:
+    cache = get_player_cache()
+    cached_image = cache.get_player_image_data(victim_name)
+    if cached_image is not None:
+        return cached_image
+
+    profile = fetch_player_profile(victim_name, priority)
+    image_path = AvatarStore.path_for_url(profile["image_url"])
+    if image_path is None:
+        cache.cache_player_image_data(victim_name, DEFAULT_IMAGE_URL, ttl_seconds=profile_cache_ttl(profile["status"]))
+        return DEFAULT_IMAGE_URL
     try:
-        response = SESSION.get(url, timeout=10)
+        with open(image_path, 'rb') as f:
+            image_data_uri = f"data:image/png;base64,{base64.b64encode(f.read()).decode('utf-8')}"
+    except OSError as e:
+        logging.error(f"Error reading stored avatar for {victim_name}: {e}")
+        return DEFAULT_IMAGE_URL
+    cache.cache_player_image_data(victim_name, image_data_uri, ttl_seconds=profile_cache_ttl(profile["status"]))
+    return image_data_uri
+
+def fetch_player_profile(playername: str, priority: int = PRIORITY_ENRICHMENT) -> Dict[str, str]:
+    """
+    Fetch profile details and avatar for a player in one pass.
+
+    Concurrent calls for the same handle share a single lookup, which is raised
+    to the most urgent priority among its callers (rsi_scheduler.PRIORITY_*). The citizen page
+    is downloaded and parsed once for both the enlistment date and the avatar URL;
+    the Spectrum autocomplete lookup runs concurrently with the page and avatar
+    downloads. Results are kept in the on-disk profile store: fresh entries skip
+    the network entirely and stale ones are revalidated with If-None-Match /
+    If-Modified-Since when the page supplied validators.
+    The avatar is saved to the avatar store; 'image_url' is the local file URL of
+    its thumbnail (or the remote default avatar). Returns the fetch_player_details
+    fields plus 'avatar_url', 'image_url' and 'status' (one of the PROFILE_*
+    constants; see profile_cache_ttl for how long to cache it).
+    """
+    key = playername.lower()
+    with _INFLIGHT_LOCK:
+        inflight = _INFLIGHT_PROFILES.get(key)
+        owner = inflight is None
+        if owner:
+            inflight = (Future(), [priority])
+            _INFLIGHT_PROFILES[key] = inflight
+        else:
+            inflight[1][0] = min(inflight[1][0], priority)
+        future, lookup_priority = inflight
+
+    if not owner:
+        logging.debug(f"Joining in-flight profile lookup for {playername}")
+        return dict(future.result())
+
+    try:
+        profile = _fetch_player_profile(playername, lookup_priority)
+        future.set_result(profile)
+        return dict(profile)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT_PROFILES.pop(key, None)
+
+def _fetch_player_profile(playername: str, priority: List[int]) -> Dict[str, str]:
+    store = get_profile_store()
+    stored = store.get(playername)
+    if stored and stored['fresh'] and _stored_image_usable(stored):
+        profile = _profile_from_stored(stored)
+        profile["status"] = PROFILE_NOT_FOUND if stored['details'].get("not_found") else PROFILE_OK
+        return profile
+
+    conditional_headers = {}
+    if stored and _stored_image_usable(stored):
+        if stored['etag']:
+            conditional_headers["If-None-Match"] = stored['etag']
+        if stored['last_modified']:
+            conditional_headers["If-Modified-Since"] = stored['last_modified']
+
+    profile: Dict[str, str] = _default_details()
+    profile["avatar_url"] = DEFAULT_IMAGE_URL
+    profile["image_url"] = DEFAULT_IMAGE_URL
+    profile["status"] = PROFILE_OK
+
+    # A revalidation usually ends in a 304, so only start the autocomplete up front when there is nothing to revalidate
+    org_future = None if conditional_headers else _FETCH_EXECUTOR.submit(_fetch_org_details, playername, priority)
+
+    etag = None
+    last_modified = None
+    try:
+        response = get_rsi_scheduler().get(_citizen_url(playername), priority[0], headers=conditional_headers, timeout=10)
+        if response.status_code == 304 and conditional_headers:
+            logging.debug(f"Citizen page for {playername} not modified; reusing stored profile")
+            store.touch(playername)
+            profile = _profile_from_stored(stored)
+            profile["status"] = PROFILE_OK
+            return profile
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            profile_pic = soup.select_one('.thumb img')
-            if profile_pic and profile_pic.has_attr("src"):
-                src = profile_pic['src']
-                if src.startswith("http://") or src.startswith("https://"):
-                    final_url = src
-                else:
-                    if not src.startswith("/"):
-                        src = "/" + src
-                    final_url = f"https://robertsspaceindustries.com{src}"
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            enlistment_date, avatar_url = parse_citizen_page(response.content)
+            if enlistment_date:
+                profile["enlistment_date"] = enlistment_date
+            if avatar_url:
+                profile["avatar_url"] = avatar_url
+        else:
+            profile["status"] = _status_for_response(response.status_code)
     except Exception as e:
-        logging.error(f"Error determining victim image URL for {victim_name}: {e}")
-        final_url = default_image_url
+        logging.error(f"Error fetching citizen page for {playername}: {e}")
+        profile["status"] = _status_for_exception(e)
+
+    if profile["status"] != PROFILE_OK:
+        if org_future is not None:
+            org_future.cancel()
+        if profile["status"] != PROFILE_NOT_FOUND and stored and _stored_image_usable(stored):
+            logging.info(f"Serving stale stored profile for {playername} after {profile['status']}")
+            stale_profile = _profile_from_stored(stored)
+            stale_profile["status"] = profile["status"]
+            return stale_profile
+        if profile["status"] == PROFILE_NOT_FOUND:
+            logging.info(f"Citizen {playername} not found; caching for {PROFILE_STATUS_TTLS[PROFILE_NOT_FOUND]}s")
+            details = _default_details()
+            details["not_found"] = True
+            store.put(playername, details, DEFAULT_IMAGE_URL, DEFAULT_IMAGE_URL,
+                      ttl_seconds=PROFILE_STATUS_TTLS[PROFILE_NOT_FOUND])
+        return profile
+
+    if org_future is None:
+        org_future = _FETCH_EXECUTOR.submit(_fetch_org_details, playername, priority)
+
+    image_url, image_status = _download_avatar(profile["avatar_url"], playername, priority)
+    if image_url:
+        profile["image_url"] = image_url
+    elif image_status != PROFILE_OK:
+        profile["status"] = image_status
+
     try:
-        r = SESSION.get(final_url, timeout=10)
-        if r.status_code == 200:
-            content_type = r.headers.get("Content-Type", "image/jpeg")
-            if not content_type or "image" not in content_type:
-                content_type = "image/jpeg"
-            b64_data = base64.b64encode(r.content).decode("utf-8")
-            return f"data:{content_type};base64,{b64_data}"
+        org_details, org_status = org_future.result(timeout=15)
+        profile.update(org_details)
+        if org_status != PROFILE_OK:
+            profile["status"] = org_status
     except Exception as e:
-        logging.error(f"Error fetching actual image data for {victim_name}: {e}")
-    return default_image_url
\ No newline at end of file
+        logging.error(f"Error fetching player details for {playername}: {e}")
+        profile["status"] = _status_for_exception(e)
+
+    # Partial profiles are only cached briefly in memory so the missing half is retried soon
+    if profile["status"] == PROFILE_OK:
+        details = {key: profile[key] for key in _default_details()}
+        store.put(playername, details, profile["avatar_url"], profile["image_url"], etag, last_modified)
+    return profile
@@ -159,8 +159,10 @@ class RegisteredKillTemplate(KillEventTemplate):
                         {t('Ship Type')}: {ship_type}
                     </div>"""
         
+        card_id_attr = f' id="{data["card_id"]}"' if data.get('card_id') else ''
+        
         return f"""
-<div style="
+<div{card_id_attr} style="
     background: {colors['background']}; 
     border-left: 4px solid #ff4444; 
     border-radius: 8px; 
@@ -237,8 +239,10 @@ class DeathEventTemplate(KillEventTemplate):
         else:
             org_section = f"""<div style="color: {colors['text_secondary']}; font-size: 16px; font-family: 'Consolas', monospace; margin: 2px 0;">{t('Organization')}: NO ORG</div>"""
         
+        card_id_attr = f' id="{data["card_id"]}"' if data.get('card_id') else ''
+        
         return f"""
-<div style="
+<div{card_id_attr} style="
     background: {colors['background']}; 
     border-left: 4px solid #ff4444; 
     border-radius: 8px; 
@@ -0,0 +1,135 @@
+# image_loader.py
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Optional, Set
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from avatar_store import AvatarStore
+from fetch import fetch_player_profile, DEFAULT_IMAGE_URL
+from rsi_scheduler import get_rsi_scheduler, PRIORITY_COSMETIC
+
+PIXMAP_CACHE_LIMIT = 64
+
+
+def avatar_key(username: str) -> str:
+    return f"avatar:{username.lower()}"
+
+
+def url_key(url: str) -> str:
+    return f"url:{url}"
+
+
+class ImageLoader(QObject):
+    """
+    Loads profile, guild and default images off the GUI thread.
+
+    Workers fetch and decode into a QImage; the GUI thread turns it into a
+    QPixmap, keeps it in a small LRU and announces it with pixmap_ready(key, pixmap).
+    Player avatars come from the profile pipeline, so they are read from the
+    avatar store on disk when the profile is already known. Failures are
+    reported with load_failed(key, reason). Must be created on the GUI thread.
+    """
+
+    pixmap_ready = pyqtSignal(str, QPixmap)
+    load_failed = pyqtSignal(str, str)
+    _image_decoded = pyqtSignal(str, QImage)
+
+    def __init__(self, max_workers: int = 2, cache_limit: int = PIXMAP_CACHE_LIMIT, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ImageLoader")
+        self._cache: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self._cache_limit = cache_limit
+        self._pending: Set[str] = set()
+        self._lock = Lock()
+        self.logger = logging.getLogger(__name__)
+        self._image_decoded.connect(self._on_image_decoded)
+
+    def cached(self, key: str) -> Optional[QPixmap]:
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+        return pixmap
+
+    def load_url(self, url: str, priority: int = PRIORITY_COSMETIC) -> str:
+        """Queue an image URL; returns the key pixmap_ready/load_failed will carry"""
+        key = url_key(url)
+        self._load(key, lambda: self._download(url, priority))
+        return key
+
+    def load_player_avatar(self, username: str, priority: int = PRIORITY_COSMETIC) -> str:
+        """Queue a player's RSI avatar; returns the key pixmap_ready/load_failed will carry"""
+        key = avatar_key(username)
+        self._load(key, lambda: self._player_avatar(username, priority))
+        return key
+
+    def _load(self, key: str, job: Callable[[], QImage]) -> None:
+        pixmap = self.cached(key)
+        if pixmap is not None:
+            # Delivered on the next event loop pass so callers can record the key first
+            QTimer.singleShot(0, lambda: self.pixmap_ready.emit(key, pixmap))
+            return
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        try:
+            self._executor.submit(self._run, key, job)
+        except RuntimeError:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _run(self, key: str, job: Callable[[], QImage]) -> None:
+        try:
+            image = job()
+        except Exception as e:
+            image = None
+            self.logger.warning(f"Image load failed for {key}: {e}")
+        if image is None or image.isNull():
+            with self._lock:
+                self._pending.discard(key)
+            self.load_failed.emit(key, "image could not be loaded")
+            return
+        self._image_decoded.emit(key, image)
+
+    @staticmethod
+    def _download(url: str, priority: int) -> QImage:
+        response = get_rsi_scheduler().get(url, priority, timeout=10)
+        response.raise_for_status()
+        return QImage.fromData(response.content)
+
+    def _player_avatar(self, username: str, priority: int) -> QImage:
+        profile = fetch_player_profile(username, priority)
+        image_path = AvatarStore.path_for_url(profile.get("image_url"))
+        if image_path:
+            return QImage(image_path)
+        return self._download(DEFAULT_IMAGE_URL, priority)
+
+    def _on_image_decoded(self, key: str, image: QImage) -> None:
+        with self._lock:
+            self._pending.discard(key)
+        pixmap = QPixmap.fromImage(image)
+        self._cache[key] = pixmap
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_limit:
+            self._cache.popitem(last=False)
+        self.pixmap_ready.emit(key, pixmap)
+
+    def shutdown(self) -> None:
+        """Drop queued loads; running ones finish but their results are discarded with the loader"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_image_loader: Optional[ImageLoader] = None
+
+
+def get_image_loader() -> ImageLoader:
+    """Get the global image loader, creating it on first use (call from the GUI thread)"""
+    global _image_loader
+    if _image_loader is None:
+        _image_loader = ImageLoader()
+    return _image_loader
@@ -0,0 +1,183 @@
+# kill_backfill.py
+
+import logging
+from collections import deque
+from threading import Event, Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from api_pool import get_api_pool
+from api_throttle import get_api_throttle, retry_delay
+from Kill_thread import interpret_api_result, interpret_api_response
+from rsi_scheduler import parse_retry_after
+
+# Advertised in the ping response's 'capabilities' when the server accepts batched submissions
+BULK_CAPABILITY = "kills_bulk"
+BULK_SUFFIX = "/bulk"
+
+BULK_BATCH_SIZE = 50
+SINGLE_BATCH_SIZE = 10
+# Leaves at least one API pool worker free for clip updates while a backfill runs
+MAX_CONCURRENCY = 3
+MAX_ATTEMPTS = 4
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_SECONDS = 30.0
+
+
+class KillBackfill(QObject):
+    """
+    Submits a set of missing kills in batches with bounded concurrency.
+
+    With a bulk endpoint each batch is a single POST; otherwise each batch
+    is sent kill by kill over the pooled keep-alive connections of the API
+    client. Batches run on the shared API worker pool, at most
+    MAX_CONCURRENCY at a time, and every request also waits for a slot from
+    the API concurrency controller, which narrows or pauses delivery when the
+    server struggles or rate limits. Retryable failures (network errors,
+    5xx, 429) are retried per kill with jittered backoff.
+
+    headers (Content-Type and X-API-Key included) go with every request.
+
+    Each finished batch is reported with batch_finished([(local_key, message, data), ...])
+    with the messages of interpret_api_result; finished() follows the last one.
+    """
+
+    batch_finished = pyqtSignal(list)
+    finished = pyqtSignal()
+
+    def __init__(self, endpoint: str, headers: Dict[str, str], verify_ssl: bool = True,
+                 bulk_endpoint: Optional[str] = None, concurrency: int = MAX_CONCURRENCY,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.endpoint = endpoint
+        self.headers = dict(headers, **{'Content-Type': 'application/json'})
+        self.bulk_endpoint = bulk_endpoint
+        self.verify_ssl = verify_ssl
+        self.concurrency = concurrency
+        self._batches: deque = deque()
+        self._cancelled = Event()
+        self._lock = Lock()
+        self._remaining = 0
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def bulk_endpoint_for(api_endpoint: str, capabilities: List[str]) -> Optional[str]:
+        """The bulk submit URL (kills endpoint + /bulk) if the server advertised it, else None"""
+        if BULK_CAPABILITY not in (capabilities or []):
+            return None
+        return f"{api_endpoint.rstrip('/')}{BULK_SUFFIX}"
+
+    def start(self, kills: List[dict]) -> None:
+        """Begin submitting kills (dicts with 'local_key' and 'payload') in the background"""
+        batch_size = BULK_BATCH_SIZE if self.bulk_endpoint else SINGLE_BATCH_SIZE
+        batches = [kills[i:i + batch_size] for i in range(0, len(kills), batch_size)]
+        self._remaining = len(batches)
+        if not batches:
+            self.finished.emit()
+            return
+        mode = "bulk" if self.bulk_endpoint else "pipelined"
+        self.logger.info(f"Backfilling {len(kills)} kills in {len(batches)} {mode} batches, {self.concurrency} at a time")
+        self._batches.extend(batches)
+        for _ in range(min(self.concurrency, len(batches))):
+            get_api_pool().submit(self._drain)
+
+    def cancel(self) -> None:
+        """Stop after the requests already in flight; unsent kills are not reported"""
+        self._cancelled.set()
+        with self._lock:
+            self._batches.clear()
+
+    def _drain(self) -> None:
+        while not self._cancelled.is_set():
+            with self._lock:
+                if not self._batches:
+                    return
+                batch = self._batches.popleft()
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[dict]) -> None:
+        try:
+            results = None
+            if self.bulk_endpoint:
+                results = self._send_bulk(batch)
+            if results is None:
+                results = []
+                for kill in batch:
+                    if self._cancelled.is_set():
+                        return
+                    results.append((kill["local_key"],) + self._send_single(kill["payload"]))
+        except Exception as e:
+            self.logger.error(f"Backfill batch failed: {e}")
+            results = [(kill["local_key"], f"API request failed: {e}", {}) for kill in batch]
+        if self._cancelled.is_set():
+            return
+        self.batch_finished.emit(results)
+        with self._lock:
+            self._remaining -= 1
+            done = self._remaining == 0
+        if done:
+            self.finished.emit()
+
+    def _post(self, url: str, payload: Any) -> requests.Response:
+        if not self.verify_ssl:
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        return get_api_throttle().post(url, abort=self._cancelled, json=payload,
+                                       headers=self.headers, verify=self.verify_ssl)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> None:
+        self._cancelled.wait(retry_delay(attempt, RETRY_BASE_SECONDS, RETRY_MAX_SECONDS, retry_after))
+
+    def _send_single(self, payload: dict) -> Tuple[str, Any]:
+        error = ""
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            retry_after = None
+            try:
+                resp = self._post(self.endpoint, payload)
+                result = interpret_api_response(resp)
+                if result is not None:
+                    return result
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                error = f"Server error: {resp.status_code}"
+            except (requests.exceptions.RequestException, ValueError) as e:
+                error = str(e)
+            if attempt < MAX_ATTEMPTS and not self._cancelled.is_set():
+                self._backoff(attempt, retry_after)
+        return f"API request failed after {MAX_ATTEMPTS} attempts: {error}", {}
+
+    def _send_bulk(self, batch: List[dict]) -> Optional[List[Tuple[str, str, Any]]]:
+        """
+        POST {"kills": [payload, ...]} and map the per-kill 'results' (same order) back.
+
+        Returns None if the bulk call keeps failing or its response cannot be
+        read, so the caller falls back to sending the batch kill by kill.
+        """
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            retry_after = None
+            try:
+                resp = self._post(self.bulk_endpoint, {"kills": [kill["payload"] for kill in batch]})
+                if resp.status_code in (200, 201, 207):
+                    items = resp.json().get("results", [])
+                    if len(items) != len(batch):
+                        self.logger.warning(f"Bulk response had {len(items)} results for {len(batch)} kills; sending individually")
+                        return None
+                    results = []
+                    for kill, item in zip(batch, items):
+                        status = int(item.get("status", 0))
+                        result = interpret_api_result(status, item, item.get("message", ""))
+                        if result is None:
+                            result = self._send_single(kill["payload"])
+                        results.append((kill["local_key"],) + result)
+                    return results
+                if resp.status_code in (404, 405):
+                    self.logger.warning(f"Bulk endpoint {self.bulk_endpoint} answered {resp.status_code}; sending individually")
+                    self.bulk_endpoint = None
+                    return None
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            except (requests.exceptions.RequestException, ValueError, TypeError, AttributeError) as e:
+                self.logger.warning(f"Bulk backfill attempt {attempt} failed: {e}")
+            if attempt < MAX_ATTEMPTS and not self._cancelled.is_set():
+                self._backoff(attempt, retry_after)
+        return None
@@ -1,21 +1,26 @@
 # kill_event_formatter.py
 
 import re
+import uuid
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Callable
 from urllib.parse import quote
 
-from fetch import fetch_player_details, fetch_victim_image_base64
+from fetch import fetch_player_details, fetch_victim_image_base64, fetch_player_profile, profile_cache_ttl, PROFILE_ERROR
 from kill_parser import KillParser
 from language_manager import t
 from html_templates import RegisteredKillTemplate, DeathEventTemplate
 from player_cache import get_player_cache
+from profile_enricher import get_profile_enricher
+from rsi_scheduler import PRIORITY_ENRICHMENT
 
 
 class KillEventFormatter(ABC):
     """Base class for formatting kill/death events"""
     
+    PLACEHOLDER_IMAGE_URL = "https://cdn.robertsspaceindustries.com/static/images/account/avatar_default_big.jpg"
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
     
@@ -36,13 +41,12 @@ class KillEventFormatter(ABC):
             return cached_details
         
         try:
-            details = fetch_player_details(player_name)
-            cache.cache_player_details(player_name, details)
-            return details
+            # fetch_player_details caches the result with the TTL for its lookup status
+            return fetch_player_details(player_name)
         except Exception as e:
             logging.error(f"Failed to fetch player details for {player_name}: {e}")
             error_details = {'org_name': t('Error'), 'org_tag': t('Error')}
-            cache.cache_player_details(player_name, error_details)
+            cache.cache_player_details(player_name, error_details, ttl_seconds=profile_cache_ttl(PROFILE_ERROR))
             return error_details
     
     @staticmethod
@@ -54,15 +58,99 @@ class KillEventFormatter(ABC):
             return cached_image
         
         try:
-            image_data = fetch_victim_image_base64(player_name)
-            cache.cache_player_image(player_name, image_data)
-            return image_data
+            # fetch_victim_image_base64 caches the result with the TTL for its lookup status
+            return fetch_victim_image_base64(player_name)
         except Exception as e:
             logging.error(f"Failed to fetch player image for {player_name}: {e}")
             default_image = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAQUBAScY42YAAAAASUVORK5CYII="
-            cache.cache_player_image(player_name, default_image)
+            cache.cache_player_image(player_name, default_image, ttl_seconds=profile_cache_ttl(PROFILE_ERROR))
             return default_image
     
+    @staticmethod
+    def safe_get_player_profile(player_name: str, priority: int = PRIORITY_ENRICHMENT) -> Tuple[Dict[str, str], str]:
+        """Fetch details and image together with one citizen page download, filling the cache"""
+        cache = get_player_cache()
+        cached_details = cache.get_player_details(player_name)
+        cached_image = cache.get_player_image(player_name)
+        if cached_details is not None and cached_image is not None:
+            return cached_details, cached_image
+        
+        try:
+            profile = fetch_player_profile(player_name, priority)
+        except Exception as e:
+            logging.error(f"Failed to fetch player profile for {player_name}: {e}")
+            return (
+                KillEventFormatter.safe_get_player_details(player_name),
+                KillEventFormatter.safe_get_player_image(player_name)
+            )
+        
+        details = {key: profile[key] for key in ('enlistment_date', 'occupation', 'org_name', 'org_tag')}
+        image_data = profile['image_url']
+        ttl_seconds = profile_cache_ttl(profile['status'])
+        cache.cache_player_details(player_name, details, ttl_seconds=ttl_seconds)
+        cache.cache_player_image(player_name, image_data, ttl_seconds=ttl_seconds)
+        return details, image_data
+    
+    @staticmethod
+    def placeholder_details() -> Dict[str, str]:
+        """Profile details shown on a card while enrichment is still in flight"""
+        return {'enlistment_date': 'None', 'occupation': 'None', 'org_name': t('Loading...'), 'org_tag': 'None'}
+    
+    @staticmethod
+    def new_card_id() -> str:
+        """Create a DOM id used to patch an enriched card into the feed"""
+        return f"card-{uuid.uuid4().hex[:12]}"
+    
+    def render_with_enrichment(
+        self,
+        player_name: str,
+        template_data: Dict[str, Any],
+        image_key: str,
+        render: Callable[[Dict[str, Any]], str],
+        on_enriched: Optional[Callable[[str, str], None]] = None,
+        cached_only: bool = False,
+        card_id: Optional[str] = None
+    ) -> str:
+        """
+        Render a card for player_name.
+        
+        Without on_enriched the profile is fetched synchronously. With it, the card is
+        rendered at once from whatever the cache already holds and re-rendered on the
+        enrichment pool once the profile arrives; on_enriched receives (card_id, readout).
+        With cached_only nothing is fetched: the card is rendered from the cache (or
+        placeholders) and keeps card_id, so a stored record can be re-displayed offline.
+        """
+        if on_enriched is None and not cached_only:
+            template_data['details'], template_data[image_key] = self.safe_get_player_profile(player_name)
+            return render(template_data)
+        
+        cache = get_player_cache()
+        cached_details = cache.get_player_details(player_name)
+        cached_image = cache.get_player_image(player_name)
+        template_data['details'] = cached_details if cached_details is not None else self.placeholder_details()
+        template_data[image_key] = cached_image if cached_image is not None else self.PLACEHOLDER_IMAGE_URL
+        if cached_only:
+            if card_id:
+                template_data['card_id'] = card_id
+            return render(template_data)
+        if cached_details is not None and cached_image is not None:
+            return render(template_data)
+        
+        card_id = self.new_card_id()
+        template_data['card_id'] = card_id
+        readout = render(template_data)
+        
+        def load_profile() -> Tuple[Dict[str, str], str]:
+            return self.safe_get_player_profile(player_name)
+        
+        def deliver(profile: Tuple[Dict[str, str], str]) -> None:
+            enriched_data = dict(template_data)
+            enriched_data['details'], enriched_data[image_key] = profile
+            on_enriched(card_id, render(enriched_data))
+        
+        get_profile_enricher().submit(player_name, load_profile, deliver)
+        return readout
+    
     @staticmethod
     def create_player_profile_url(player_name: str) -> str:
         """Create RSI profile URL for a player"""
@@ -150,7 +238,10 @@ class RegisteredKillFormatter(KillEventFormatter):
         full_timestamp: str,
         last_game_mode: str,
         success: bool = True,
-        is_in_ship: bool = False
+        is_in_ship: bool = False,
+        on_enriched: Optional[Callable[[str, str], None]] = None,
+        cached_only: bool = False,
+        card_id: Optional[str] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """Format registered kill event"""
         try:
@@ -182,8 +273,6 @@ class RegisteredKillFormatter(KillEventFormatter):
                 damage_type, killer_ship, formatted_weapon, is_in_ship
             )
 
-            details = self.safe_get_player_details(victim)
-            victim_image_data_uri = self.safe_get_player_image(victim)
             victim_link = self.create_player_link(victim)
             display_timestamp = self.format_timestamp(full_timestamp)
             game_mode = self.format_game_mode(last_game_mode)
@@ -197,13 +286,14 @@ class RegisteredKillFormatter(KillEventFormatter):
                 'method': method,
                 'victim_link': victim_link,
                 'formatted_zone': formatted_zone,
-                'details': details,
-                'victim_image_data_uri': victim_image_data_uri,
                 'killer_ship': killer_ship,
                 'formatted_weapon': formatted_weapon
             }
             
-            readout = RegisteredKillTemplate.render(template_data)
+            readout = self.render_with_enrichment(
+                victim, template_data, 'victim_image_data_uri', RegisteredKillTemplate.render, on_enriched,
+                cached_only, card_id
+            )
             
             payload_ship = killer_ship if killer_ship.lower() not in [
                 t("vehicle destruction").lower(), t("player destruction").lower(), t("no ship").lower(), ""
@@ -233,7 +323,10 @@ class DeathEventFormatter(KillEventFormatter):
         data: dict,
         registered_user: str,
         timestamp: str,
-        last_game_mode: str
+        last_game_mode: str,
+        on_enriched: Optional[Callable[[str, str], None]] = None,
+        cached_only: bool = False,
+        card_id: Optional[str] = None
     ) -> str:
         """Format death event"""
         try:
@@ -246,8 +339,6 @@ class DeathEventFormatter(KillEventFormatter):
             formatted_zone = KillParser.format_zone(zone)
             formatted_weapon = KillParser.format_weapon(weapon)
 
-            details = self.safe_get_player_details(attacker)
-            attacker_image_data_uri = self.safe_get_player_image(attacker)
             attacker_link = self.create_player_link(attacker)
             
             game_mode = self.format_game_mode(last_game_mode)
@@ -257,13 +348,14 @@ class DeathEventFormatter(KillEventFormatter):
                 'timestamp': timestamp,
                 'attacker': attacker,
                 'attacker_link': attacker_link,
-                'details': details,
                 'formatted_zone': formatted_zone,
-                'formatted_weapon': formatted_weapon,
-                'attacker_image_data_uri': attacker_image_data_uri
+                'formatted_weapon': formatted_weapon
             }
 
-            return DeathEventTemplate.render(template_data)
+            return self.render_with_enrichment(
+                attacker, template_data, 'attacker_image_data_uri', DeathEventTemplate.render, on_enriched,
+                cached_only, card_id
+            )
             
         except Exception as e:
             self.logger.error(f"Error formatting death event: {e}")
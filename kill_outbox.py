@@ -0,0 +1,264 @@
+# kill_outbox.py
+
+import os
+import json
+import time
+import sqlite3
+import logging
+from collections import deque
+from threading import Condition, Thread
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import requests
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from Kill_thread import interpret_api_response
+from api_throttle import get_api_throttle, retry_delay
+from rsi_scheduler import parse_retry_after
+
+OUTBOX_DB_FILE = os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "SCTool_Tracker", "kill_outbox.db")
+
+RETRY_BASE_SECONDS = 2.0
+RETRY_MAX_SECONDS = 300.0
+# Entries older than this are dropped (and reported through expired); the kill stays in the local history
+MAX_AGE_SECONDS = 7 * 24 * 3600
+IDLE_POLL_SECONDS = 30.0
+LATENCY_SAMPLES = 200
+
+
+class KillOutbox(QObject):
+    """
+    Durable queue of kill and death submissions.
+
+    Every payload is written to a SQLite (WAL) table before anything is sent,
+    keyed by its local_key so the same kill is never queued twice. One delivery
+    worker drains due entries oldest first through the shared API concurrency
+    controller, sending local_key as the Idempotency-Key, and reschedules
+    failures with jittered exponential backoff (or the server's Retry-After). Entries left over from a previous run are
+    delivered once the worker is started again.
+
+    Final outcomes are reported with delivered(local_key, kind, message, data),
+    with the messages of interpret_api_result. Entries that were still not
+    delivered after MAX_AGE_SECONDS are dropped and reported together with
+    expired([(local_key, kind, last_error), ...]).
+    """
+
+    delivered = pyqtSignal(str, str, str, object)
+    expired = pyqtSignal(list)
+
+    def __init__(self, db_file: str = OUTBOX_DB_FILE, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.db_file = db_file
+        self._conn: Optional[sqlite3.Connection] = None
+        self._condition = Condition()
+        self._worker: Optional[Thread] = None
+        self._stopped = False
+        self._headers_provider: Optional[Callable[[], Optional[Dict[str, str]]]] = None
+        self.verify_ssl = True
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.stats: Dict[str, int] = {'enqueued': 0, 'delivered': 0, 'retries': 0, 'rejected': 0, 'expired': 0}
+        self.logger = logging.getLogger(__name__)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS outbox (
+                    local_key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    endpoint TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (next_attempt_at)")
+            conn.commit()
+            self._conn = conn
+            self.logger.info(f"Opened kill outbox at {self.db_file}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Could not open kill outbox {self.db_file}: {e}")
+        return self._conn
+
+    def start(self, headers_provider: Callable[[], Optional[Dict[str, str]]], verify_ssl: bool = True) -> None:
+        """
+        Start (or reconfigure) the delivery worker.
+
+        headers_provider is called before each send and may return None while
+        no API key is configured, which holds delivery without dropping anything.
+        """
+        with self._condition:
+            self._headers_provider = headers_provider
+            self.verify_ssl = verify_ssl
+            self._stopped = False
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(target=self._run, name="KillOutbox", daemon=True)
+                self._worker.start()
+            self._condition.notify()
+
+    def enqueue(self, local_key: str, endpoint: str, payload: dict, kind: str = "kill") -> bool:
+        """Record a submission durably and wake the worker; returns False if local_key is already queued"""
+        now = time.time()
+        with self._condition:
+            conn = self._connection()
+            if conn is None:
+                return False
+            try:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO outbox (local_key, kind, endpoint, payload, enqueued_at, next_attempt_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (local_key, kind, endpoint, json.dumps(payload), now, now)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error queueing {kind} {local_key}: {e}")
+                return False
+            if cursor.rowcount == 0:
+                self.logger.debug(f"{kind} {local_key} is already in the outbox")
+                return False
+            self.stats['enqueued'] += 1
+            self._condition.notify()
+        return True
+
+    def _next_due(self) -> Tuple[Optional[tuple], float]:
+        """Oldest due entry, or None with the seconds until the next one is due"""
+        conn = self._connection()
+        if conn is None:
+            return None, IDLE_POLL_SECONDS
+        now = time.time()
+        expired: List[Tuple[str, str, Optional[str]]] = conn.execute(
+            "SELECT local_key, kind, last_error FROM outbox WHERE enqueued_at < ?", (now - MAX_AGE_SECONDS,)
+        ).fetchall()
+        if expired:
+            conn.executemany("DELETE FROM outbox WHERE local_key = ?", [(entry[0],) for entry in expired])
+            conn.commit()
+            self.stats['expired'] += len(expired)
+            self.logger.warning(f"Dropped {len(expired)} outbox entries older than {MAX_AGE_SECONDS // 3600}h")
+            self.expired.emit([list(entry) for entry in expired])
+        row = conn.execute(
+            "SELECT local_key, kind, endpoint, payload, enqueued_at, attempts, next_attempt_at "
+            "FROM outbox ORDER BY next_attempt_at, enqueued_at LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None, IDLE_POLL_SECONDS
+        if row[6] > now:
+            return None, min(row[6] - now, IDLE_POLL_SECONDS)
+        return row, 0.0
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                try:
+                    row, wait = self._next_due()
+                except sqlite3.Error as e:
+                    self.logger.error(f"Error reading kill outbox: {e}")
+                    row, wait = None, IDLE_POLL_SECONDS
+                headers = self._headers_provider() if row is not None and self._headers_provider else None
+                if row is not None and headers is None:
+                    wait = IDLE_POLL_SECONDS
+                if row is None or headers is None:
+                    self._condition.wait(wait)
+                    continue
+                verify_ssl = self.verify_ssl
+            self._deliver(row, headers, verify_ssl)
+
+    def _deliver(self, row: tuple, headers: Dict[str, str], verify_ssl: bool) -> None:
+        local_key, kind, endpoint, payload, enqueued_at, attempts, _ = row
+        retry_after = None
+        try:
+            if not verify_ssl:
+                import urllib3
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            resp = get_api_throttle().post(
+                endpoint, headers=dict(headers, **{'Idempotency-Key': local_key}),
+                data=payload, timeout=10, verify=verify_ssl
+            )
+            result = interpret_api_response(resp)
+            if result is None:
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                error = f"Server error: {resp.status_code}"
+        except (requests.exceptions.RequestException, ValueError) as e:
+            result = None
+            error = str(e)
+
+        if result is None:
+            self._reschedule(local_key, kind, attempts + 1, error, retry_after)
+            return
+
+        self._remove(local_key)
+        message, data = result
+        with self._condition:
+            if message.startswith("Failed"):
+                self.stats['rejected'] += 1
+            else:
+                self.stats['delivered'] += 1
+                self._latencies.append(time.time() - enqueued_at)
+        self.logger.info(f"Outbox delivered {kind} {local_key} after {attempts + 1} attempt(s): {message}")
+        self.delivered.emit(local_key, kind, message, data)
+
+    def _reschedule(self, local_key: str, kind: str, attempts: int, error: str, retry_after: Optional[float]) -> None:
+        delay = retry_delay(attempts, RETRY_BASE_SECONDS, RETRY_MAX_SECONDS, retry_after)
+        with self._condition:
+            self.stats['retries'] += 1
+            try:
+                self._conn.execute(
+                    "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE local_key = ?",
+                    (attempts, time.time() + delay, error, local_key)
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error rescheduling {kind} {local_key}: {e}")
+        self.logger.warning(f"Outbox {kind} {local_key} attempt {attempts} failed ({error}); retrying in {delay:.1f}s")
+
+    def _remove(self, local_key: str) -> None:
+        with self._condition:
+            try:
+                self._conn.execute("DELETE FROM outbox WHERE local_key = ?", (local_key,))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error removing {local_key} from the outbox: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, age of the oldest entry, outcome counters and enqueue-to-ack latency"""
+        with self._condition:
+            depth, oldest = 0, None
+            conn = self._connection()
+            if conn is not None:
+                try:
+                    depth, oldest = conn.execute("SELECT COUNT(*), MIN(enqueued_at) FROM outbox").fetchone()
+                except sqlite3.Error as e:
+                    self.logger.error(f"Error reading kill outbox stats: {e}")
+            latencies = sorted(self._latencies)
+            return dict(
+                self.stats,
+                queue_depth=depth,
+                oldest_age_seconds=round(time.time() - oldest, 1) if oldest else 0.0,
+                latency_p50_ms=round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+                latency_p95_ms=round(latencies[int(len(latencies) * 0.95)] * 1000, 1) if latencies else None
+            )
+
+    def stop(self) -> None:
+        """Stop the worker after its current send; queued entries stay on disk for the next start"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+
+_kill_outbox: Optional[KillOutbox] = None
+
+
+def get_kill_outbox() -> KillOutbox:
+    """Get the global kill outbox, creating it on first use (call from the GUI thread)"""
+    global _kill_outbox
+    if _kill_outbox is None:
+        _kill_outbox = KillOutbox()
+    return _kill_outbox
@@ -0,0 +1,140 @@
+# kill_records.py
+
+import re
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from kill_parser import KILL_LOG_PATTERN
+from Registered_kill import format_registered_kill
+from Death_kill import format_death_kill
+
+RENDERED_CARD_CACHE_SIZE = 200
+CARD_ID_PATTERN = re.compile(r'id="(card-[0-9a-f]+)"')
+
+
+def card_id_of(readout: str) -> Optional[str]:
+    """DOM id a card was given while its profile enrichment was in flight, if any"""
+    match = CARD_ID_PATTERN.search(readout or "")
+    return match.group(1) if match else None
+
+
+def record_event_type(local_key: str, record: Dict[str, Any]) -> str:
+    """'kill' or 'death' (records saved before event_type was stored are told apart by their key)"""
+    return record.get("event_type") or ("death" if local_key.startswith("death_") else "kill")
+
+
+def new_kill_record(event_type: str, payload: dict, timestamp: str, attacker: str, readout: str,
+                    **fields: Any) -> Dict[str, Any]:
+    """
+    Local record for a kill or death: the payload and bookkeeping fields only.
+
+    The rendered card is not kept; it is rebuilt from the payload when needed.
+    A card still waiting for enrichment is referenced by its card_id.
+    """
+    record = {
+        "payload": payload,
+        "timestamp": timestamp,
+        "attacker": attacker,
+        "event_type": event_type,
+        "sent_to_api": False
+    }
+    card_id = card_id_of(readout)
+    if card_id:
+        record["card_id"] = card_id
+    record.update(fields)
+    return record
+
+
+def strip_readout(record: Dict[str, Any]) -> bool:
+    """Drop the rendered readout a legacy record carried, keeping its card_id; True if anything changed"""
+    readout = record.pop("readout", None)
+    if readout is None:
+        return False
+    card_id = card_id_of(readout)
+    if card_id and "card_id" not in record:
+        record["card_id"] = card_id
+    return True
+
+
+def add_clip_link(readout: str, clip_url: str) -> str:
+    """Append a 'Watch Kill Clip' button to a rendered card"""
+    return readout.replace("</body>",
+        f'<div style="margin-top: 10px; text-align: center;">'
+        f'<a href="{clip_url}" style="color:#6441A4; text-decoration:none; font-weight:bold; '
+        f'padding:8px 16px; background-color:rgba(100, 65, 164, 0.2); border-radius:4px; '
+        f'border:1px solid #6441A4;" target="_blank">'
+        f'Watch Kill Clip</a></div></body>')
+
+
+def render_readout(local_key: str, record: Dict[str, Any], registered_user: str) -> str:
+    """
+    Rebuild the card for a stored record from its payload.
+
+    Profile data comes from the player cache only (placeholders otherwise), so
+    this never waits on the network; the card keeps the record's card_id so a
+    late enrichment can still patch it. Returns "" if the log line is unusable.
+    """
+    payload = record.get("payload", {})
+    log_line = payload.get("log_line", "")
+    match = KILL_LOG_PATTERN.search(log_line)
+    if not match:
+        return ""
+
+    data = match.groupdict()
+    parts = local_key.split("::")
+    game_mode = payload.get("game_mode") or (parts[2] if len(parts) >= 3 else "Unknown")
+    timestamp = record.get("timestamp", "")
+    card_id = record.get("card_id")
+
+    if record_event_type(local_key, record) == "death":
+        readout = format_death_kill(
+            log_line, data, registered_user, timestamp, game_mode, cached_only=True, card_id=card_id
+        )
+    else:
+        data["killer_ship"] = payload.get("killer_ship") or "No Ship"
+        readout, _ = format_registered_kill(
+            log_line, data, registered_user, timestamp, game_mode, success=True,
+            is_in_ship=record.get("is_in_ship", False), cached_only=True, card_id=card_id
+        )
+
+    if record.get("clip_url"):
+        readout = add_clip_link(readout, record["clip_url"])
+    return readout
+
+
+class RenderedCardCache:
+    """
+    Rendered cards keyed by local_key, bounded by count.
+
+    Holds the exact HTML that was shown for recent events so the display can
+    be patched (clip links, NPC removal) and repeated exports skip rendering;
+    the least recently used card is dropped first. Use from the GUI thread.
+    """
+
+    def __init__(self, max_cards: int = RENDERED_CARD_CACHE_SIZE):
+        self.max_cards = max_cards
+        self._cards: "OrderedDict[str, str]" = OrderedDict()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, local_key: str) -> Optional[str]:
+        readout = self._cards.get(local_key)
+        if readout is not None:
+            self._cards.move_to_end(local_key)
+        return readout
+
+    def put(self, local_key: str, readout: str) -> None:
+        self._cards[local_key] = readout
+        self._cards.move_to_end(local_key)
+        while len(self._cards) > self.max_cards:
+            evicted, _ = self._cards.popitem(last=False)
+            self.logger.debug(f"Evicted rendered card {evicted}")
+
+    def discard(self, local_key: str) -> None:
+        self._cards.pop(local_key, None)
+
+    def clear(self) -> None:
+        self._cards.clear()
+
+    def __len__(self) -> int:
+        return len(self._cards)
@@ -0,0 +1,177 @@
+# kill_store.py
+
+import os
+import json
+import sqlite3
+import logging
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+KILL_STORE_DB_FILE = os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "SCTool_Tracker", "logged_kills.db")
+
+
+class KillStore:
+    """
+    SQLite (WAL) store for the session's local kill and death records.
+
+    Each record is one row keyed by local_key, so saving a change writes only
+    that record instead of rewriting the whole session; every write is its
+    own transaction, so a crash never leaves a half-written file. Rows keep
+    their insertion order through an indexed sequence number. A legacy
+    logged_kills.json is imported on first open and renamed to *.migrated.
+    """
+
+    def __init__(self, db_file: str = KILL_STORE_DB_FILE, legacy_json_file: Optional[str] = None):
+        self.db_file = db_file
+        self.legacy_json_file = legacy_json_file
+        self._conn: Optional[sqlite3.Connection] = None
+        self._next_seq = 0
+        self._lock = Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS kills (
+                    local_key TEXT PRIMARY KEY,
+                    seq INTEGER NOT NULL,
+                    record TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS kills_seq ON kills (seq)")
+            conn.commit()
+            self._next_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM kills").fetchone()[0]
+            self._conn = conn
+            self.logger.info(f"Opened kill store at {self.db_file}")
+            self._migrate_legacy_json()
+        except sqlite3.Error as e:
+            self.logger.error(f"Could not open kill store {self.db_file}: {e}")
+        return self._conn
+
+    def _migrate_legacy_json(self) -> None:
+        """Import the old whole-file JSON store once, then move it out of the way"""
+        path = self.legacy_json_file
+        if not path or not os.path.isfile(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            if not isinstance(legacy, dict):
+                raise ValueError("expected an object of kills keyed by local_key")
+            if self._conn.execute("SELECT COUNT(*) FROM kills").fetchone()[0] == 0:
+                self._write_many(legacy.items())
+                self.logger.info(f"Migrated {len(legacy)} kills from {path}")
+            else:
+                self.logger.info(f"Kill store already has records; not importing {path}")
+            os.replace(path, path + ".migrated")
+        except (OSError, ValueError, sqlite3.Error) as e:
+            self.logger.error(f"Failed to migrate local kills from {path}: {e}")
+
+    def _write_many(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        rows = []
+        for local_key, record in records:
+            rows.append((local_key, self._next_seq, json.dumps(record)))
+            self._next_seq += 1
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO kills (local_key, seq, record) VALUES (?, ?, ?) "
+                "ON CONFLICT(local_key) DO UPDATE SET record = excluded.record",
+                rows
+            )
+        return len(rows)
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """All records keyed by local_key, in the order they were first saved"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return {}
+            kills: Dict[str, Dict[str, Any]] = {}
+            try:
+                for local_key, record in conn.execute("SELECT local_key, record FROM kills ORDER BY seq"):
+                    try:
+                        kills[local_key] = json.loads(record)
+                    except ValueError as e:
+                        self.logger.warning(f"Skipping unreadable stored kill {local_key}: {e}")
+            except sqlite3.Error as e:
+                self.logger.error(f"Error loading local kills: {e}")
+            return kills
+
+    def get(self, local_key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT record FROM kills WHERE local_key = ?", (local_key,)).fetchone()
+                return json.loads(row[0]) if row else None
+            except (sqlite3.Error, ValueError) as e:
+                self.logger.error(f"Error reading stored kill {local_key}: {e}")
+                return None
+
+    def put(self, local_key: str, record: Dict[str, Any]) -> bool:
+        """Insert or replace one record (a new record goes to the end of the order)"""
+        return self.put_many({local_key: record})
+
+    def put_many(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        """Insert or replace several records in one transaction"""
+        if not records:
+            return True
+        with self._lock:
+            if self._connection() is None:
+                return False
+            try:
+                self._write_many(records.items())
+                return True
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                self.logger.error(f"Failed to save {len(records)} local kills: {e}")
+                return False
+
+    def remove(self, local_key: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute("DELETE FROM kills WHERE local_key = ?", (local_key,))
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to remove local kill {local_key}: {e}")
+
+    def replace_all(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        """Make the store hold exactly records, in their order"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return False
+            try:
+                with conn:
+                    conn.execute("DELETE FROM kills")
+                    rows = [(key, seq, json.dumps(record)) for seq, (key, record) in enumerate(records.items(), 1)]
+                    conn.executemany("INSERT INTO kills (local_key, seq, record) VALUES (?, ?, ?)", rows)
+                self._next_seq = len(records) + 1
+                return True
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                self.logger.error(f"Failed to save local kills: {e}")
+                return False
+
+    def clear(self) -> None:
+        """Remove every record"""
+        self.replace_all({})
+
+    def count(self) -> int:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return 0
+            try:
+                return conn.execute("SELECT COUNT(*) FROM kills").fetchone()[0]
+            except sqlite3.Error as e:
+                self.logger.error(f"Error counting local kills: {e}")
+                return 0
@@ -5,6 +5,8 @@ import os
 from typing import Dict, Any, Optional
 import logging
 
+from config_service import get_config_store
+
 _language_manager = None
 
 def get_language_manager():
@@ -125,27 +127,16 @@ class LanguageManager:
     def save_current_language_preference(self, config_file: str):
         """Save the current language preference to config file"""
         try:
-            config = {}
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            
-            config['language'] = self.current_language
-            
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-                
+            get_config_store(config_file).set('language', self.current_language)
         except Exception as e:
             print(f"Error saving language preference: {e}")
             
     def load_language_preference(self, config_file: str):
         """Load language preference from config file"""
         try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    if 'language' in config:
-                        self.set_language(config['language'])
+            language = get_config_store(config_file).get('language')
+            if language:
+                self.set_language(language)
         except Exception as e:
             print(f"Error loading language preference: {e}")
             
@@ -643,6 +643,7 @@ class OverlayControlPanel(QFrame):
         
         self.overlay.display_mode = mode
         self.overlay.config['display_mode'] = mode
+        self.overlay.mark_config_dirty()
         self.overlay.create_ui()
         self.overlay.update_display()
         
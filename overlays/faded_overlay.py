@@ -48,11 +48,9 @@ def show_death_notification(self, attacker: str, weapon: str, zone: str, game_mo
     self.clear_faded_container()
     
     try:
-        from fetch import fetch_player_details, fetch_victim_image_base64
         from kill_parser import KillParser
         
-        details = fetch_player_details(attacker)
-        attacker_image_data_uri = fetch_victim_image_base64(attacker)
+        details, attacker_image_url = request_faded_profile(self, attacker)
         formatted_zone = KillParser.format_zone(zone)
         formatted_weapon = KillParser.format_weapon(weapon)
         
@@ -63,7 +61,7 @@ def show_death_notification(self, attacker: str, weapon: str, zone: str, game_mo
             
     except ImportError:
         details = {'org_name': 'Unknown', 'org_tag': 'Unknown'}
-        attacker_image_data_uri = ""
+        attacker_image_url = ""
         formatted_zone = zone.replace('_', ' ').title()
         weapon_clean = clean_weapon_name(weapon)
 
@@ -131,49 +129,11 @@ def show_death_notification(self, attacker: str, weapon: str, zone: str, game_mo
     
     notification_layout.addLayout(attacker_row)
 
-    org_name = details.get('org_name', 'None')
-    org_tag = details.get('org_tag', 'None')
-    
     org_widget = QWidget()
     org_layout = QVBoxLayout(org_widget)
     org_layout.setContentsMargins(0, 0, 0, 0)
     org_layout.setSpacing(4)
-    
-    if org_name != 'None' and org_name != 'Unknown':
-        org_label = QLabel(f"{t('Organization')}: {org_name}")
-        org_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_secondary'].name()};
-                font-size: 16px;
-                font-family: 'Consolas', monospace;
-                background: transparent;
-            }}
-        """)
-        org_layout.addWidget(org_label)
-        
-        if org_tag != 'None' and org_tag != 'Unknown':
-            tag_label = QLabel(f"{t('Tag')}: [{org_tag}]")
-            tag_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {self.colors['accent'].name()};
-                    font-size: 14px;
-                    font-family: 'Consolas', monospace;
-                    background: transparent;
-                }}
-            """)
-            org_layout.addWidget(tag_label)
-    else:
-        org_label = QLabel(f"{t('Organization')}: {t('Independent')}")
-        org_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_secondary'].name()};
-                font-size: 16px;
-                font-family: 'Consolas', monospace;
-                background: transparent;
-            }}
-        """)
-        org_layout.addWidget(org_label)
-    
+    populate_faded_org(self, org_layout, details)
     notification_layout.addWidget(org_widget)
 
     details_widget = QWidget()
@@ -216,50 +176,7 @@ def show_death_notification(self, attacker: str, weapon: str, zone: str, game_mo
     details_layout.addWidget(mode_label)
     notification_layout.addWidget(details_widget)
 
-    # Now populate the image if available
-    if attacker_image_data_uri:
-        try:
-            if attacker_image_data_uri.startswith('data:image'):
-                
-                header, data = attacker_image_data_uri.split(',', 1)
-                image_data = base64.b64decode(data)
-                
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data)
-
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(80, 80, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-
-                    circular_pixmap = QPixmap(80, 80)
-                    circular_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(circular_pixmap)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    painter.setBrush(QBrush(scaled_pixmap))
-                    painter.setPen(Qt.NoPen)
-                    painter.drawEllipse(0, 0, 80, 80)
-
-                    painter.setPen(QPen(QColor(self.colors['death_color']), 3))
-                    painter.setBrush(Qt.NoBrush)
-                    painter.drawEllipse(1, 1, 78, 78)
-                    painter.end()
-                    
-                    image_label.setPixmap(circular_pixmap)
-                    image_container.setVisible(True)
-                    
-        except Exception as e:
-            image_label.setText("No Image")
-            image_label.setAlignment(Qt.AlignCenter)
-            image_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {self.colors['text_secondary'].name()};
-                    font-size: 10px;
-                    background-color: {self.colors['background'].name()};
-                    border: 2px solid {self.colors['death_color'].name()};
-                    border-radius: 40px;
-                }}
-            """)
-            image_container.setVisible(True)
+    set_faded_image(self, image_label, image_container, attacker_image_url, self.colors['death_color'])
 
     try:
         if self.faded_container and self.faded_container.layout():
@@ -276,6 +193,10 @@ def show_death_notification(self, attacker: str, weapon: str, zone: str, game_mo
     new_layout.setContentsMargins(0, 0, 0, 0)
     new_layout.addWidget(notification_widget)
 
+    self._faded_target = {
+        'player': attacker, 'org_layout': org_layout, 'image_label': image_label,
+        'image_container': image_container, 'ring_color': self.colors['death_color']
+    }
     self.show_faded_notification()
 
 def show_kill_notification(self, victim: str, weapon: str, zone: str, game_mode: str = "Unknown"):
@@ -287,12 +208,9 @@ def show_kill_notification(self, victim: str, weapon: str, zone: str, game_mode:
     self.clear_faded_container()
 
     try:
-        from fetch import fetch_player_details, fetch_victim_image_base64
         from kill_parser import KillParser
-        import re
         
-        details = fetch_player_details(victim)
-        victim_image_data_uri = fetch_victim_image_base64(victim)
+        details, victim_image_url = request_faded_profile(self, victim)
         formatted_zone = KillParser.format_zone(zone)
         formatted_weapon = KillParser.format_weapon(weapon)
         
@@ -304,7 +222,7 @@ def show_kill_notification(self, victim: str, weapon: str, zone: str, game_mode:
             
     except ImportError:
         details = {'org_name': 'Unknown', 'org_tag': 'Unknown'}
-        victim_image_data_uri = ""
+        victim_image_url = ""
         formatted_zone = zone.replace('_', ' ').title()
         weapon_clean = clean_weapon_name(weapon)
     
@@ -372,49 +290,11 @@ def show_kill_notification(self, victim: str, weapon: str, zone: str, game_mode:
     
     notification_layout.addLayout(victim_row)
     
-    org_name = details.get('org_name', 'None')
-    org_tag = details.get('org_tag', 'None')
-    
     org_widget = QWidget()
     org_layout = QVBoxLayout(org_widget)
     org_layout.setContentsMargins(0, 0, 0, 0)
     org_layout.setSpacing(4)
-    
-    if org_name != 'None' and org_name != 'Unknown':
-        org_label = QLabel(f"{t('Organization')}: {org_name}")
-        org_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_secondary'].name()};
-                font-size: 16px;
-                font-family: 'Consolas', monospace;
-                background: transparent;
-            }}
-        """)
-        org_layout.addWidget(org_label)
-        
-        if org_tag != 'None' and org_tag != 'Unknown':
-            tag_label = QLabel(f"{t('Tag')}: [{org_tag}]")
-            tag_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {self.colors['accent'].name()};
-                    font-size: 14px;
-                    font-family: 'Consolas', monospace;
-                    background: transparent;
-                }}
-            """)
-            org_layout.addWidget(tag_label)
-    else:
-        org_label = QLabel(f"{t('Organization')}: {t('Independent')}")
-        org_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_secondary'].name()};
-                font-size: 16px;
-                font-family: 'Consolas', monospace;
-                background: transparent;
-            }}
-        """)
-        org_layout.addWidget(org_label)
-    
+    populate_faded_org(self, org_layout, details)
     notification_layout.addWidget(org_widget)
     
     details_widget = QWidget()
@@ -457,49 +337,7 @@ def show_kill_notification(self, victim: str, weapon: str, zone: str, game_mode:
     details_layout.addWidget(mode_label)
     notification_layout.addWidget(details_widget)
 
-    if victim_image_data_uri:
-        try:
-            if victim_image_data_uri.startswith('data:image'):
-                
-                header, data = victim_image_data_uri.split(',', 1)
-                image_data = base64.b64decode(data)
-                
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data)
-
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(80, 80, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                    
-                    circular_pixmap = QPixmap(80, 80)
-                    circular_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(circular_pixmap)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    painter.setBrush(QBrush(scaled_pixmap))
-                    painter.setPen(Qt.NoPen)
-                    painter.drawEllipse(0, 0, 80, 80)
-                    
-                    painter.setPen(QPen(QColor(self.colors['kill_color']), 3))
-                    painter.setBrush(Qt.NoBrush)
-                    painter.drawEllipse(1, 1, 78, 78)
-                    painter.end()
-                    
-                    image_label.setPixmap(circular_pixmap)
-                    image_container.setVisible(True)
-                    
-        except Exception as e:
-            image_label.setText("No Image")
-            image_label.setAlignment(Qt.AlignCenter)
-            image_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {self.colors['text_secondary'].name()};
-                    font-size: 10px;
-                    background-color: {self.colors['background'].name()};
-                    border: 2px solid {self.colors['kill_color'].name()};
-                    border-radius: 40px;
-                }}
-            """)
-            image_container.setVisible(True)
+    set_faded_image(self, image_label, image_container, victim_image_url, self.colors['kill_color'])
 
     try:
         self.faded_container.setLayout(QVBoxLayout())
@@ -508,8 +346,143 @@ def show_kill_notification(self, victim: str, weapon: str, zone: str, game_mode:
     except (RuntimeError, AttributeError):
         return
     
+    self._faded_target = {
+        'player': victim, 'org_layout': org_layout, 'image_label': image_label,
+        'image_container': image_container, 'ring_color': self.colors['kill_color']
+    }
     self.show_faded_notification()
 
+def request_faded_profile(self, player_name: str):
+    """
+    Return (details, image URL) for player_name from the enrichment cache without waiting.
+
+    Whatever is missing is looked up on the kill feed's enrichment pool (sharing an
+    in-flight lookup for the same player) and delivered through faded_profile_ready.
+    """
+    from player_cache import get_player_cache
+    from profile_enricher import get_profile_enricher
+    from kill_event_formatter import KillEventFormatter
+    from rsi_scheduler import PRIORITY_OVERLAY
+
+    cache = get_player_cache()
+    details = cache.get_player_details(player_name)
+    image_url = cache.get_player_image(player_name)
+    if details is None or image_url is None:
+        get_profile_enricher().submit(
+            player_name,
+            lambda: KillEventFormatter.safe_get_player_profile(player_name, PRIORITY_OVERLAY),
+            lambda profile: self.faded_profile_ready.emit(player_name, profile[0], profile[1])
+        )
+    if details is None:
+        details = KillEventFormatter.placeholder_details()
+    return details, image_url or ""
+
+def apply_faded_profile(self, player_name: str, details: dict, image_url: str):
+    """Fill in the org and image of the notification on screen once its player's profile arrives"""
+    target = getattr(self, '_faded_target', None)
+    if not target or target['player'] != player_name:
+        return
+    try:
+        org_layout = target['org_layout']
+        while org_layout.count():
+            child = org_layout.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+        populate_faded_org(self, org_layout, details)
+        set_faded_image(self, target['image_label'], target['image_container'], image_url, target['ring_color'])
+        self.faded_container.adjustSize()
+    except (RuntimeError, AttributeError):
+        self._faded_target = None
+
+def populate_faded_org(self, org_layout, details: dict):
+    """Add the organization name and tag labels for details to org_layout"""
+    org_name = details.get('org_name', 'None')
+    org_tag = details.get('org_tag', 'None')
+
+    if org_name != 'None' and org_name != 'Unknown':
+        org_label = QLabel(f"{t('Organization')}: {org_name}")
+        org_label.setStyleSheet(f"""
+            QLabel {{
+                color: {self.colors['text_secondary'].name()};
+                font-size: 16px;
+                font-family: 'Consolas', monospace;
+                background: transparent;
+            }}
+        """)
+        org_layout.addWidget(org_label)
+
+        if org_tag != 'None' and org_tag != 'Unknown':
+            tag_label = QLabel(f"{t('Tag')}: [{org_tag}]")
+            tag_label.setStyleSheet(f"""
+                QLabel {{
+                    color: {self.colors['accent'].name()};
+                    font-size: 14px;
+                    font-family: 'Consolas', monospace;
+                    background: transparent;
+                }}
+            """)
+            org_layout.addWidget(tag_label)
+    else:
+        org_label = QLabel(f"{t('Organization')}: {t('Independent')}")
+        org_label.setStyleSheet(f"""
+            QLabel {{
+                color: {self.colors['text_secondary'].name()};
+                font-size: 16px;
+                font-family: 'Consolas', monospace;
+                background: transparent;
+            }}
+        """)
+        org_layout.addWidget(org_label)
+
+def set_faded_image(self, image_label, image_container, image_url: str, ring_color):
+    """Show a circular avatar from a stored avatar file URL or data URI; remote URLs are skipped"""
+    if not image_url:
+        return
+    try:
+        pixmap = QPixmap()
+        if image_url.startswith('data:image'):
+            header, data = image_url.split(',', 1)
+            pixmap.loadFromData(base64.b64decode(data))
+        else:
+            from avatar_store import AvatarStore
+            image_path = AvatarStore.path_for_url(image_url)
+            if image_path:
+                pixmap.load(image_path)
+
+        if not pixmap.isNull():
+            scaled_pixmap = pixmap.scaled(80, 80, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+            circular_pixmap = QPixmap(80, 80)
+            circular_pixmap.fill(Qt.transparent)
+
+            painter = QPainter(circular_pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(QBrush(scaled_pixmap))
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(0, 0, 80, 80)
+
+            painter.setPen(QPen(QColor(ring_color), 3))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawEllipse(1, 1, 78, 78)
+            painter.end()
+
+            image_label.setPixmap(circular_pixmap)
+            image_container.setVisible(True)
+
+    except Exception as e:
+        image_label.setText("No Image")
+        image_label.setAlignment(Qt.AlignCenter)
+        image_label.setStyleSheet(f"""
+            QLabel {{
+                color: {self.colors['text_secondary'].name()};
+                font-size: 10px;
+                background-color: {self.colors['background'].name()};
+                border: 2px solid {QColor(ring_color).name()};
+                border-radius: 40px;
+            }}
+        """)
+        image_container.setVisible(True)
+
 def show_faded_notification(self):
     """Show the faded notification and start timers"""
     if not hasattr(self, 'faded_container'):
@@ -844,6 +817,7 @@ def update_countdown(self):
 
 def clear_faded_container(self):
     """Clear the faded container content safely"""
+    self._faded_target = None
 
     if hasattr(self, 'countdown_timer') and self.countdown_timer and self.countdown_timer.isActive():
         self.countdown_timer.stop()
@@ -2,7 +2,6 @@
 
 import os
 import sys
-import json
 import re
 import traceback
 from datetime import datetime
@@ -15,13 +14,14 @@ if parent_dir not in sys.path:
 from kill_parser import KillParser
 from language_manager import t
 from color_manager import color_manager
+from config_service import get_config_store
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
     QScrollArea, QApplication
 )
 from PyQt5.QtCore import (
-    Qt, QTimer, QPoint, pyqtSlot
+    Qt, QTimer, QPoint, pyqtSlot, pyqtSignal
 )
 from PyQt5.QtGui import (
     QPainter, QColor, QBrush, QPen, QLinearGradient, 
@@ -42,12 +42,18 @@ from .faded_overlay import (
     create_faded_ui, show_death_notification, show_kill_notification,
     show_faded_notification, show_faded_positioning_helper,
     stop_all_faded_animations, fade_notification, hide_faded_notification,
-    hide_positioning_helper, update_countdown, clear_faded_container
+    hide_positioning_helper, update_countdown, clear_faded_container, apply_faded_profile
 )
 
+# Settings are saved once they have stopped changing for this long (e.g. after a drag)
+CONFIG_QUIET_PERIOD_MS = 2000
+
 class GameOverlay(QWidget):
     """Overlay for Star Citizen"""
     
+    # (player name, details, image URL) from the enrichment pool for the faded notification
+    faded_profile_ready = pyqtSignal(str, dict, str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_tracker = parent
@@ -55,7 +61,13 @@ class GameOverlay(QWidget):
         self.drag_position = QPoint()
         self.resize_mode = False
         self.config_file = os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "SCTool_Tracker", "overlay_config.json")
+        self.config_store = get_config_store(self.config_file, indent=2)
         self.config = self.load_config()
+        self.config_dirty = False
+        self.config_save_stats = {'changes': 0, 'writes': 0, 'writes_avoided': 0}
+        self.config_save_timer = QTimer()
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.timeout.connect(self.save_config)
         
         self.create_faded_ui = lambda: create_faded_ui(self)
         self.show_death_notification = lambda attacker, weapon, zone, game_mode="Unknown": show_death_notification(self, attacker, weapon, zone, game_mode)
@@ -68,6 +80,7 @@ class GameOverlay(QWidget):
         self.hide_positioning_helper = lambda: hide_positioning_helper(self)
         self.update_countdown = lambda: update_countdown(self)
         self.clear_faded_container = lambda: clear_faded_container(self)
+        self.faded_profile_ready.connect(lambda player_name, details, image_url: apply_faded_profile(self, player_name, details, image_url))
 
         self.create_minimal_ui = lambda: create_minimal_ui(self)
         self.create_compact_ui = lambda: create_compact_ui(self)
@@ -123,10 +136,6 @@ class GameOverlay(QWidget):
         self.load_position()
         
         self.set_locked(self.is_locked)
-
-        self.save_timer = QTimer()
-        self.save_timer.timeout.connect(self.save_config)
-        self.save_timer.start(5000)
         
         if self.is_enabled:
             self.show_overlay()
@@ -249,12 +258,14 @@ class GameOverlay(QWidget):
         """Set new hotkey combination"""
         self.hotkey_combination = combination
         self.config['hotkey_combination'] = combination
+        self.mark_config_dirty()
         self.setup_global_hotkey()
     
     def set_hotkey_enabled(self, enabled: bool):
         """Enable/disable global hotkey"""
         self.hotkey_enabled = enabled
         self.config['hotkey_enabled'] = enabled
+        self.mark_config_dirty()
         
         if enabled:
             self.setup_global_hotkey()
@@ -265,12 +276,9 @@ class GameOverlay(QWidget):
 
     def load_config(self) -> Dict[str, Any]:
         """Load overlay configuration from file"""
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"Error loading overlay config: {e}")
+        config = self.config_store.snapshot()
+        if config:
+            return config
         return {
             'position': {'x': 50, 'y': 50},
             'size': {'width': 300, 'height': 200},
@@ -288,8 +296,28 @@ class GameOverlay(QWidget):
             'hotkey_combination': 'ctrl+`'
         }
     
+    def mark_config_dirty(self):
+        """Note a settings change; the config is saved once changes stop for CONFIG_QUIET_PERIOD_MS"""
+        self.config_save_stats['changes'] += 1
+        if self.config_dirty:
+            self.config_save_stats['writes_avoided'] += 1
+        self.config_dirty = True
+        self.config_save_timer.start(CONFIG_QUIET_PERIOD_MS)
+    
+    def flush_config(self):
+        """Save pending settings changes now (called on shutdown)"""
+        if self.config_dirty:
+            self.save_config()
+        self.config_store.flush()
+    
+    def get_config_save_stats(self) -> Dict[str, int]:
+        """Settings changes seen, config writes made and writes avoided by waiting for changes"""
+        return dict(self.config_save_stats)
+    
     def save_config(self):
-        """Save overlay configuration to file"""
+        """Save overlay configuration to file if any setting changed"""
+        self.config_save_timer.stop()
+        self.config_dirty = False
         try:
             self.config['position'] = {'x': self.x(), 'y': self.y()}
             self.config['size'] = {'width': self.width(), 'height': self.height()}
@@ -302,10 +330,10 @@ class GameOverlay(QWidget):
             self.config['hotkey_enabled'] = self.hotkey_enabled
             self.config['hotkey_combination'] = self.hotkey_combination
 
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if self.config_store.update(self.config):
+                self.config_save_stats['writes'] += 1
+            else:
+                self.config_save_stats['writes_avoided'] += 1
         except Exception as e:
             print(f"Error saving overlay config: {e}")
     
@@ -550,6 +578,7 @@ class GameOverlay(QWidget):
         next_index = (current_index + 1) % len(modes)
         self.display_mode = modes[next_index]
         self.config['display_mode'] = self.display_mode
+        self.mark_config_dirty()
         self.create_ui()
         self.update_display()
         self.adjust_size_to_content()
@@ -586,6 +615,18 @@ class GameOverlay(QWidget):
         self.is_dragging = False
         event.accept()
     
+    def moveEvent(self, event):
+        """Save the new position once the overlay stops moving"""
+        super().moveEvent(event)
+        if self.config.get('position') != {'x': self.x(), 'y': self.y()}:
+            self.mark_config_dirty()
+    
+    def resizeEvent(self, event):
+        """Save the new size once the overlay stops resizing"""
+        super().resizeEvent(event)
+        if self.config.get('size') != {'width': self.width(), 'height': self.height()}:
+            self.mark_config_dirty()
+    
     def wheelEvent(self, event):
         """Handle mouse wheel for opacity adjustment"""
         if event.modifiers() & Qt.ControlModifier:
@@ -598,6 +639,7 @@ class GameOverlay(QWidget):
         """Set overlay opacity"""
         self.opacity_level = opacity
         self.config['opacity'] = opacity
+        self.mark_config_dirty()
         self.setWindowOpacity(opacity)
         self.update()
     
@@ -605,6 +647,7 @@ class GameOverlay(QWidget):
         """Toggle animations with immediate visual feedback"""
         self.show_animations = enabled
         self.config['animations'] = enabled
+        self.mark_config_dirty()
         
         if enabled:
             if not hasattr(self, 'kill_glow_alpha'):
@@ -629,6 +672,7 @@ class GameOverlay(QWidget):
         """Set overlay lock state"""
         self.is_locked = locked
         self.config['locked'] = locked
+        self.mark_config_dirty()
         
         if locked:
             self.setWindowFlags(
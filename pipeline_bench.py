@@ -0,0 +1,246 @@
+# pipeline_bench.py
+
+"""
+End-to-end latency benchmark for the headless kill pipeline against the local stand-in server.
+
+Starts standin_server.StandInServer, points the RSI and API URLs at it, then
+replays a recorded or synthetic Game.log through TailThread.process_line (no
+window, no tailing thread) and submits each kill through the kill outbox.
+Reports p50/p95/p99 for:
+    line_to_first_card  - log line read until the kill card is emitted
+    line_to_final_card  - until the enriched card replaced it (or the first card, if it was served from cache)
+    kill_to_api_ack     - log line read until the API acknowledged the submission
+
+Profile and avatar stores and the outbox go to a temporary directory, so by default every run
+starts cold. --stored seeds the profile store with every opponent first: 'fresh' entries are
+served without a request, 'stale' ones are revalidated against the stand-in's ETag (a 304).
+
+Usage:
+    python pipeline_bench.py --synthetic 200 --players 40 --rate 20 --latency-ms 120 --jitter-ms 40
+    python pipeline_bench.py --log Game.log --user MyHandle --throttle-rate 0.02
+    python pipeline_bench.py --synthetic 200 --players 40 --stored stale
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import logging
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from standin_server import AVATAR_FILE, add_server_arguments, citizen_etag, server_from_args
+
+CARD_ID_PATTERN = r'id="(card-[0-9a-f]+)"'
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile in milliseconds, rounded for display"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return round(ordered[index] * 1000, 1)
+
+
+def summarize(values: List[float]) -> Dict[str, Optional[float]]:
+    return {'count': len(values), 'p50_ms': percentile(values, 50), 'p95_ms': percentile(values, 95), 'p99_ms': percentile(values, 99)}
+
+
+def synthetic_log(user: str, count: int, players: int, death_every: int = 5) -> List[str]:
+    """Kills by user against a rotating set of players, with every death_every-th line a death"""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    lines = []
+    for index in range(count):
+        moment = start + timedelta(seconds=index)
+        timestamp = moment.strftime('%Y-%m-%dT%H:%M:%S.') + f"{moment.microsecond // 1000:03d}Z"
+        rival = f"Rival{index % players}"
+        victim, attacker = (user, rival) if death_every and index % death_every == death_every - 1 else (rival, user)
+        lines.append(
+            f"<{timestamp}> [Notice] <Actor Death> CActor::Kill: '{victim}' [{1000 + index}] in zone 'OOC_Stanton_2b_Daymar' "
+            f"killed by '{attacker}' [{900}] using 'KLWE_LaserRepeater_S3_{index}' [Class unknown] "
+            f"with damage type 'Bullet' from direction x: 0.0, y: 0.0, z: 0.0 [Team_ActorTech][Actor]"
+        )
+    return lines
+
+
+def seed_profile_store(lines: List[str], user: str, fresh: bool) -> int:
+    """Store a profile for every opponent in lines, as an earlier run would have; returns how many"""
+    from kill_parser import KILL_LOG_PATTERN
+    from avatar_store import get_avatar_store
+    from profile_store import get_profile_store
+
+    with open(AVATAR_FILE, 'rb') as f:
+        image_url = get_avatar_store().store(f.read())
+    handles = set()
+    for line in lines:
+        match = KILL_LOG_PATTERN.search(line)
+        if match:
+            handles.update(name for name in (match.group('victim'), match.group('attacker')) if name != user)
+    details = {"enlistment_date": "Jan 1, 2015", "occupation": "Bounty Hunter", "org_name": "Standin Org", "org_tag": "STANDIN"}
+    for handle in handles:
+        get_profile_store().put(handle, details, f"{os.environ['SCTOOL_RSI_BASE_URL']}/media/avatars/{handle}.jpg",
+                                image_url, citizen_etag(handle), ttl_seconds=None if fresh else 0)
+    return len(handles)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Line-to-card and kill-to-ack latency against the stand-in server")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--log', help="Recorded Game.log to replay")
+    source.add_argument('--synthetic', type=int, metavar='N', help="Generate N kill/death lines")
+    parser.add_argument('--user', default="BenchPilot", help="Registered handle the kills are attributed to")
+    parser.add_argument('--players', type=int, default=40, help="Distinct opponents in synthetic logs")
+    parser.add_argument('--rate', type=float, default=10.0, help="Log lines replayed per second")
+    parser.add_argument('--rsi-rate', type=float, help="Override the RSI scheduler token rate (requests/second)")
+    parser.add_argument('--rsi-burst', type=int, help="Override the RSI scheduler burst size")
+    parser.add_argument('--stored', choices=('none', 'fresh', 'stale'), default='none',
+                        help="Seed the profile store with every opponent before replaying")
+    parser.add_argument('--drain-timeout', type=float, default=60.0, help="Seconds to wait for outstanding cards and acks")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    server = server_from_args(args).start()
+    os.environ["SCTOOL_RSI_BASE_URL"] = server.base_url
+    os.environ["SCTOOL_API_ENDPOINT"] = f"{server.base_url}/api/v1/kills"
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    # Imported after the environment points at the stand-in server
+    from PyQt5.QtCore import QCoreApplication, Qt
+    from Kill_thread import TailThread
+    from kill_outbox import KillOutbox
+    from api_throttle import get_api_throttle
+    from avatar_store import get_avatar_store
+    from profile_store import get_profile_store
+    from rsi_scheduler import get_rsi_scheduler
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    scratch = tempfile.mkdtemp(prefix="sctool_bench_")
+    get_profile_store().db_file = os.path.join(scratch, "player_profiles.db")
+    get_avatar_store().avatar_dir = os.path.join(scratch, "avatars")
+    if args.rsi_rate:
+        get_rsi_scheduler().rate = args.rsi_rate
+    if args.rsi_burst:
+        get_rsi_scheduler().burst = args.rsi_burst
+
+    if args.log:
+        with open(args.log, 'r', encoding='utf-8', errors='replace') as f:
+            lines = [line.strip() for line in f if "<Actor Death>" in line]
+    else:
+        lines = synthetic_log(args.user, args.synthetic, args.players)
+    stored_profiles = seed_profile_store(lines, args.user, args.stored == 'fresh') if args.stored != 'none' else 0
+
+    lock = threading.Lock()
+    line_started: Dict[int, float] = {}
+    first_card: List[float] = []
+    final_card: List[float] = []
+    api_ack: List[float] = []
+    api_failures = [0]
+    pending_cards: Dict[str, int] = {}
+    early_enriched: Dict[str, float] = {}
+    outstanding = {'cards': 0, 'acks': 0}
+    current = {'index': -1}
+    headers = {'Content-Type': 'application/json', 'Accept': 'application/json', 'X-API-Key': 'bench'}
+    outbox = KillOutbox(os.path.join(scratch, "kill_outbox.db"))
+
+    def on_card(readout: str, _name: str) -> None:
+        index = current['index']
+        now = time.perf_counter()
+        elapsed = now - line_started[index]
+        card_id = re.search(CARD_ID_PATTERN, readout)
+        with lock:
+            first_card.append(elapsed)
+            if card_id and card_id.group(1) in early_enriched:
+                # Enrichment finished before the first card signal was handled
+                final_card.append(early_enriched.pop(card_id.group(1)) - line_started[index])
+            elif card_id:
+                pending_cards[card_id.group(1)] = index
+                outstanding['cards'] += 1
+            else:
+                final_card.append(elapsed)
+
+    def on_enriched(card_id: str, _readout: str) -> None:
+        now = time.perf_counter()
+        with lock:
+            index = pending_cards.pop(card_id, None)
+            if index is None:
+                early_enriched[card_id] = now
+                return
+            final_card.append(now - line_started[index])
+            outstanding['cards'] -= 1
+
+    def on_delivered(local_key: str, _kind: str, message: str, _data) -> None:
+        index = int(local_key.split("-", 1)[1])
+        with lock:
+            outstanding['acks'] -= 1
+            if message.startswith("Failed"):
+                api_failures[0] += 1
+            else:
+                api_ack.append(time.perf_counter() - line_started[index])
+
+    def submit(payload: dict, endpoint: str, kind: str) -> None:
+        with lock:
+            outstanding['acks'] += 1
+        outbox.enqueue(f"bench-{current['index']}", endpoint, payload, kind)
+
+    outbox.delivered.connect(on_delivered, Qt.DirectConnection)
+    outbox.start(lambda: headers)
+
+    tail = TailThread(os.devnull)
+    tail.registered_user = args.user
+    tail.kill_detected.connect(on_card, Qt.DirectConnection)
+    tail.death_detected.connect(on_card, Qt.DirectConnection)
+    tail.card_enriched.connect(on_enriched, Qt.DirectConnection)
+    tail.payload_ready.connect(lambda payload, *_: submit(payload, os.environ["SCTOOL_API_ENDPOINT"], "kill"), Qt.DirectConnection)
+    tail.death_payload_ready.connect(
+        lambda payload, *_: submit(payload, os.environ["SCTOOL_API_ENDPOINT"].replace('/kills', '/deaths'), "death"), Qt.DirectConnection
+    )
+
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    started = time.perf_counter()
+    for index, line in enumerate(lines):
+        current['index'] = index
+        line_started[index] = time.perf_counter()
+        tail.process_line(line)
+        next_at = started + (index + 1) * interval
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    deadline = time.perf_counter() + args.drain_timeout
+    while time.perf_counter() < deadline:
+        with lock:
+            if outstanding['cards'] <= 0 and outstanding['acks'] <= 0:
+                break
+        time.sleep(0.05)
+
+    tail.stop()
+    outbox.stop()
+    server.stop()
+    app.processEvents()
+
+    report = {
+        'lines': len(lines),
+        'stored_profiles': {'mode': args.stored, 'count': stored_profiles},
+        'server': {'latency_ms': args.latency_ms, 'jitter_ms': args.jitter_ms, 'error_rate': args.error_rate,
+                   'throttle_rate': args.throttle_rate, **server.stats},
+        'line_to_first_card': summarize(first_card),
+        'line_to_final_card': summarize(final_card),
+        'kill_to_api_ack': summarize(api_ack),
+        'api_failures': api_failures[0],
+        'cards_never_enriched': len(pending_cards),
+        'rsi_scheduler': get_rsi_scheduler().get_stats(),
+        'outbox': outbox.get_stats(),
+        'api_throttle': get_api_throttle().get_stats()
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,91 +1,151 @@
 # player_cache.py
 
+import sys
+import json
 import time
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple
 from threading import Lock
 
+DETAILS_KIND = 'details'
+IMAGE_KIND = 'image'
+IMAGE_DATA_KIND = 'image_data'
+
 
 class PlayerCache:
-    """Thread-safe cache for player details and images"""
-    
-    def __init__(self, max_age_seconds: int = 3600):
+    """Thread-safe, size-bounded LRU cache for player details and images with per-entry TTL expiry"""
+
+    def __init__(self, max_age_seconds: int = 3600, max_entries: int = 2000, max_bytes: int = 8 * 1024 * 1024):
         self.max_age = max_age_seconds
-        self._details_cache: Dict[str, Tuple[Dict[str, str], float]] = {}
-        self._image_cache: Dict[str, Tuple[str, float]] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # (kind, player_name) -> (value, expires_at, size)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
         self._lock = Lock()
         self.logger = logging.getLogger(__name__)
-    
-    def get_player_details(self, player_name: str) -> Optional[Dict[str, str]]:
-        """Get cached player details if available and not expired"""
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        if isinstance(value, str):
+            return len(value)
+        try:
+            return len(json.dumps(value))
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
+
+    def _get(self, kind: str, player_name: str) -> Optional[Any]:
+        key = (kind, player_name)
         with self._lock:
-            if player_name in self._details_cache:
-                details, timestamp = self._details_cache[player_name]
-                if time.time() - timestamp < self.max_age:
-                    self.logger.debug(f"Cache hit for player details: {player_name}")
-                    return details
-                else:
-                    del self._details_cache[player_name]
-            return None
-    
-    def cache_player_details(self, player_name: str, details: Dict[str, str]) -> None:
-        """Cache player details with timestamp"""
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, expires_at, size = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            self.logger.debug(f"Cache hit for player {kind}: {player_name}")
+            return value
+
+    def _put(self, kind: str, player_name: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        key = (kind, player_name)
+        size = self._estimate_size(value)
+        expires_at = time.time() + (self.max_age if ttl_seconds is None else ttl_seconds)
         with self._lock:
-            self._details_cache[player_name] = (details, time.time())
-            self.logger.debug(f"Cached player details: {player_name}")
-    
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                evicted_key, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+                self.logger.debug(f"Evicted player {evicted_key[0]}: {evicted_key[1]}")
+            self.logger.debug(f"Cached player {kind}: {player_name}")
+
+    def get_player_details(self, player_name: str) -> Optional[Dict[str, str]]:
+        """Get cached player details if available and not expired"""
+        return self._get(DETAILS_KIND, player_name)
+
+    def cache_player_details(self, player_name: str, details: Dict[str, str], ttl_seconds: Optional[int] = None) -> None:
+        """Cache player details, optionally with a shorter TTL (e.g. for failed lookups)"""
+        self._put(DETAILS_KIND, player_name, details, ttl_seconds)
+
     def get_player_image(self, player_name: str) -> Optional[str]:
         """Get cached player image if available and not expired"""
+        return self._get(IMAGE_KIND, player_name)
+
+    def cache_player_image(self, player_name: str, image_data: str, ttl_seconds: Optional[int] = None) -> None:
+        """Cache player image, optionally with a shorter TTL"""
+        self._put(IMAGE_KIND, player_name, image_data, ttl_seconds)
+
+    def get_player_image_data(self, player_name: str) -> Optional[str]:
+        """Get a cached base64 data URI avatar if available and not expired"""
+        return self._get(IMAGE_DATA_KIND, player_name)
+
+    def cache_player_image_data(self, player_name: str, image_data_uri: str, ttl_seconds: Optional[int] = None) -> None:
+        """Cache a base64 data URI avatar, optionally with a shorter TTL"""
+        self._put(IMAGE_DATA_KIND, player_name, image_data_uri, ttl_seconds)
+
+    def has_player_profile(self, player_name: str) -> bool:
+        """Whether unexpired details and image are both cached, without touching LRU order or counters"""
+        now = time.time()
         with self._lock:
-            if player_name in self._image_cache:
-                image_data, timestamp = self._image_cache[player_name]
-                if time.time() - timestamp < self.max_age:
-                    self.logger.debug(f"Cache hit for player image: {player_name}")
-                    return image_data
-                else:
-                    del self._image_cache[player_name]
-            return None
-    
-    def cache_player_image(self, player_name: str, image_data: str) -> None:
-        """Cache player image with timestamp"""
-        with self._lock:
-            self._image_cache[player_name] = (image_data, time.time())
-            self.logger.debug(f"Cached player image: {player_name}")
-    
+            for kind in (DETAILS_KIND, IMAGE_KIND):
+                entry = self._entries.get((kind, player_name))
+                if entry is None or now >= entry[1]:
+                    return False
+            return True
+
     def clear_expired_entries(self) -> None:
         """Remove all expired cache entries"""
         current_time = time.time()
         with self._lock:
-            expired_details = [
-                player for player, (_, timestamp) in self._details_cache.items()
-                if current_time - timestamp >= self.max_age
-            ]
-            for player in expired_details:
-                del self._details_cache[player]
-            
-            expired_images = [
-                player for player, (_, timestamp) in self._image_cache.items()
-                if current_time - timestamp >= self.max_age
+            expired = [
+                key for key, (_, expires_at, _) in self._entries.items()
+                if current_time >= expires_at
             ]
-            for player in expired_images:
-                del self._image_cache[player]
-            
-            if expired_details or expired_images:
-                self.logger.info(f"Cleared {len(expired_details)} expired details and {len(expired_images)} expired images")
-    
+            for key in expired:
+                self._bytes -= self._entries.pop(key)[2]
+            self._expirations += len(expired)
+
+            if expired:
+                self.logger.info(f"Cleared {len(expired)} expired player cache entries")
+
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
         with self._lock:
+            details_entries = sum(1 for kind, _ in self._entries if kind == DETAILS_KIND)
             return {
-                'details_entries': len(self._details_cache),
-                'image_entries': len(self._image_cache)
+                'details_entries': details_entries,
+                'image_entries': len(self._entries) - details_entries,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations
             }
-    
+
     def clear_all(self) -> None:
         """Clear all cache entries"""
         with self._lock:
-            self._details_cache.clear()
-            self._image_cache.clear()
+            self._entries.clear()
+            self._bytes = 0
             self.logger.info("Cleared all cache entries")
 
 
@@ -94,4 +154,4 @@ _player_cache = PlayerCache()
 
 def get_player_cache() -> PlayerCache:
     """Get the global player cache instance"""
-    return _player_cache
\ No newline at end of file
+    return _player_cache
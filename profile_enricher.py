@@ -0,0 +1,66 @@
+# profile_enricher.py
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from typing import Any, Callable, Dict, List
+
+
+class ProfileEnricher:
+    """Background worker pool for RSI profile lookups so kill cards never wait on the network"""
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ProfileEnricher")
+        self._lock = Lock()
+        self._callbacks: Dict[str, List[Callable[[Any], None]]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def submit(self, key: str, job: Callable[[], Any], callback: Callable[[Any], None]) -> None:
+        """
+        Run job on the pool and hand its result to callback.
+
+        Jobs submitted with the same key while one is already queued or running
+        share its result instead of starting another lookup.
+        """
+        with self._lock:
+            if key in self._callbacks:
+                self._callbacks[key].append(callback)
+                self.logger.debug(f"Enrichment already queued for {key}; attaching callback")
+                return
+            self._callbacks[key] = [callback]
+
+        future = self._executor.submit(job)
+        future.add_done_callback(lambda f, k=key: self._deliver(k, f))
+
+    def _deliver(self, key: str, future: Future) -> None:
+        with self._lock:
+            callbacks = self._callbacks.pop(key, [])
+
+        try:
+            result = future.result()
+        except Exception as e:
+            self.logger.error(f"Profile enrichment failed for {key}: {e}")
+            return
+
+        for callback in callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                self.logger.error(f"Error delivering enrichment for {key}: {e}")
+
+    def pending_count(self) -> int:
+        """Number of distinct lookups queued or in flight"""
+        with self._lock:
+            return len(self._callbacks)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work, drop queued lookups and optionally wait for running ones"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_profile_enricher = ProfileEnricher()
+
+
+def get_profile_enricher() -> ProfileEnricher:
+    """Get the global profile enricher instance"""
+    return _profile_enricher
@@ -0,0 +1,132 @@
+# profile_prefetcher.py
+
+import time
+import logging
+from collections import OrderedDict, deque
+from threading import Condition, Thread
+from typing import Deque, Dict, Optional
+
+from kill_event_formatter import KillEventFormatter
+from player_cache import get_player_cache
+from profile_enricher import get_profile_enricher
+from rsi_scheduler import PRIORITY_PREFETCH
+
+DEFAULT_REQUESTS_PER_MINUTE = 12
+QUEUE_LIMIT = 50
+RECENT_LIMIT = 500
+RECENT_SECONDS = 600
+
+
+class ProfilePrefetcher:
+    """
+    Low-priority background warm-up of the player cache for players seen in the log.
+
+    Names offered here are looked up one at a time, newest first, within a
+    requests-per-minute budget, and only while no card enrichment is waiting,
+    so a later kill or death involving them renders straight from cache.
+    """
+
+    def __init__(self, requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE):
+        self.requests_per_minute = requests_per_minute
+        self._queue: Deque[str] = deque()
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._request_times: Deque[float] = deque()
+        self._condition = Condition()
+        self._worker: Optional[Thread] = None
+        self._stopped = False
+        self.stats: Dict[str, int] = {'offered': 0, 'prefetched': 0, 'already_cached': 0, 'dropped': 0}
+        self.logger = logging.getLogger(__name__)
+
+    def set_budget(self, requests_per_minute: int) -> None:
+        """Change the lookup budget; 0 disables prefetching"""
+        with self._condition:
+            self.requests_per_minute = max(0, int(requests_per_minute))
+            if self.requests_per_minute == 0:
+                self._queue.clear()
+            self._condition.notify()
+        self.logger.info(f"Profile prefetch budget set to {self.requests_per_minute} requests/minute")
+
+    def offer(self, player_name: str) -> None:
+        """Queue a human player's profile for prefetching if it is not cached or recently offered"""
+        if not player_name or self.requests_per_minute <= 0:
+            return
+        key = player_name.lower()
+        now = time.time()
+        with self._condition:
+            seen_at = self._recent.get(key)
+            if seen_at is not None and now - seen_at < RECENT_SECONDS:
+                return
+            self._recent[key] = now
+            self._recent.move_to_end(key)
+            while len(self._recent) > RECENT_LIMIT:
+                self._recent.popitem(last=False)
+
+            if get_player_cache().has_player_profile(player_name):
+                self.stats['already_cached'] += 1
+                return
+
+            self.stats['offered'] += 1
+            self._queue.appendleft(player_name)
+            while len(self._queue) > QUEUE_LIMIT:
+                self._queue.pop()
+                self.stats['dropped'] += 1
+
+            if self._worker is None:
+                self._worker = Thread(target=self._run, name="ProfilePrefetcher", daemon=True)
+                self._worker.start()
+            self._condition.notify()
+
+    def _budget_wait(self, now: float) -> float:
+        while self._request_times and now - self._request_times[0] >= 60:
+            self._request_times.popleft()
+        if len(self._request_times) < self.requests_per_minute:
+            return 0.0
+        return 60 - (now - self._request_times[0])
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                wait = self._budget_wait(time.time())
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                if get_profile_enricher().pending_count() > 0:
+                    # Cards waiting on enrichment take precedence over speculative lookups
+                    self._condition.wait(0.5)
+                    continue
+                player_name = self._queue.popleft()
+                if get_player_cache().has_player_profile(player_name):
+                    self.stats['already_cached'] += 1
+                    continue
+                self._request_times.append(time.time())
+
+            try:
+                KillEventFormatter.safe_get_player_profile(player_name, PRIORITY_PREFETCH)
+                self.stats['prefetched'] += 1
+                self.logger.debug(f"Prefetched profile for {player_name}")
+            except Exception as e:
+                self.logger.error(f"Profile prefetch failed for {player_name}: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get prefetch counters and the current queue depth"""
+        with self._condition:
+            return dict(self.stats, queued=len(self._queue), budget=self.requests_per_minute)
+
+    def shutdown(self) -> None:
+        """Stop the worker after its current lookup"""
+        with self._condition:
+            self._stopped = True
+            self._queue.clear()
+            self._condition.notify_all()
+
+
+_profile_prefetcher = ProfilePrefetcher()
+
+
+def get_profile_prefetcher() -> ProfilePrefetcher:
+    """Get the global profile prefetcher instance"""
+    return _profile_prefetcher
@@ -0,0 +1,141 @@
+# profile_store.py
+
+import os
+import json
+import time
+import sqlite3
+import logging
+from threading import Lock
+from typing import Dict, Any, Optional
+
+PROFILE_DB_FILE = os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "SCTool_Tracker", "player_profiles.db")
+
+PROFILE_TTL_SECONDS = 24 * 3600
+STALE_RETENTION_SECONDS = 30 * 24 * 3600
+
+
+class ProfileStore:
+    """SQLite-backed player profile cache that survives restarts; opened on first use"""
+
+    def __init__(self, db_file: str = PROFILE_DB_FILE, ttl_seconds: int = PROFILE_TTL_SECONDS):
+        self.db_file = db_file
+        self.ttl = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS profiles (
+                    name TEXT PRIMARY KEY,
+                    details TEXT NOT NULL,
+                    avatar_url TEXT,
+                    image_url TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("DELETE FROM profiles WHERE expires_at < ?", (time.time() - STALE_RETENTION_SECONDS,))
+            conn.commit()
+            self._conn = conn
+            self.logger.info(f"Opened player profile store at {self.db_file}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Could not open player profile store {self.db_file}: {e}")
+        return self._conn
+
+    def get(self, player_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for player_name, fresh or stale.
+
+        The entry carries 'details', 'avatar_url', 'image_url', 'etag',
+        'last_modified' and 'fresh' (False once its TTL has passed, meaning it
+        should be revalidated before use).
+        """
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT details, avatar_url, image_url, etag, last_modified, expires_at "
+                    "FROM profiles WHERE name = ?", (player_name.lower(),)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error reading stored profile for {player_name}: {e}")
+                return None
+        if row is None:
+            return None
+        details, avatar_url, image_url, etag, last_modified, expires_at = row
+        return {
+            'details': json.loads(details),
+            'avatar_url': avatar_url,
+            'image_url': image_url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': time.time() < expires_at
+        }
+
+    def put(self, player_name: str, details: Dict[str, str], avatar_url: Optional[str], image_url: Optional[str],
+            etag: Optional[str] = None, last_modified: Optional[str] = None, ttl_seconds: Optional[int] = None) -> None:
+        """Store a freshly fetched profile with its own TTL and the page validators"""
+        now = time.time()
+        ttl = self.ttl if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO profiles "
+                    "(name, details, avatar_url, image_url, etag, last_modified, fetched_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (player_name.lower(), json.dumps(details), avatar_url, image_url, etag, last_modified, now, now + ttl)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error storing profile for {player_name}: {e}")
+
+    def touch(self, player_name: str, ttl_seconds: Optional[int] = None) -> None:
+        """Extend an entry's TTL after the server confirmed it is unchanged"""
+        ttl = self.ttl if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute("UPDATE profiles SET expires_at = ? WHERE name = ?", (time.time() + ttl, player_name.lower()))
+                conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error refreshing stored profile for {player_name}: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get entry counts for the store"""
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return {'entries': 0, 'fresh_entries': 0}
+            total = conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+            fresh = conn.execute("SELECT COUNT(*) FROM profiles WHERE expires_at >= ?", (time.time(),)).fetchone()[0]
+            return {'entries': total, 'fresh_entries': fresh}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_profile_store = ProfileStore()
+
+
+def get_profile_store() -> ProfileStore:
+    """Get the global player profile store instance"""
+    return _profile_store
@@ -0,0 +1,194 @@
+# rsi_scheduler.py
+
+import time
+import heapq
+import logging
+import itertools
+from email.utils import parsedate_to_datetime
+from threading import Condition
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from citizen_page import RSI_BASE_URL
+
+PRIORITY_ENRICHMENT = 0
+PRIORITY_OVERLAY = 1
+PRIORITY_PREFETCH = 2
+PRIORITY_COSMETIC = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_ENRICHMENT: 'enrichment',
+    PRIORITY_OVERLAY: 'overlay',
+    PRIORITY_PREFETCH: 'prefetch',
+    PRIORITY_COSMETIC: 'cosmetic',
+}
+
+RSI_HOST_SUFFIX = "robertsspaceindustries.com"
+DEFAULT_THROTTLE_PAUSE_SECONDS = 30.0
+MAX_RETRY_AFTER_SECONDS = 600.0
+# Longest a request waits for its turn before failing with RsiQueueTimeout
+MAX_QUEUE_WAIT_SECONDS = 15.0
+
+
+def is_rsi_url(url: str) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    if host and host == (urlparse(RSI_BASE_URL).hostname or "").lower():
+        return True
+    return host == RSI_HOST_SUFFIX or host.endswith("." + RSI_HOST_SUFFIX)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RsiQueueTimeout(requests.exceptions.Timeout):
+    """The request could not get an RSI slot within its max_wait (e.g. during a Retry-After pause); retry later"""
+
+
+class RsiScheduler:
+    """
+    Single gate for outbound robertsspaceindustries.com requests.
+
+    A token bucket (rate per second, burst capacity) meters the traffic and
+    waiting requests are released strictly by priority class, then arrival order.
+    A 429/503 pauses every class until its Retry-After has passed. A request
+    that would wait longer than its max_wait fails with RsiQueueTimeout
+    instead, at once if a pause already outlasts it, so workers are not tied up.
+    Requests to other hosts go straight through the shared session.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None, rate: float = 2.0, burst: int = 6):
+        self.session = session or requests.Session()
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = Condition()
+        self._requests = {priority: 0 for priority in PRIORITY_NAMES}
+        self._wait_total = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self._wait_max = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self._throttled = 0
+        self._queue_timeouts = 0
+        self.logger = logging.getLogger(__name__)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _acquire(self, priority: int, max_wait: float) -> float:
+        """Block until this request may go out; returns the time spent waiting, or raises RsiQueueTimeout"""
+        ticket = (priority, next(self._sequence))
+        start = time.monotonic()
+        deadline = start + max_wait
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if now < self._paused_until:
+                        if self._paused_until > deadline:
+                            self._queue_timeouts += 1
+                            raise RsiQueueTimeout(f"RSI requests are paused for {self._paused_until - now:.0f}s")
+                        self._condition.wait(self._paused_until - now)
+                        continue
+                    if self._waiters[0] == ticket and self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        break
+                    if now >= deadline:
+                        self._queue_timeouts += 1
+                        raise RsiQueueTimeout(f"No RSI request slot within {max_wait:g}s")
+                    if self._waiters[0] != ticket:
+                        self._condition.wait(deadline - now)
+                    else:
+                        self._condition.wait(min((1.0 - self._tokens) / self.rate, deadline - now))
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+            waited = time.monotonic() - start
+            self._requests[priority] += 1
+            self._wait_total[priority] += waited
+            self._wait_max[priority] = max(self._wait_max[priority], waited)
+        return waited
+
+    def _note_response(self, response: requests.Response, url: str) -> None:
+        if response.status_code not in (429, 503):
+            return
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            if response.status_code == 503:
+                return
+            delay = DEFAULT_THROTTLE_PAUSE_SECONDS
+        delay = min(delay, MAX_RETRY_AFTER_SECONDS)
+        with self._condition:
+            self._throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._condition.notify_all()
+        self.logger.warning(f"RSI responded {response.status_code} for {url}; pausing RSI requests for {delay:.1f}s")
+
+    def request(self, method: str, url: str, priority: int = PRIORITY_ENRICHMENT,
+                max_wait: float = MAX_QUEUE_WAIT_SECONDS, **kwargs) -> requests.Response:
+        """Send a request through the shared session, metered and ordered by priority for RSI hosts"""
+        if not is_rsi_url(url):
+            return self.session.request(method, url, **kwargs)
+        waited = self._acquire(priority, max_wait)
+        if waited > 1.0:
+            self.logger.debug(f"{PRIORITY_NAMES.get(priority, priority)} request to {url} waited {waited:.2f}s")
+        response = self.session.request(method, url, **kwargs)
+        self._note_response(response, url)
+        return response
+
+    def get(self, url: str, priority: int = PRIORITY_ENRICHMENT, **kwargs) -> requests.Response:
+        return self.request("GET", url, priority, **kwargs)
+
+    def post(self, url: str, priority: int = PRIORITY_ENRICHMENT, **kwargs) -> requests.Response:
+        return self.request("POST", url, priority, **kwargs)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Queue depth per class, wait times, throttle and queue-timeout counts and remaining pause"""
+        with self._condition:
+            depth = {name: 0 for name in PRIORITY_NAMES.values()}
+            for priority, _ in self._waiters:
+                depth[PRIORITY_NAMES.get(priority, str(priority))] += 1
+            waits = {
+                PRIORITY_NAMES[priority]: {
+                    'requests': self._requests[priority],
+                    'mean_wait_ms': round(self._wait_total[priority] * 1000 / self._requests[priority], 1) if self._requests[priority] else 0.0,
+                    'max_wait_ms': round(self._wait_max[priority] * 1000, 1)
+                }
+                for priority in PRIORITY_NAMES
+            }
+            return {
+                'queue_depth': depth,
+                'waits': waits,
+                'throttled': self._throttled,
+                'queue_timeouts': self._queue_timeouts,
+                'paused_for_seconds': round(max(0.0, self._paused_until - time.monotonic()), 1),
+                'tokens': round(self._tokens, 2)
+            }
+
+
+_rsi_scheduler = RsiScheduler()
+
+
+def get_rsi_scheduler() -> RsiScheduler:
+    """Get the global RSI scheduler instance"""
+    return _rsi_scheduler
@@ -0,0 +1,255 @@
+# standin_server.py
+
+"""
+Local stand-in for robertsspaceindustries.com and the starcitizentool API.
+
+Serves canned citizen pages, the Spectrum member autocomplete, avatar images and
+the /api/v1 kills, deaths, ping and kills/update-clip endpoints (plus an optional
+kills/bulk batch endpoint), with configurable latency, error rate and 429
+throttling. Citizen pages carry an ETag and answer a matching If-None-Match
+with 304, as RSI does for revalidated profiles, so enrichment and API submission can be exercised and benchmarked
+without touching the real sites.
+
+Point the tracker at it with:
+    SCTOOL_RSI_BASE_URL=http://127.0.0.1:8765
+    SCTOOL_API_ENDPOINT=http://127.0.0.1:8765/api/v1/kills
+
+Usage:
+    python standin_server.py --port 8765 --latency-ms 150 --jitter-ms 50 --error-rate 0.02 --throttle-rate 0.01
+"""
+
+import os
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+AVATAR_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "avatar_default_big.jpg")
+
+# Handles starting with this prefix get a 404 citizen page, to exercise negative caching
+MISSING_PREFIX = "Missing"
+
+
+def citizen_page_html(handle: str) -> str:
+    """Minimal page with the same anchors as a real citizen profile"""
+    return (
+        '<!DOCTYPE html><html><head><title>' + handle + ' | Citizen</title></head><body>'
+        '<div id="public-profile" class="profile-content overview-content clearfix">'
+        '<div class="profile left-col"><div class="inner clearfix">'
+        f'<div class="thumb"><img src="/media/avatars/{handle}.jpg" /></div>'
+        f'<div class="info"><p class="entry"><strong class="value">{handle}</strong></p></div>'
+        '</div></div><div class="left-col"><div class="inner">'
+        '<p class="entry"><span class="label">Enlisted</span><strong class="value">Jan 1, 2015</strong></p>'
+        '</div></div></div></body></html>'
+    )
+
+
+def citizen_etag(handle: str) -> str:
+    """Validator the stand-in sends with a citizen page (stable per handle)"""
+    return f'"standin-{handle.lower()}"'
+
+
+class StandInServer:
+    """Threaded HTTP stand-in with injectable latency, failures and throttling"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, retry_after: float = 1.0, seed: Optional[int] = None,
+                 bulk: bool = False):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.bulk = bulk
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {'requests': 0, 'errors': 0, 'throttled': 0, 'kills': 0, 'duplicates': 0,
+                                      'not_modified': 0}
+        self._logged_kills = set()
+        with open(AVATAR_FILE, 'rb') as f:
+            self._avatar = f.read()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this, keep-alive
+            # clients see Nagle + delayed-ACK stalls of ~40 ms per response
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                logging.debug("standin: " + format % args)
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="StandInServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _roll(self) -> Tuple[float, float]:
+        with self._random_lock:
+            return self._random.random(), self._random.uniform(-self.jitter_ms, self.jitter_ms)
+
+    def _handle(self, request: BaseHTTPRequestHandler, method: str) -> None:
+        self._count('requests')
+        length = int(request.headers.get("Content-Length") or 0)
+        body = request.rfile.read(length) if length else b""
+
+        roll, jitter = self._roll()
+        delay = max(0.0, self.latency_ms + jitter) / 1000
+        if delay:
+            time.sleep(delay)
+
+        if roll < self.throttle_rate:
+            self._count('throttled')
+            self._send(request, 429, {"message": "Too Many Requests"}, {"Retry-After": f"{self.retry_after:g}"})
+            return
+        if roll < self.throttle_rate + self.error_rate:
+            self._count('errors')
+            self._send(request, 503, {"message": "Service Unavailable"})
+            return
+
+        path = unquote(urlparse(request.path).path)
+        try:
+            status, payload, content_type, headers = self._route(method, path, body, request.headers)
+        except Exception as e:
+            logging.error(f"standin: error handling {method} {path}: {e}")
+            status, payload, content_type, headers = 500, {"message": str(e)}, None, None
+        self._send(request, status, payload, headers, content_type)
+
+    def _route(self, method: str, path: str, body: bytes, headers):
+        if method == "GET" and path.startswith("/citizens/"):
+            handle = path[len("/citizens/"):].strip("/")
+            if handle.startswith(MISSING_PREFIX):
+                return 404, "<html><body>Not found</body></html>", "text/html; charset=utf-8", None
+            etag = citizen_etag(handle)
+            if headers.get("If-None-Match") == etag:
+                self._count('not_modified')
+                return 304, b"", None, {"ETag": etag}
+            return 200, citizen_page_html(handle), "text/html; charset=utf-8", {"ETag": etag}
+
+        if method == "GET" and path.startswith("/media/avatars/"):
+            # Append the path so each handle gets distinct (still decodable) image bytes
+            return 200, self._avatar + path.encode("utf-8"), "image/jpeg", None
+
+        if method == "POST" and path == "/api/spectrum/search/member/autocomplete":
+            text = json.loads(body or b"{}").get("text", "")
+            members = [{
+                "nickname": f"{text}{suffix}",
+                "meta": {"badges": [
+                    {"name": "Standin Org", "url": "https://robertsspaceindustries.com/orgs/STANDIN"},
+                    {"name": "Bounty Hunter"}
+                ]}
+            } for suffix in "0123456789abcdefghijklmnopqrstuvwxyz"]
+            return 200, {"success": 1, "data": {"members": members}}, None, None
+
+        if method == "GET" and path == "/api/v1/ping":
+            capabilities = ["kills_bulk"] if self.bulk else []
+            return 200, {"status": "ok", "capabilities": capabilities}, None, None
+
+        if method == "POST" and path == "/api/v1/kills/bulk" and self.bulk:
+            kills = json.loads(body or b"{}").get("kills", [])
+            return 200, {"results": [self._log_kill(kill.get("log_line", "")) for kill in kills]}, None, None
+
+        if method == "POST" and path in ("/api/v1/kills", "/api/v1/deaths"):
+            result = self._log_kill(json.loads(body or b"{}").get("log_line", ""))
+            return result.pop("status"), result, None, None
+
+        if method == "POST" and path == "/api/v1/kills/update-clip":
+            return 200, {"message": "Clip URL updated"}, None, None
+
+        return 404, {"message": f"No stand-in route for {method} {path}"}, None, None
+
+    def _log_kill(self, log_line: str) -> Dict[str, object]:
+        with self._stats_lock:
+            duplicate = log_line in self._logged_kills
+            self._logged_kills.add(log_line)
+        if duplicate:
+            self._count('duplicates')
+            return {"status": 201, "message": "Duplicate kill"}
+        self._count('kills')
+        return {"status": 201, "message": "Kill logged"}
+
+    @staticmethod
+    def _send(request: BaseHTTPRequestHandler, status: int, payload, headers: Optional[Dict[str, str]] = None,
+              content_type: Optional[str] = None) -> None:
+        if isinstance(payload, bytes):
+            data = payload
+        elif isinstance(payload, str):
+            data = payload.encode("utf-8")
+        else:
+            data = json.dumps(payload).encode("utf-8")
+            content_type = content_type or "application/json"
+        request.send_response(status)
+        request.send_header("Content-Type", content_type or "application/octet-stream")
+        request.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(data)
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Base response latency")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="Uniform +/- latency jitter")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument('--retry-after', type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--bulk', action='store_true', help="Advertise and serve POST /api/v1/kills/bulk")
+
+
+def server_from_args(args: argparse.Namespace, port: int = 0) -> StandInServer:
+    return StandInServer(port=port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                         throttle_rate=args.throttle_rate, retry_after=args.retry_after, seed=args.seed,
+                         bulk=args.bulk)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for RSI and the starcitizentool API")
+    parser.add_argument('--port', type=int, default=8765)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = server_from_args(args, args.port).start()
+    print(f"Stand-in server listening on {server.base_url}")
+    print(f"  SCTOOL_RSI_BASE_URL={server.base_url}")
+    print(f"  SCTOOL_API_ENDPOINT={server.base_url}/api/v1/kills")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,18 @@
 import os
 import re
 import sys
-import json
 import time
 import logging
 import shutil
-import requests
 
 from responsive_ui import ScreenScaler
 from overlay import GameOverlay, OverlayControlPanel
 from language_manager import t, get_language_manager
 from kill_parser import VERSION
+from avatar_store import AVATAR_DIR
+from profile_prefetcher import get_profile_prefetcher, DEFAULT_REQUESTS_PER_MINUTE
+from api_client import get_api_client
+from kill_records import strip_readout
 from PyQt5.QtGui import QKeyEvent
 from datetime import datetime, timedelta
 from PyQt5.QtGui import QIcon, QDesktopServices, QPixmap, QPainter, QBrush, QPen, QColor, QPainterPath, QKeySequence, QFont, QFontMetrics
@@ -383,6 +385,7 @@ def init_ui(self) -> None:
         indicator_widget.setStyleSheet("QLabel { border-radius: 5px; }")
         
         label = QLabel(label_text)
+        label.setObjectName("status_label")
         label.setStyleSheet(
             "QLabel { color: #cccccc; font-size: 11px; font-weight: 500; "
             "background: transparent; border: none; }"
@@ -408,6 +411,12 @@ def init_ui(self) -> None:
     status_bar_layout.addWidget(twitch_status)
     self.update_twitch_indicator(False)
     
+    self.api_delivery_indicator = QLabel()
+    api_delivery_status = create_horizontal_status_item("API Parallel", self.api_delivery_indicator)
+    self.api_delivery_label = api_delivery_status.findChild(QLabel, "status_label")
+    status_bar_layout.addWidget(api_delivery_status)
+    self.update_api_delivery_status()
+    
     status_bar_layout.addStretch()
     
     content_layout.addWidget(self.status_bar)
@@ -489,11 +498,18 @@ def init_ui(self) -> None:
                 function clearContent() {
                     document.getElementById('content').innerHTML = '';
                 }
+                function replaceCard(id, html) {
+                    var card = document.getElementById(id);
+                    if (card) {
+                        card.outerHTML = html;
+                    }
+                }
             </script>
         </body>
         </html>
         """
-        self.kill_display.setHtml(initial_html)
+        # A file:// base URL lets cards reference avatars from the on-disk avatar store
+        self.kill_display.setHtml(initial_html, QUrl.fromLocalFile(os.path.join(AVATAR_DIR, "")))
         self.kill_display.setStyleSheet("""
             QWebEngineView {
                 background-color: rgba(20, 20, 20, 0.8);
@@ -2279,13 +2295,11 @@ def switch_page(self, index):
 def load_config(self) -> None:
     """Load configuration from config file"""
     try:
-        if os.path.isfile(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if not content:
-                    logging.warning("Configuration file is empty, using defaults")
-                    return
-                config = json.loads(content)
+        if self.config_store.exists():
+            config = self.config_store.snapshot()
+            if not config:
+                logging.warning("Configuration file is empty, using defaults")
+                return
 
             self.api_key = config.get('api_key', '')
             self.api_key_input.setText(self.api_key)
@@ -2421,6 +2435,9 @@ def load_config(self) -> None:
             self.show_pilot_abandoned = config.get('show_pilot_abandoned', True)
             self.show_pilot_abandoned_checkbox.setChecked(self.show_pilot_abandoned)
             
+            self.profile_prefetch_per_minute = config.get('profile_prefetch_per_minute', DEFAULT_REQUESTS_PER_MINUTE)
+            get_profile_prefetcher().set_budget(self.profile_prefetch_per_minute)
+            
             self.auto_clear_logs = config.get('auto_clear_logs', False)
             if hasattr(self, 'auto_clear_logs_checkbox'):
                 self.auto_clear_logs_checkbox.setChecked(self.auto_clear_logs)
@@ -2429,8 +2446,6 @@ def load_config(self) -> None:
                 QTimer.singleShot(500, self.toggle_monitoring)
                 
             logging.info("Configuration loaded successfully")
-    except json.JSONDecodeError as e:
-        logging.error(f"Configuration file is corrupted (JSON error): {e}")
     except Exception as e:
         logging.error(f"Error loading configuration: {e}")
 
@@ -2455,13 +2470,15 @@ def on_custom_ext_changed(self, value: str) -> None:
         logging.error(f"Failed to load config: {e}")
         
 def load_local_kills(self) -> None:
-    """Load locally saved kills from JSON file"""
+    """Load locally saved kills from the kill store (importing a legacy JSON file on first run)"""
     try:
-        if os.path.isfile(self.kills_local_file):
-            with open(self.kills_local_file, 'r', encoding='utf-8') as f:
-                self.local_kills = json.load(f)
-                
+        self.local_kills = self.kill_store.load_all()
+        if self.local_kills:
             logging.info(f"Loaded {len(self.local_kills)} previous kills from local storage")
+        stripped = {key: kill for key, kill in self.local_kills.items() if strip_readout(kill)}
+        if stripped:
+            self.kill_store.put_many(stripped)
+            logging.info(f"Dropped stored readouts from {len(stripped)} legacy kill records")
     except Exception as e:
         logging.error(f"Failed to load local kills: {e}")
         self.local_kills = {}
@@ -2602,7 +2619,7 @@ def check_for_updates_ui(self) -> None:
         
         logging.info(f"Checking for updates... Current version: {current_version}")
         
-        response = requests.get(update_url, headers=headers, params=params, timeout=10)
+        response = get_api_client().get(update_url, headers=headers, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -5,7 +5,7 @@ import time
 import logging
 from typing import Dict, List, Optional, Tuple, NamedTuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import threading
 
 from kill_parser import KillParser
@@ -37,6 +37,70 @@ class ActorDeathEvent:
     zone: str
     log_time: float
 
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 15.0)
+SCORE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.5)
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram; the last slot counts values above the final bound"""
+    bounds: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    total: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def to_dict(self) -> Dict:
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            'buckets': dict(zip(labels, self.counts)),
+            'count': self.total,
+            'mean': round(self.mean(), 4),
+            'max': round(self.max, 4)
+        }
+
+@dataclass
+class CorrelatorStats:
+    """Instrumentation counters for tuning correlation timeouts and thresholds"""
+    events_buffered: int = 0
+    events_correlated: int = 0
+    events_expired: int = 0
+    npc_skipped: int = 0
+    unmatched_deaths: int = 0
+    peak_pending: int = 0
+    correlation_latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    match_score: Histogram = field(default_factory=lambda: Histogram(SCORE_BUCKETS))
+
+    def to_dict(self) -> Dict:
+        return {
+            'events_buffered': self.events_buffered,
+            'events_correlated': self.events_correlated,
+            'events_expired': self.events_expired,
+            'npc_skipped': self.npc_skipped,
+            'unmatched_deaths': self.unmatched_deaths,
+            'peak_pending': self.peak_pending,
+            'correlation_latency': self.correlation_latency.to_dict(),
+            'match_score': self.match_score.to_dict()
+        }
+
 class VehicleEventCorrelator:
     """
     Correlates vehicle destruction events with actor death events
@@ -47,6 +111,9 @@ class VehicleEventCorrelator:
         self.correlation_timeout = correlation_timeout
         self.disabled_timeout = 0.0
         self.destroyed_timeout = 1.0
+        self.score_threshold = 0.3
+        self.stats = CorrelatorStats()
+        self._stats_lock = threading.Lock()
         self.pending_vehicle_events: List[VehicleDestroyEvent] = []
         self._pending_lock = threading.Lock()
         self._cleanup_interval = 0.1
@@ -82,8 +149,11 @@ class VehicleEventCorrelator:
             r'to unblock removal of parent id = (?P<seat_id>\d+) name = "(?P<seat_name>[^"]+)"'
         )
 
-    def process_log_line(self, line: str) -> Tuple[Optional[Dict], List[Dict]]:
+    def process_log_line(self, line: str, current_time: Optional[float] = None) -> Tuple[Optional[Dict], List[Dict]]:
         """        
+        current_time defaults to the wall clock; the replay harness passes a
+        simulated clock so bursts can be replayed faster than real time.
+
         Vehicle Destruction Level Understanding:
         - 0→1 (Soft Death): Ship disabled not flyable.
         - 1→2 (Hard Death): Ship completely destroyed.
@@ -91,7 +161,8 @@ class VehicleEventCorrelator:
         IMPORTANT: Only generates kills when actual HUMAN PLAYERS die in vehicles.
         Vehicle entity deaths (like ARGO_ATLS_6282649965732) are filtered out.
         """
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         correlated_events = []
         
         vehicle_match = self.vehicle_destroy_pattern.search(line)
@@ -150,6 +221,10 @@ class VehicleEventCorrelator:
                 if should_buffer:
                     with self._pending_lock:
                         self.pending_vehicle_events.append(vehicle_event)
+                        pending_count = len(self.pending_vehicle_events)
+                    with self._stats_lock:
+                        self.stats.events_buffered += 1
+                        self.stats.peak_pending = max(self.stats.peak_pending, pending_count)
                 else:
                     self.logger.info(f"Processing immediate vehicle destruction: {vehicle_event.vehicle_name} level {vehicle_event.destroy_level}")
                     kill_event = self._create_kill_event_from_vehicle(vehicle_event)
@@ -166,11 +241,16 @@ class VehicleEventCorrelator:
                 
                 if KillParser.is_npc(actor_event.victim, actor_event.victim_id):
                     self.logger.debug(f"Skipping NPC vehicle death: {actor_event.victim}")
+                    with self._stats_lock:
+                        self.stats.npc_skipped += 1
                     return None, correlated_events
                 
                 correlated_vehicle = self._find_correlating_vehicle_event(actor_event)
                 if correlated_vehicle:
                     self.logger.info(f"Correlated actor death with vehicle destruction: {actor_event.victim} in {correlated_vehicle.vehicle_name}")
+                    with self._stats_lock:
+                        self.stats.events_correlated += 1
+                        self.stats.correlation_latency.observe(max(0.0, actor_event.log_time - correlated_vehicle.log_time))
                     kill_event = self._create_correlated_kill_event(correlated_vehicle, actor_event)
                     if kill_event:
                         correlated_events.append(kill_event)
@@ -181,6 +261,8 @@ class VehicleEventCorrelator:
                             self.logger.debug("Pending vehicle event already removed by cleanup thread")
                 else:
                     self.logger.debug(f"No vehicle correlation found for actor death: {actor_event.victim}")
+                    with self._stats_lock:
+                        self.stats.unmatched_deaths += 1
 
         seat_exit_match = self.seat_exit_pattern.search(line)
         if seat_exit_match:
@@ -306,13 +388,21 @@ class VehicleEventCorrelator:
         
         self.logger.debug(f"Looking for correlation for actor death: {actor_event.victim} in zone: {actor_event.zone}")
         
-        for vehicle_event in self.pending_vehicle_events:
+        with self._pending_lock:
+            candidates = list(self.pending_vehicle_events)
+
+        for vehicle_event in candidates:
             score = self._calculate_correlation_score(vehicle_event, actor_event)
             self.logger.debug(f"  Vehicle {vehicle_event.vehicle_name}: score={score:.2f}")
-            if score > best_score and score > 0.3:
+            if score > best_score and score > self.score_threshold:
                 best_score = score
                 best_match = vehicle_event
         
+        if candidates:
+            top_score = max(self._calculate_correlation_score(event, actor_event) for event in candidates)
+            with self._stats_lock:
+                self.stats.match_score.observe(top_score)
+        
         if best_match:
             self.logger.debug(f"  Best match: {best_match.vehicle_name} with score {best_score:.2f}")
         else:
@@ -472,6 +562,8 @@ class VehicleEventCorrelator:
                     timeout = self.correlation_timeout
 
                 if current_time - event.log_time >= timeout:
+                    with self._stats_lock:
+                        self.stats.events_expired += 1
                     display_event = self._create_vehicle_destruction_event(event)
                     if display_event:
                         expired_events.append(display_event)
@@ -524,6 +616,18 @@ class VehicleEventCorrelator:
         """Get count of pending vehicle events waiting for correlation"""
         return len(self.pending_vehicle_events)
 
+    def get_stats(self) -> Dict:
+        """Get a snapshot of the instrumentation counters and histograms"""
+        with self._stats_lock:
+            snapshot = self.stats.to_dict()
+        snapshot['pending'] = self.get_pending_count()
+        return snapshot
+
+    def reset_stats(self) -> None:
+        """Reset instrumentation counters"""
+        with self._stats_lock:
+            self.stats = CorrelatorStats()
+
     def clear_pending_events(self) -> None:
         """Clear all pending vehicle events (useful for testing or reset)"""
         count = len(self.pending_vehicle_events)